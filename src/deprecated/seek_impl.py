@@ -13,8 +13,19 @@ from .workflows.seek.scripts.job_details import (
 	format_job_data,
 	quick_apply_employer_questions,
 )
+from .workflows.seek.quick_apply_utils import snapshot_quick_apply, APPLY_BUTTON_SELECTOR, classify_apply_buttons
+from .workflows.seek.scripts.genericQuestions.form_snapshot import snapshot_forms
+from .workflows.form_cache import FormFillCache, fill_from_cache, form_fingerprint
+from .workflows.form_fill import read_form_values, fills_from_values, apply_fills
+from .workflows.answer_kb import get_answer_kb, normalize_question
+from .workflows.events import Progress, SeekEvent
+from .workflows.rate_governor import pace
+from .workflows.session_cache import discard_session, restore_session, save_session
+from .workflows.description_cache import get_description_cache
+from .workflows.tab_manager import get_tab_manager, stop_tab_manager
+from .workflows.memory_watchdog import between_jobs
+from .workflows.waits import first_attached, wait_until_stable
 # from .scripts.genericQuestions.formsBeautifulshup_fixed import detect_forms_helper_python
-# from .quick_apply_utils import get_available_resume_options
 
 BASE_URL = "https://www.seek.com.au"
 
@@ -61,9 +72,13 @@ async def open_homepage(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	if not context:
 		yield "no_browser_context"
 		return
-	page = await context.new_page()
+	# Cookies must be in the context before the first navigation to count;
+	# detect_page_state still confirms the session on the page before trusting it
+	await restore_session(ctx, "seek")
+	page = await get_tab_manager(ctx).new_page("open_homepage", "search")
 	ctx["page"] = page
 	try:
+		await pace(ctx, "seek", "navigate")
 		await page.goto(ctx.get("seek_url") or f"{BASE_URL}/jobs", wait_until="domcontentloaded")
 		yield "homepage_opened"
 	except Exception as e:
@@ -79,6 +94,7 @@ async def refresh_page(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		yield "no_page_to_refresh"
 		return
 	try:
+		await pace(ctx, "seek", "navigate")
 		await page.reload(wait_until="domcontentloaded")
 		yield "page_refreshed"
 	except Exception as e:
@@ -88,17 +104,15 @@ async def refresh_page(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 
 # Wait For Page Load
 async def wait_for_page_load(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
-	"""Wait for load states, tolerant of networkidle failures."""
+	"""Wait for the load state, then for the page body to stop changing."""
 	page = ctx.get("page")
 	if not page:
 		yield "page_load_retry"
 		return
 	try:
 		await page.wait_for_load_state("load")
-		try:
-			await page.wait_for_load_state("networkidle")
-		except Exception:
-			pass
+		# Seek's ad and tracking requests can keep the network busy long after the results render
+		await wait_until_stable(page, quiet_ms=500, timeout_ms=8000)
 		yield "page_loaded"
 	except Exception:
 		yield "page_load_retry"
@@ -113,25 +127,38 @@ async def detect_page_state(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		yield "no_cards_found"
 		return
 	job_card_selectors = selectors.get("job_cards", []) or []
+	cards_present = False
 	for sel in job_card_selectors:
 		try:
-			els = await page.query_selector_all(sel)
-			if els:
-				yield "cards_present"
-				return
+			if await page.locator(sel).count():
+				cards_present = True
+				break
 		except Exception:
 			pass
-	# check sign-in
-	sign_in_selectors = selectors.get("sign_in_link", []) or []
-	for sel in sign_in_selectors:
+	# Once the page has confirmed the session in this run, later cycles skip the sign-in check
+	if ctx.get("seek_signed_in"):
+		yield "cards_present" if cards_present else "no_cards_found"
+		return
+	sign_in_present = False
+	for sel in selectors.get("sign_in_link", []) or []:
 		try:
-			el = await page.query_selector(sel)
-			if el:
-				yield "sign_in_required"
-				return
+			if await page.locator(sel).count():
+				sign_in_present = True
+				break
 		except Exception:
 			pass
-	yield "no_cards_found"
+	if sign_in_present and ctx.get("seek_session_restored"):
+		print("Restored Seek session is not signed in; discarding it")
+		discard_session(ctx, "seek")
+	if cards_present:
+		if not sign_in_present:
+			await save_session(ctx, "seek")
+			ctx["seek_signed_in"] = True
+		yield "cards_present"
+	elif sign_in_present:
+		yield "sign_in_required"
+	else:
+		yield "no_cards_found"
 
 
 # Show Sign In Banner
@@ -150,7 +177,7 @@ async def show_sign_in_banner(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	except Exception:
 		pass
 	if ui_page is None:
-		ui_page = await context.new_page()
+		ui_page = await get_tab_manager(ctx).new_page("show_sign_in_banner", "dashboard", pinned=True)
 		try:
 			await ui_page.goto("http://127.0.0.1:6666/")
 		except Exception:
@@ -179,48 +206,72 @@ async def show_sign_in_banner(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 
 # Collect Job Cards
 async def collect_job_cards(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
-	"""Find and store job cards, initialize index."""
+	"""Find the job card selector and count the cards, initialize index.
+
+	Cards are kept as (selector, index) and re-resolved with ``locator.nth`` when
+	clicked, so no element handles pile up in the browser across refreshes and
+	a re-rendered list never leaves stale references behind.
+	"""
 	page = ctx.get("page")
 	selectors = ctx.get("selectors") or {}
 	if not page:
 		yield "cards_collect_retry"
 		return
-	cards: list = []
-	for sel in (selectors.get("job_cards", []) or []):
-		try:
-			await page.wait_for_selector(sel, state="attached")
-			found = await page.query_selector_all(sel)
-			if found:
-				cards = found; break
-		except Exception:
-			continue
-	if not cards:
+	# Race all candidates: an obsolete selector first in the list no longer costs its whole timeout
+	found = await first_attached(page, selectors.get("job_cards", []) or [])
+	if found is None:
 		yield "cards_collect_retry"
 		return
-	ctx["job_cards"] = cards
+	card_selector = found[1]
+	try:
+		count = await page.locator(card_selector).count()
+	except Exception:
+		count = 0
+	if not count:
+		yield "cards_collect_retry"
+		return
+	ctx["job_card_selector"] = card_selector
+	ctx["job_card_count"] = count
 	if "job_index" not in ctx:
 		ctx["job_index"] = 0
 	yield "cards_collected"
 
 
+SEEK_JOB_ID_SCRIPT = r"""(card) => {
+	const id = card.getAttribute('data-job-id');
+	if (id) return id;
+	const link = card.querySelector('a[href*="/job/"]');
+	const match = link && link.getAttribute('href').match(/\/job\/(\d+)/);
+	return match ? match[1] : null;
+}"""
+
+
 # Click Job Card
 async def click_job_card(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	"""Click the job card at current index and advance index."""
 	page = ctx.get("page")
-	cards = ctx.get("job_cards") or []
-	if not page or not cards:
+	card_selector = ctx.get("job_card_selector")
+	if not page or not card_selector:
 		yield "job_card_skipped"
 		return
 	index = int(ctx.get("job_index", 0) or 0)
 	try:
-		target = cards[index] if index < len(cards) else None
-		if not target:
+		if index >= int(ctx.get("job_card_count", 0) or 0):
 			yield "job_card_skipped"
 			return
+		# Reopen the search tab at the same URL when its memory has grown too large
+		if await between_jobs(ctx, "page", "seek"):
+			page = ctx["page"]
+		target = page.locator(card_selector).nth(index)
 		try:
 			await target.scroll_into_view_if_needed()
 		except Exception:
 			pass
+		try:
+			ctx["current_job_id"] = await target.evaluate(SEEK_JOB_ID_SCRIPT)
+		except Exception:
+			ctx["current_job_id"] = None
+		await pace(ctx, "seek", "click")
 		await target.click()
 	except Exception:
 		pass
@@ -245,22 +296,11 @@ async def wait_for_details_panel(ctx: Dict[str, Any]) -> AsyncGenerator[str, Non
 	except Exception:
 		yield "details_panel_retry"
 		return
-	check_js = """
-		(sel) => {
-			const container = document.querySelector(sel);
-			return !!(container && container.innerText && container.innerText.trim().length > 50);
-		}
-		"""
-	for attempt in range(5):
-		try:
-			ready = await page.evaluate(check_js, selector)
-			if ready:
-				yield "details_panel_ready"
-				return
-		except Exception:
-			pass
-		await asyncio.sleep(0.1 * (2 ** attempt))
-	yield "details_panel_retry"
+	# Ready once the panel has real content and has stopped re-rendering
+	if await wait_until_stable(page, selector, quiet_ms=250, min_text_length=50, timeout_ms=5000):
+		yield "details_panel_ready"
+	else:
+		yield "details_panel_retry"
 
 
 # Detect Quick Apply
@@ -273,9 +313,10 @@ async def detect_quick_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		yield "apply_missing"
 		return
 
-	# Grab all apply buttons by stable attribute
-	btns = page.locator('[data-automation="job-detail-apply"]')
-	count = await btns.count()
+	# Classify all apply buttons in one roundtrip; click_quick_apply reuses the result
+	buttons = await classify_apply_buttons(page)
+	ctx["apply_buttons"] = dict(buttons, url=page.url, job_id=ctx.get("current_job_id"))
+	count = buttons["count"]
 
 	if count == 0:
 		ctx["quick_apply_flags"] = {"hasQuickApply": False, "hasRegularApply": False}
@@ -283,13 +324,7 @@ async def detect_quick_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		yield "apply_missing"
 		return
 
-	has_quick = False
-	for i in range(count):
-		txt = (await btns.nth(i).inner_text()).lower()
-		txt = re.sub(r"[\u00A0\u2000-\u200D\u202F\u2060]", " ", txt)  # normalize spaces
-		if "quick apply" in txt:
-			has_quick = True
-			break
+	has_quick = buttons["quickIndex"] >= 0
 
 	ctx["quick_apply_flags"] = {
 		"hasQuickApply": has_quick,
@@ -297,7 +332,7 @@ async def detect_quick_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		"quickApplyCount": 1 if has_quick else 0,
 	}
 
-	yield f"qa: quick={has_quick} regular={not has_quick} count={count}"
+	yield Progress("qa: quick={} regular={} count={}", has_quick, not has_quick, count)
 	yield "quick_apply_found" if has_quick else "regular_apply_found"
 
 
@@ -305,7 +340,7 @@ async def generic_forms_lions(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	"""Handle generic forms for Lions."""
 	page = ctx.get("page")
 	if not page:
-		yield "no_page"
+		yield SeekEvent.QUESTIONS_NOT_FOUND
 		return
 	
 	print("Starting Generic questions detection...")
@@ -313,18 +348,27 @@ async def generic_forms_lions(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		script_path = Path(__file__).resolve().parent / "scripts" / "generic_form_detector.js"
 		js_code = script_path.read_text(encoding="utf-8")
 	except Exception as e:
-		yield "Generic_questions_script_error"
+		yield SeekEvent.QUESTIONS_NOT_FOUND
 		return
 	
 	# Implement the logic for handling generic forms
 	print("Questions and answers detected:")
-	yield "generic_forms_handled"
+	yield SeekEvent.QUESTIONS_FOUND
 
 
 # Extract Job Details Raw
 async def extract_job_details_raw(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	"""Extract raw job details using the JS extractor and store in ctx['job_details_raw']."""
 	page = ctx.get("page")
+	job_id = ctx.get("current_job_id")
+	cached = get_description_cache().get("seek", job_id) if job_id else None
+	if cached and cached.get("raw"):
+		ctx["job_details_raw"] = cached["raw"]
+		ctx["job_details_cached"] = cached
+		yield Progress("extracted (cached): job {} · chars={}", job_id, cached["raw"].get("totalChars", 0))
+		yield "details_extracted"
+		return
+	ctx["job_details_cached"] = None
 	if not page:
 		ctx["job_details_raw"] = {"raw_title": "", "details": "", "totalChars": 0, "debug_info": {}}
 		yield "extracted: (no page)"
@@ -352,9 +396,13 @@ async def extract_job_details_raw(ctx: Dict[str, Any]) -> AsyncGenerator[str, No
 			"totalChars": total,
 			"debug_info": (result or {}).get("debug_info") or {},
 		}
+		if job_id and details:
+			description_cache = get_description_cache()
+			description_cache.put("seek", job_id, {"raw": dict(ctx["job_details_raw"], debug_info={})})
+			description_cache.save()
 		preview_title = (raw_title.replace("\n", " ")[:80] + ("…" if len(raw_title) > 80 else "")) if raw_title else "(no title)"
 		preview_len = total
-		yield f"extracted: title={preview_title} · chars={preview_len}"
+		yield Progress("extracted: title={} · chars={}", preview_title, preview_len)
 		yield "details_extracted"
 		return
 	except Exception as e:
@@ -382,7 +430,7 @@ async def extract_job_details_raw(ctx: Dict[str, Any]) -> AsyncGenerator[str, No
 			"debug_info": {"fallback": True, "error": str(e)[:200]},
 		}
 		preview_title = (raw_title.replace("\n", " ")[:80] + ("…" if len(raw_title) > 80 else "")) if raw_title else "(no title)"
-		yield f"extracted: (fallback) title={preview_title} · chars={total}"
+		yield Progress("extracted: (fallback) title={} · chars={}", preview_title, total)
 	yield "details_extracted"
 
 
@@ -390,25 +438,36 @@ async def extract_job_details_raw(ctx: Dict[str, Any]) -> AsyncGenerator[str, No
 async def parse_job_details(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	"""Parse and format the previously extracted raw job details into structured data."""
 	raw = ctx.get("job_details_raw") or {}
-	raw_title = (raw.get("raw_title") or "").strip()
-	raw_details = (raw.get("details") or "").strip()
-
-	# If raw_title is empty, attempt to split from details
-	if not raw_title and raw_details:
-		title_guess, remaining = split_title_and_details(raw_details)
-		raw_title = title_guess.strip()
-		raw_details = remaining.strip() if remaining else raw_details
-
-	# Clean up details content (remove UI buttons, banners etc.)
-	cleaned_details = clean_unwanted_content(raw_details)
-
-	# Parse structured fields from the title blob
-	parsed_job = parse_job_title_with_svg_markers(raw_title)
-
-	# Format into unified job dict, and store/append into context
 	job_index_zero_based = int(ctx.get("job_index", 1)) - 1
-	formatted = format_job_data(parsed_job, cleaned_details, job_index=job_index_zero_based)
-
+	cached = ctx.get("job_details_cached") or {}
+	if cached.get("parsed"):
+		formatted = dict(cached["parsed"], job_index=job_index_zero_based)
+	else:
+		raw_title = (raw.get("raw_title") or "").strip()
+		raw_details = (raw.get("details") or "").strip()
+
+		# If raw_title is empty, attempt to split from details
+		if not raw_title and raw_details:
+			title_guess, remaining = split_title_and_details(raw_details)
+			raw_title = title_guess.strip()
+			raw_details = remaining.strip() if remaining else raw_details
+
+		# Clean up details content (remove UI buttons, banners etc.)
+		cleaned_details = clean_unwanted_content(raw_details)
+
+		# Parse structured fields from the title blob
+		parsed_job = parse_job_title_with_svg_markers(raw_title)
+
+		# Format into unified job dict
+		formatted = format_job_data(parsed_job, cleaned_details, job_index=job_index_zero_based)
+
+		job_id = ctx.get("current_job_id")
+		if job_id and raw_details:
+			description_cache = get_description_cache()
+			description_cache.put("seek", job_id, {"raw": dict(raw, debug_info={}), "parsed": formatted})
+			description_cache.save()
+
+	# Store/append into context
 	ctx["last_job_data"] = formatted
 	jobs_list = ctx.get("jobs_collected")
 	if not isinstance(jobs_list, list):
@@ -432,52 +491,40 @@ async def click_quick_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	ctx["original_job_search_page"] = page
 
 	try:
-		btns = page.locator('[data-automation="job-detail-apply"]')
-		count = await btns.count()
+		# detect_quick_apply already classified this job's buttons; only rescan if the page moved on
+		buttons = ctx.get("apply_buttons")
+		if not buttons or buttons.get("url") != page.url or buttons.get("job_id") != ctx.get("current_job_id"):
+			buttons = await classify_apply_buttons(page)
 		pages_before = len(browser_context.pages)
 
 		# Click the first matching button
-		if flags.get("hasQuickApply"):
-			for i in range(count):
-				txt = (await btns.nth(i).inner_text()).lower()
-				txt = re.sub(r"[\u00A0\u2000-\u200D\u202F\u2060]", " ", txt)
-				if "quick apply" in txt:
-					await btns.nth(i).scroll_into_view_if_needed()
-					await btns.nth(i).click()
-					await asyncio.sleep(0.4)
-					pages_after = len(browser_context.pages)
-					if pages_after > pages_before:
-						new_page = browser_context.pages[-1]
-						ctx["quick_apply_page"] = new_page
-						ctx["page"] = new_page
-						yield "quick_apply_clicked"
-						return
-					else:
-						yield "new_tab_not_opened"
-						return
-			yield "no_quick_apply_button_found"
-			return
-
-		if flags.get("hasRegularApply"):
-			for i in range(count):
-				txt = (await btns.nth(i).inner_text()).lower()
-				txt = re.sub(r"[\u00A0\u2000-\u200D\u202F\u2060]", " ", txt)
-				if "quick apply" not in txt:
-					await btns.nth(i).scroll_into_view_if_needed()
-					await btns.nth(i).click()
-					await asyncio.sleep(0.4)
-					pages_after = len(browser_context.pages)
-					if pages_after > pages_before:
-						new_page = browser_context.pages[-1]
-						ctx["quick_apply_page"] = new_page
-						ctx["page"] = new_page
-						yield "regular_apply_clicked"
-						return
-					else:
-						yield "new_tab_not_opened"
-						return
-			yield "no_regular_apply_button_found"
+		quick = bool(flags.get("hasQuickApply"))
+		if quick:
+			index = buttons["quickIndex"]
+			if index < 0:
+				yield "no_quick_apply_button_found"
+				return
+		elif flags.get("hasRegularApply"):
+			index = buttons["regularIndex"]
+			if index < 0:
+				yield "no_regular_apply_button_found"
+				return
+		else:
+			yield "no_apply_buttons_found"
 			return
+		button = page.locator(APPLY_BUTTON_SELECTOR).nth(index)
+		await button.scroll_into_view_if_needed()
+		await pace(ctx, "seek", "click")
+		await button.click()
+		await asyncio.sleep(0.4)
+		pages_after = len(browser_context.pages)
+		if pages_after > pages_before:
+			new_page = get_tab_manager(ctx).adopt(browser_context.pages[-1], "click_quick_apply", "apply")
+			ctx["quick_apply_page"] = new_page
+			ctx["page"] = new_page
+			yield "quick_apply_clicked" if quick else "regular_apply_clicked"
+		else:
+			yield "new_tab_not_opened"
 	except Exception as e:
 		print(f"Quick/Regular apply click error: {e}")
 		yield "quick_apply_error"
@@ -495,14 +542,13 @@ async def wait_for_quick_apply_page(ctx: Dict[str, Any]) -> AsyncGenerator[str,
 		# Wait for the page to load
 		await page.wait_for_load_state("domcontentloaded")
 		
-		# Wait for Quick Apply form elements to be present
-		try:
-			await page.wait_for_selector('select[data-testid="select-input"], nav[aria-label="Progress bar"]', timeout=10000)
-			yield "quick_apply_page_ready"
-		except Exception:
-			# Fallback: just wait a bit more and proceed
-			await asyncio.sleep(2)
-			yield "quick_apply_page_ready"
+		# Wait for Quick Apply form elements to be present and settled
+		ready = await wait_until_stable(page, present='select[data-testid="select-input"], nav[aria-label="Progress bar"]',
+										quiet_ms=250, timeout_ms=10000)
+		if not ready:
+			# Fallback: proceed once the page at least stops changing
+			await wait_until_stable(page, quiet_ms=300, timeout_ms=3000)
+		yield "quick_apply_page_ready"
 			
 	except Exception as e:
 		print(f"Quick apply page load error: {e}")
@@ -511,38 +557,23 @@ async def wait_for_quick_apply_page(ctx: Dict[str, Any]) -> AsyncGenerator[str,
 
 # Get Available Steps (unused)
 async def get_available_steps(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
-    """Yield all available steps in the progress bar."""
-    page = ctx.get("quick_apply_page")
-    if not page:
-        yield "no_quick_apply_page"
-        return
-    try:
-        progress_script = """
-        () => {
-            const nav = document.querySelector('nav[aria-label="Progress bar"]');
-            if (!nav) return null;
-            const quickApplySteps = Array.from(nav.querySelectorAll('li button')).map((button, index) => {
-                const stepText = button.querySelector('span:nth-child(2) span:nth-child(2) span span')?.textContent?.trim() || '';
-                return {
-                    index: index + 1,
-                    text: stepText
-                };
-            });
-            return quickApplySteps;
-        }
-        """
-        quick_apply_steps = await page.evaluate(progress_script)
-        if not quick_apply_steps:
-            print("Quick Apply progress bar not found")
-            yield "quick_apply_progress_bar_not_found"
-            return
-        ctx["quick_apply_available_steps"] = quick_apply_steps
-        for step in quick_apply_steps:
-            print(f"Step {step['index']}: {step['text']}")
-        yield "quick_apply_steps_listed"
-    except Exception as e:
-        print(f"Error getting Quick Apply available steps: {e}")
-        yield "quick_apply_steps_listing_error"
+	"""Yield all available steps in the progress bar."""
+	page = ctx.get("quick_apply_page")
+	if not page:
+		yield "no_quick_apply_page"
+		return
+	snapshot = await snapshot_quick_apply(page)
+	ctx["quick_apply_snapshot"] = snapshot
+	progress = snapshot.get("progress")
+	if not progress or not progress.get("steps"):
+		print("Quick Apply progress bar not found")
+		yield "quick_apply_progress_bar_not_found"
+		return
+	quick_apply_steps = [{"index": step["index"], "text": step["text"]} for step in progress["steps"]]
+	ctx["quick_apply_available_steps"] = quick_apply_steps
+	for step in quick_apply_steps:
+		print(f"Step {step['index']}: {step['text']}")
+	yield "quick_apply_steps_listed"
 
 
 # Handle Resume Selection
@@ -643,8 +674,10 @@ async def handle_resume_selection(ctx: Dict[str, Any]) -> AsyncGenerator[str, No
 		if resume_method_change:
 			try:
 				print("Clicking resume method change button")
+				await pace(ctx, "seek", "click")
 				await resume_method_change.click()
-				await asyncio.sleep(3)  # Wait longer for UI to update
+				# Wait for the resume select to render
+				await wait_until_stable(page, present=", ".join(resume_selectors), quiet_ms=300, timeout_ms=5000)
 				
 				# Now try to find the resume select again with all selectors
 				for selector in resume_selectors:
@@ -709,8 +742,9 @@ async def handle_cover_letter(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		radio_button = page.locator('input[data-testid="coverLetter-method-change"]')
 		if await radio_button.count() > 0:
 			# Click the radio button to enable cover letter
+			await pace(ctx, "seek", "click")
 			await radio_button.click()
-			await asyncio.sleep(1)
+			await wait_until_stable(page, present='textarea[data-testid="coverLetterTextInput"]', quiet_ms=150, timeout_ms=3000)
 			
 			# Fill the cover letter textarea
 			textarea = page.locator('textarea[data-testid="coverLetterTextInput"]')
@@ -742,19 +776,25 @@ async def click_continue_button(ctx: Dict[str, Any]) -> AsyncGenerator[str, None
 		yield "no_quick_apply_page"
 		return
 	
+	# Remember what was entered on an employer questions form so a repeat of it fills from cache
+	pending_form = ctx.get("employer_questions_form")
+	if pending_form:
+		await remember_employer_form(ctx, page, pending_form)
+	await learn_employer_answers(ctx, page)
+
 	try:
 		# Look for continue button
 		continue_btn = page.locator('button[data-testid="continue-button"]')
 		if await continue_btn.count() > 0:
+			await pace(ctx, "seek", "click")
 			await continue_btn.click()
-			await asyncio.sleep(0.1)
 			yield "continue_clicked"
 		else:
 			# Try alternative selectors
 			alt_continue = page.locator('button:has-text("Continue"), button:has-text("Next")')
 			if await alt_continue.count() > 0:
+				await pace(ctx, "seek", "click")
 				await alt_continue.first.click()
-				await asyncio.sleep(0.1)
 				yield "continue_clicked"
 			else:
 				yield "continue_button_not_found"
@@ -765,42 +805,80 @@ async def click_continue_button(ctx: Dict[str, Any]) -> AsyncGenerator[str, None
 
 
 # Get Current Step
+QUICK_APPLY_STEP_EVENTS = {
+	"Choose documents": "current_step_choose_documents",
+	"Answer employer questions": "current_step_employer_questions",
+	"Update SEEK Profile": "current_step_update_profile",
+	"Review and submit": "current_step_review_submit",
+}
+
+
 async def get_current_step(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	"""Yield the mapped workflow step name for the current progress bar step."""
 	page = ctx.get("quick_apply_page")
 	if not page:
 		yield "no_quick_apply_page"
 		return
+	snapshot = await snapshot_quick_apply(page)
+	ctx["quick_apply_snapshot"] = snapshot
+	quick_apply_current_step_text = snapshot.get("current_step")
+	if not quick_apply_current_step_text:
+		yield "progress_bar_not_found"
+		return
+	ctx["quick_apply_current_step_text"] = quick_apply_current_step_text
+	yield QUICK_APPLY_STEP_EVENTS.get(quick_apply_current_step_text, "current_step_unknown")
+
+
+async def remember_employer_form(ctx: Dict[str, Any], page, form: Dict[str, Any]) -> list:
+	"""Store what is entered on an employer questions form so a repeat of it fills from cache; returns the values read."""
 	try:
-		progress_script = """
-		() => {
-			const nav = document.querySelector('nav[aria-label="Progress bar"]');
-			if (!nav) return "progress_bar_not_found";
-			const quickApplyCurrentStep = nav.querySelector('li button[aria-current="step"]');
-			if (!quickApplyCurrentStep) return "progress_bar_not_found";
-			const stepText = quickApplyCurrentStep.querySelector('span:nth-child(2) span:nth-child(2) span span')?.textContent?.trim() || '';
-			return stepText;
-		}
-		"""
-		quick_apply_current_step_text = await page.evaluate(progress_script)
-		if quick_apply_current_step_text == "progress_bar_not_found":
-			yield "progress_bar_not_found"
-		elif quick_apply_current_step_text:
-			ctx["quick_apply_current_step_text"] = quick_apply_current_step_text
-			if quick_apply_current_step_text == "Choose documents":
-				yield "current_step_choose_documents"
-			elif quick_apply_current_step_text == "Answer employer questions":
-				yield "current_step_employer_questions"
-			elif quick_apply_current_step_text == "Update SEEK Profile":
-				yield "current_step_update_profile"
-			elif quick_apply_current_step_text == "Review and submit":
-				yield "current_step_review_submit"
-			else:
-				yield "current_step_unknown"
-		else:
-			yield "progress_bar_not_found"
+		values = await read_form_values(page, form_index=form.get("form_index", 0)) or []
+		cache = ctx.get("form_fill_cache") or FormFillCache()
+		ctx["form_fill_cache"] = cache
+		if cache.remember(form, fills_from_values(values), source=page.url):
+			cache.save()
+		return values
 	except Exception as e:
-		yield "progress_bar_evaluation_error"
+		print(f"Could not remember employer question answers: {e}")
+		return []
+
+
+async def learn_employer_answers(ctx: Dict[str, Any], page) -> None:
+	"""Teach the answer knowledge base what the user entered on the pending employer questions form.
+
+	Only fields whose value changed since handle_answer_employer_questions read
+	the form, and that it did not fill itself, count as entered by the user.
+	"""
+	pending_form = ctx.pop("employer_questions_form", None)
+	auto_answers = ctx.pop("seek_auto_answers", {})
+	baseline = ctx.pop("employer_questions_baseline", None)
+	if not pending_form or page is None or baseline is None:
+		return
+	try:
+		values = await read_form_values(page, form_index=pending_form.get("form_index", 0))
+		manual = []
+		for entry in values or []:
+			if baseline.get(entry.get("index")) == entry.get("value"):
+				continue
+			question = normalize_question(entry.get("question") or entry.get("label"))
+			value = entry.get("text") or entry.get("value")
+			# Skip what handle_answer_employer_questions filled in itself
+			if question in auto_answers and normalize_question(value) == normalize_question(auto_answers[question]):
+				continue
+			manual.append(entry)
+		answer_kb = get_answer_kb()
+		if answer_kb.learn_from_form_values(manual, source="seek"):
+			answer_kb.save()
+	except Exception as e:
+		print(f"Could not learn employer question answers: {e}")
+
+
+def fill_for_field(field: Dict[str, Any], fields: list) -> Dict[str, Any]:
+	"""Fill spec skeleton for one read_form_values entry; radio groups are addressed by name and carry their option labels."""
+	if field["type"] == "radio" and field.get("name"):
+		group = [f for f in fields if f["type"] == "radio" and f.get("name") == field["name"]]
+		return {"name": field["name"], "type": "radio", "options": [f.get("label") or f.get("value") for f in group]}
+	return {"id": field["id"], "type": field["type"]}
 
 
 # Handle Employer Questions Answer 
@@ -808,27 +886,48 @@ async def handle_answer_employer_questions(ctx: Dict[str, Any]) -> AsyncGenerato
 	"""Handle the 'Answer employer questions' step with detection and parsing."""
 	page = ctx.get("quick_apply_page")
 	if not page:
-		yield "no_quick_apply_page"
+		yield SeekEvent.NO_QUICK_APPLY_PAGE
 		return
 
+	# A structurally identical form seen before is filled from cache without re-detection
+	cache = ctx.get("form_fill_cache") or FormFillCache()
+	ctx["form_fill_cache"] = cache
+	try:
+		forms = [f for f in await snapshot_forms(page) if form_fingerprint(f)]
+	except Exception as e:
+		print(f"Form snapshot failed: {e}")
+		forms = []
+	for candidate in forms:
+		try:
+			results = await fill_from_cache(page, candidate, cache)
+		except Exception as e:
+			print(f"Cached fill failed: {e}")
+			results = None
+		if results is not None:
+			print(f"Filled {len(results)} field(s) from form cache (form {candidate.get('form_index')})")
+			yield SeekEvent.EMPLOYER_QUESTIONS_HANDLED
+			return
 	print("Starting employer questions detection...")
 	try:
-		script_path = Path(__file__).resolve().parent / "scripts" / "quick_apply_questions.js"
+		script_path = Path(__file__).resolve().parent / "workflows" / "seek" / "scripts" / "quick_apply_questions.js"
 		js_code = script_path.read_text(encoding="utf-8")
 	except Exception as e:
 		print(f"Error reading quick_apply_questions.js: {e}")
-		yield "employer_questions_script_error"
+		yield SeekEvent.EMPLOYER_QUESTIONS_ERROR
 		return
 
 	try:
-		# Get the form element using selector 'form'
-		form = await page.query_selector('form')
-		if not form:
+		# Run the JS on every form in one evaluate; the questions are on the first form that has any
+		per_form = await page.evaluate("() => Array.from(document.querySelectorAll('form'), (form) => {" + js_code + "})")
+		if not per_form:
 			print("Form element not found on page.")
-			yield "form_not_found"
+			yield SeekEvent.NO_EMPLOYER_QUESTIONS_FOUND
 			return
-		# Pass the form element to JS
-		result = await page.evaluate("(form) => {" + js_code + "}", form)
+		form_index = next((i for i, r in enumerate(per_form) if isinstance(r, dict) and r.get('results')), 0)
+		result = per_form[form_index]
+		pending_form = next((f for f in forms if f.get("form_index") == form_index), None)
+		if pending_form:
+			ctx["employer_questions_form"] = pending_form
 		if result and isinstance(result, dict):
 			# print("Employer questions JS returned a result.")
 			# print(result)
@@ -843,17 +942,44 @@ async def handle_answer_employer_questions(ctx: Dict[str, Any]) -> AsyncGenerato
 			# Print the actual results
 			if 'results' in result:
 				print(f"Found {len(result['results'])} question(s)")
+				answer_kb = get_answer_kb()
+				auto_answers = ctx.setdefault("seek_auto_answers", {})
+				# selectFound only says an element has the label's id; the field read says what it is
+				values = await read_form_values(page, form_index=form_index) or []
+				# What the form held before any fill; learn_employer_answers only learns changes from it
+				ctx["employer_questions_baseline"] = {entry.get("index"): entry.get("value") for entry in values}
+				fields_by_id = {entry["id"]: entry for entry in values if entry.get("id")}
+				fills = []
 				for i, qa in enumerate(result['results']):
 					print(f"Question {i+1}: {qa.get('question', 'N/A')}")
 					print(f"Answers: {qa.get('answers', [])}")
-				yield "employer_questions_handled"
-				return
+					field = fields_by_id.get(qa.get('forAttribute'))
+					if field is None:
+						continue
+					fill = fill_for_field(field, values)
+					options = fill.pop("options", None) or qa.get('answers') or None
+					known = answer_kb.resolve(qa.get('question', ''), options)
+					if known:
+						print(f"Known answer: {known['option'] or known['answer']} ({known['score']:.2f})")
+						auto_answers[normalize_question(qa['question'])] = known['option'] or known['answer']
+						fill["value"] = known['option'] or known['answer']
+						fills.append(fill)
+				if fills:
+					fill_results = await apply_fills(page, fills, form_index=form_index)
+					print(f"Filled {sum(1 for r in fill_results if r.get('ok'))}/{len(fills)} question(s) from the answer knowledge base")
+					# A form answered in full is cached now; the flow leaves this page without clicking continue
+					if pending_form and len(fills) == len(result['results']) and all(r.get('ok') for r in fill_results):
+						await remember_employer_form(ctx, page, pending_form)
+				yield SeekEvent.EMPLOYER_QUESTIONS_HANDLED
+			else:
+				print("Employer questions JS returned no results.")
+				yield SeekEvent.NO_EMPLOYER_QUESTIONS_FOUND
 		else:
 			print("No employer questions detected or invalid result.")
-			yield "employer_questions_none"
+			yield SeekEvent.NO_EMPLOYER_QUESTIONS_FOUND
 	except Exception as e:
 		print(f"Error evaluating employer questions JS: {e}")
-		yield "employer_questions_eval_error"
+		yield SeekEvent.EMPLOYER_QUESTIONS_ERROR
 			
 
 # Handle Update Seek Profile
@@ -897,7 +1023,7 @@ async def handle_update_seek_profile(ctx: Dict[str, Any]) -> AsyncGenerator[str,
 			pass
 		
 		if ui_page is None:
-			ui_page = await context.new_page()
+			ui_page = await get_tab_manager(ctx).new_page("handle_update_seek_profile", "dashboard", pinned=True)
 			try:
 				await ui_page.goto("http://127.0.0.1:6666/")
 			except Exception:
@@ -944,8 +1070,9 @@ async def back_button_quickapply(ctx: Dict[str, Any]) -> AsyncGenerator[str, Non
 		# Look for back button
 		back_btn = page.locator('button[data-testid="back-button"]')
 		if await back_btn.count() > 0:
+			await pace(ctx, "seek", "click")
 			await back_btn.click()
-			await asyncio.sleep(2)
+			await wait_until_stable(page, quiet_ms=300, timeout_ms=5000)
 			print("Back button clicked successfully")
 			yield "back_button_clicked"
 		else:
@@ -966,26 +1093,23 @@ async def submit_application(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		return
 	
 	try:
-		from .workflows.seek.quick_apply_utils import is_application_complete, log_quick_apply_progress
+		from .workflows.seek.quick_apply_utils import APPLICATION_COMPLETE_PREDICATE, is_application_complete, log_quick_apply_progress
 		
 		await log_quick_apply_progress(page, "SUBMIT")
 		
 		# Look for submit/apply button
 		submit_btn = page.locator('button[data-testid="submit-button"], button:has-text("Submit"), button:has-text("Apply")')
 		if await submit_btn.count() > 0:
+			await pace(ctx, "seek", "apply")
 			await submit_btn.first.click()
-			await asyncio.sleep(3)
+			# Resolves as soon as the confirmation renders instead of after a fixed 3-5s
+			await wait_until_stable(page, quiet_ms=0, predicate=APPLICATION_COMPLETE_PREDICATE, timeout_ms=5000)
 			
 			# Check if application was successfully submitted
 			if await is_application_complete(page):
 				yield "application_submitted"
 			else:
-				# Wait a bit more and check again
-				await asyncio.sleep(2)
-				if await is_application_complete(page):
-					yield "application_submitted"
-				else:
-					yield "application_submitted"  # Proceed anyway
+				yield "application_submitted"  # Proceed anyway
 		else:
 			yield "submit_button_not_found"
 			
@@ -1004,9 +1128,17 @@ async def close_quick_apply_and_continue_search(ctx: Dict[str, Any]) -> AsyncGen
 		yield "no_original_page"
 		return
 	
+	# Nothing on the apply tab was submitted by the user; drop the pending form unlearned
+	for key in ("employer_questions_form", "employer_questions_baseline", "seek_auto_answers"):
+		ctx.pop(key, None)
+
 	try:
-		# Close whichever Apply tab is open
-		if apply_page:
+		# Close whichever Apply tab is open, and any further tabs the application opened
+		tabs = get_tab_manager(ctx)
+		if tabs is not None:
+			await tabs.close(apply_page)
+			await tabs.close_owned_by("click_quick_apply", keep=(original_page,))
+		elif apply_page:
 			await apply_page.close()
 		
 		# Switch back to the original job search page
@@ -1031,6 +1163,7 @@ async def finish_run(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	"""Finish the run by closing browser context and cleaning up resources."""
 	# print("=== FINAL CTX DUMP ===")
 	# print(ctx)
+	await stop_tab_manager(ctx)
 	yield "run_finished"
 
 
@@ -0,0 +1,294 @@
+"""Persistent question -> answer knowledge base shared by the LinkedIn and Seek flows.
+
+Questions are indexed by character trigrams in an inverted index with TF-IDF
+weights. ``resolve`` gathers candidates from the postings of the query's
+selective trigrams only (common ones such as " do" or "you" match most
+questions and carry little weight), then computes the exact cosine similarity
+for the best few, so a lookup stays under a millisecond for a few thousand
+stored questions.
+
+When the caller passes the options offered by the form (select options, radio
+labels), the stored answer is mapped onto one of them; candidates whose answer
+fits none of the options are skipped.
+
+Answers are learned from the profile (``seed_profile``), from values the user
+entered by hand (``learn_from_form_values``) and from explicit ``learn`` calls.
+"""
+from __future__ import annotations
+import heapq
+import json
+import math
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Holds profile answers (names, email, phone): runtime data, kept out of version control
+DEFAULT_KB_PATH = Path(__file__).resolve().parent / "user_data" / "answer_kb.json"
+# Where earlier versions kept it, inside the source package; moved on first save
+LEGACY_KB_PATH = Path(__file__).resolve().parent / "answer_kb.json"
+DEFAULT_MIN_SCORE = 0.7
+OPTION_MIN_SCORE = 0.5
+# Trigrams found in more than this share of questions are not used to gather candidates
+SELECTIVE_DF_RATIO = 0.1
+MIN_SELECTIVE_DF = 32
+# Option texts that mean "nothing chosen yet"
+PLACEHOLDER_PATTERN = re.compile(
+    r"^\W*(?:(?:please\s+)?(?:select|choose)(?:\s+(?:an?|one|your))?(?:\s+(?:option|answer|one|value|response))?|none selected)?\W*$",
+    re.IGNORECASE)
+
+# Profile fields and the question phrasings they answer
+PROFILE_QUESTIONS = {
+    "first_name": ["First name", "Given name"],
+    "last_name": ["Last name", "Surname", "Family name"],
+    "full_name": ["Full name", "Name"],
+    "phone_number": ["Phone number", "Mobile phone number", "Mobile number", "Contact number"],
+    "email": ["Email", "Email address"],
+    "years_of_experience": ["How many years of experience do you have", "Years of experience"],
+}
+
+
+def normalize_question(text: Any) -> str:
+    text = re.sub(r"['\u2019]", "", str(text or "").lower())
+    text = re.sub(r"[^a-z0-9]+", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def trigrams(text: str) -> Counter:
+    """Character trigrams of already-normalized text, padded at the ends."""
+    padded = f" {text} "
+    return Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    dot = sum(count * b[gram] for gram, count in a.items() if gram in b)
+    if not dot:
+        return 0.0
+    return dot / math.sqrt(sum(v * v for v in a.values()) * sum(v * v for v in b.values()))
+
+
+def match_option(answer: Any, options: List[str]) -> Optional[str]:
+    """Map a stored answer onto one of the offered options, or None."""
+    wanted = normalize_question(answer)
+    if not wanted:
+        return None
+    normalized = [normalize_question(option) for option in options]
+    for option, norm in zip(options, normalized):
+        if norm == wanted:
+            return option
+    # "Yes" should pick "Yes, I have a full licence" rather than a fuzzy neighbour
+    for option, norm in zip(options, normalized):
+        if norm.startswith(wanted + " "):
+            return option
+    wanted_grams = trigrams(wanted)
+    best, best_score = None, OPTION_MIN_SCORE
+    for option, norm in zip(options, normalized):
+        score = _cosine(wanted_grams, trigrams(norm))
+        if score > best_score:
+            best, best_score = option, score
+    return best
+
+
+class AnswerKnowledgeBase:
+    """Trigram TF-IDF index over remembered question/answer pairs."""
+
+    def __init__(self, path: Optional[str] = None, min_score: float = DEFAULT_MIN_SCORE):
+        self.path = Path(path) if path else DEFAULT_KB_PATH
+        self.min_score = min_score
+        self.entries: List[Dict[str, Any]] = []
+        self._by_question: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._norms: Optional[List[float]] = None
+        self._idfs: Dict[str, float] = {}
+        self._vectors: List[Dict[str, float]] = []
+        self._dirty = False
+        self._legacy_path: Optional[Path] = None
+        source = self.path
+        if self.path == DEFAULT_KB_PATH and not self.path.exists() and LEGACY_KB_PATH.exists():
+            source = self._legacy_path = LEGACY_KB_PATH
+            self._dirty = True
+        try:
+            with open(source, "r", encoding="utf-8") as f:
+                for entry in json.load(f).get("entries", []):
+                    self._add(entry)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Could not load answer knowledge base {source}: {e}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _idf(self, gram: str) -> float:
+        idf = self._idfs.get(gram)
+        if idf is None:
+            df = len(self._postings.get(gram, ()))
+            idf = math.log((len(self.entries) + 1) / (df + 1)) + 1.0
+        return idf
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        key = normalize_question(entry.get("question"))
+        if not key:
+            return
+        doc_id = len(self.entries)
+        self.entries.append(entry)
+        self._by_question[key] = doc_id
+        for gram, count in trigrams(key).items():
+            self._postings.setdefault(gram, {})[doc_id] = count
+        # IDF shifts with every new document, so weights are recomputed on the next lookup
+        self._norms = None
+        self._idfs = {}
+
+    def _doc_norms(self) -> List[float]:
+        if self._norms is None:
+            total = len(self.entries) + 1
+            self._idfs = {gram: math.log(total / (len(postings) + 1)) + 1.0 for gram, postings in self._postings.items()}
+            self._vectors = [{} for _ in self.entries]
+            for gram, postings in self._postings.items():
+                idf = self._idfs[gram]
+                for doc_id, count in postings.items():
+                    self._vectors[doc_id][gram] = count * idf
+            self._norms = [math.sqrt(sum(w * w for w in vector.values())) for vector in self._vectors]
+        return self._norms
+
+    def learn(self, question: str, answer: Any, source: str = "manual") -> None:
+        """Remember ``answer`` for ``question``, replacing any earlier answer."""
+        key = normalize_question(question)
+        if not key or answer is None or answer == "":
+            return
+        doc_id = self._by_question.get(key)
+        if doc_id is not None:
+            entry = self.entries[doc_id]
+            if entry.get("answer") == answer and entry.get("source") == source:
+                return
+            entry.update({"answer": answer, "source": source, "updated_at": time.time()})
+        else:
+            self._add({"question": question.strip(), "answer": answer, "source": source, "uses": 0, "updated_at": time.time()})
+        self._dirty = True
+
+    def candidates(self, question: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` stored entries ranked by similarity to ``question``."""
+        key = normalize_question(question)
+        if not key or not self.entries:
+            return []
+        exact = self._by_question.get(key)
+        if exact is not None:
+            return [dict(self.entries[exact], score=1.0)]
+
+        norms = self._doc_norms()
+        query = {gram: count * self._idf(gram) for gram, count in trigrams(key).items()}
+        query_norm = math.sqrt(sum(w * w for w in query.values()))
+
+        # Gather candidates from selective trigrams; fall back to the rarest one
+        max_df = max(MIN_SELECTIVE_DF, int(len(self.entries) * SELECTIVE_DF_RATIO))
+        known = sorted((len(self._postings[g]), g) for g in query if g in self._postings)
+        if not known:
+            return []
+        selective = [g for df, g in known if df <= max_df] or [known[0][1]]
+        partial: Dict[int, float] = {}
+        for gram in selective:
+            weight = query[gram]
+            for doc_id in self._postings[gram]:
+                partial[doc_id] = partial.get(doc_id, 0.0) + weight * self._vectors[doc_id][gram]
+
+        # Exact cosine over the full query only for the best partial matches
+        ranked = []
+        for doc_id in heapq.nlargest(max(limit * 4, 20), partial, key=partial.get):
+            vector = self._vectors[doc_id]
+            dot = sum(weight * vector[gram] for gram, weight in query.items() if gram in vector)
+            if norms[doc_id]:
+                ranked.append((dot / (query_norm * norms[doc_id]), doc_id))
+        ranked = heapq.nlargest(limit, ranked)
+        return [dict(self.entries[doc_id], score=score) for score, doc_id in ranked]
+
+    def resolve(self, question: str, options: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Best stored answer for ``question`` (and the matching option, if any were given).
+
+        Returns ``{"question", "answer", "option", "score", "source"}`` or None.
+        """
+        options = [o for o in (options or []) if normalize_question(o)]
+        for candidate in self.candidates(question):
+            if candidate["score"] < self.min_score:
+                break
+            option = match_option(candidate["answer"], options) if options else None
+            if options and option is None:
+                continue
+            entry = self.entries[self._by_question[normalize_question(candidate["question"])]]
+            entry["uses"] = entry.get("uses", 0) + 1
+            self._dirty = True
+            return {
+                "question": candidate["question"],
+                "answer": candidate["answer"],
+                "option": option,
+                "score": candidate["score"],
+                "source": candidate.get("source", ""),
+            }
+        return None
+
+    def seed_profile(self, profile: Dict[str, str]) -> None:
+        """Index the profile fields under their usual question phrasings."""
+        for field, questions in PROFILE_QUESTIONS.items():
+            value = (profile.get(field) or "").strip()
+            if not value:
+                continue
+            for question in questions:
+                key = normalize_question(question)
+                doc_id = self._by_question.get(key)
+                # Never overwrite something the user answered by hand
+                if doc_id is not None and self.entries[doc_id].get("source") not in ("profile", None):
+                    continue
+                self.learn(question, value, source="profile")
+
+    def learn_from_form_values(self, values: List[Dict[str, Any]], source: str = "manual") -> int:
+        """Learn from form_fill.read_form_values() output; returns the number of answers learned.
+
+        Unanswered fields are skipped: an empty value, or a select still on its
+        placeholder option ("Select an option"), is never learned, so it cannot
+        replace an answer given earlier.
+        """
+        learned = 0
+        for entry in values or []:
+            question = entry.get("question") or entry.get("label")
+            value = entry.get("value")
+            if value is None or value == "":
+                continue
+            if entry.get("type") == "checkbox":
+                # Checkbox labels are the statement itself; only a tick is an answer
+                answer = "Yes" if value is True else None
+            else:
+                answer = entry.get("text") or value
+            if isinstance(answer, str) and PLACEHOLDER_PATTERN.search(answer):
+                continue
+            if question and answer:
+                self.learn(question, answer, source=source)
+                learned += 1
+        return learned
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": self.entries}, f, ensure_ascii=False, indent=1)
+            tmp_path.replace(self.path)
+            self._dirty = False
+            if self._legacy_path is not None:
+                self._legacy_path.unlink(missing_ok=True)
+                self._legacy_path = None
+        except Exception as e:
+            print(f"Could not save answer knowledge base {self.path}: {e}")
+
+
+_SHARED_KBS: Dict[str, AnswerKnowledgeBase] = {}
+
+
+def get_answer_kb(path: Optional[str] = None) -> AnswerKnowledgeBase:
+    """Shared knowledge base for ``path`` (both platforms use the default file)."""
+    key = str(Path(path) if path else DEFAULT_KB_PATH)
+    kb = _SHARED_KBS.get(key)
+    if kb is None:
+        kb = _SHARED_KBS[key] = AnswerKnowledgeBase(key)
+    return kb
@@ -0,0 +1,185 @@
+"""Opt-in count and latency profile of browser roundtrips per step.
+
+``profile_roundtrips(ctx, workflow)`` swaps the Playwright objects in ``ctx``
+(pages, the browser context) for thin proxies. Every awaited method called
+through a proxy is one roundtrip to the browser: ``count``, ``inner_text``,
+``evaluate``, ``click``, ``wait_for_*``, ``goto``, and so on. Each call is
+timed and attributed to the step running it and the source line that made
+it. Objects those calls return (locators, element handles, new pages) are
+proxied too, so the whole object graph a step touches is covered. Arguments
+are unwrapped before they reach Playwright.
+
+    profiler = profile_roundtrips(ctx, compiled)
+    await run_workflow(compiled, ctx)
+    profiler.print_report()
+
+``step_compiler.run_workflow`` does this itself when ``ctx["profile_roundtrips"]``
+is set (``replay_server bench --profile``).
+
+Attribution walks the Python stack at call time; this costs microseconds
+against the milliseconds of a roundtrip and only happens when profiling is on.
+"""
+from __future__ import annotations
+import inspect
+import os
+import sys
+import time
+import weakref
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Playwright classes whose instances get proxied
+PROXIED_TYPES = {"Page", "Frame", "Locator", "FrameLocator", "ElementHandle", "JSHandle", "BrowserContext", "Mouse", "Keyboard"}
+_THIS_FILE = os.path.abspath(__file__)
+
+
+def _is_playwright(obj: Any) -> bool:
+    cls = type(obj)
+    return cls.__name__ in PROXIED_TYPES and cls.__module__.startswith("playwright")
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, _Proxy):
+        return object.__getattribute__(value, "_target")
+    if isinstance(value, list):
+        return [_unwrap(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_unwrap(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _unwrap(v) for k, v in value.items()}
+    return value
+
+
+class _Proxy:
+    __slots__ = ("_target", "_profiler", "__weakref__")
+
+    def __init__(self, target: Any, profiler: "RoundtripProfiler"):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_profiler", profiler)
+
+    def __getattr__(self, name: str) -> Any:
+        target = object.__getattribute__(self, "_target")
+        profiler = object.__getattribute__(self, "_profiler")
+        value = getattr(target, name)
+        if inspect.iscoroutinefunction(value):
+            kind = type(target).__name__
+
+            async def timed(*args: Any, **kwargs: Any) -> Any:
+                site = profiler._call_site()
+                started = time.perf_counter()
+                try:
+                    result = await value(*_unwrap(args), **_unwrap(kwargs))
+                finally:
+                    profiler._record(site, f"{kind}.{name}", time.perf_counter() - started)
+                return profiler.wrap(result)
+            return timed
+        if callable(value):
+            def plain(*args: Any, **kwargs: Any) -> Any:
+                return profiler.wrap(value(*_unwrap(args), **_unwrap(kwargs)))
+            return plain
+        return profiler.wrap(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(object.__getattribute__(self, "_target"), name, value)
+
+    def __eq__(self, other: Any) -> bool:
+        return object.__getattribute__(self, "_target") == _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(object.__getattribute__(self, "_target"))
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return f"<profiled {object.__getattribute__(self, '_target')!r}>"
+
+
+class RoundtripProfiler:
+    """Counts and times proxied Playwright calls by (step, call site, method)."""
+
+    def __init__(self, step_functions: Optional[Set[str]] = None):
+        self.step_functions = set(step_functions or ())
+        # (step, "file:line function", method) -> [calls, total seconds, max seconds]
+        self.stats: Dict[Tuple[str, str, str], List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        # id(target) -> proxy; a proxy keeps its target alive, so ids are not reused while it exists
+        self._proxies: "weakref.WeakValueDictionary[int, _Proxy]" = weakref.WeakValueDictionary()
+        self.started = time.perf_counter()
+
+    def wrap(self, value: Any) -> Any:
+        """Proxy a Playwright object (or a list of them); anything else is returned as is."""
+        if isinstance(value, list):
+            return [self.wrap(v) for v in value]
+        if isinstance(value, _Proxy) or not _is_playwright(value):
+            return value
+        # One proxy per object, so identity checks such as `p not in pages_before` still hold
+        proxy = self._proxies.get(id(value))
+        if proxy is None:
+            proxy = self._proxies[id(value)] = _Proxy(value, self)
+        return proxy
+
+    def _call_site(self) -> Tuple[str, str]:
+        frame = sys._getframe(2)
+        while frame is not None and os.path.abspath(frame.f_code.co_filename) == _THIS_FILE:
+            frame = frame.f_back
+        if frame is None:
+            return "(unknown)", "(unknown)"
+        site = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+        step = "(outside steps)"
+        while frame is not None:
+            if frame.f_code.co_name in self.step_functions:
+                step = frame.f_code.co_name
+                break
+            frame = frame.f_back
+        return step, site
+
+    def _record(self, site: Tuple[str, str], method: str, seconds: float) -> None:
+        entry = self.stats[(site[0], site[1], method)]
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+
+    def by_step(self) -> Dict[str, List[float]]:
+        steps: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        for (step, _, _), (calls, total, longest) in self.stats.items():
+            entry = steps[step]
+            entry[0] += calls
+            entry[1] += total
+            entry[2] = max(entry[2], longest)
+        return steps
+
+    def report(self, top_sites: int = 15) -> str:
+        lines = [f"{'step':<36} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        steps = self.by_step()
+        for step, (calls, total, longest) in sorted(steps.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{step[:36]:<36} {calls:>7} {total * 1000:>10.1f} {total * 1000 / calls:>9.2f} {longest * 1000:>9.1f}")
+        total_calls = sum(entry[0] for entry in steps.values())
+        total_seconds = sum(entry[1] for entry in steps.values())
+        lines.append(f"{'total':<36} {total_calls:>7} {total_seconds * 1000:>10.1f}"
+                     f"   ({time.perf_counter() - self.started:.1f}s wall)")
+        lines.append("")
+        lines.append(f"{'slowest call sites':<60} {'method':<28} {'calls':>6} {'total ms':>10}")
+        for (step, site, method), (calls, total, _) in sorted(self.stats.items(), key=lambda item: -item[1][1])[:top_sites]:
+            lines.append(f"{site[:60]:<60} {method[:28]:<28} {calls:>6} {total * 1000:>10.1f}")
+        return "\n".join(lines)
+
+    def print_report(self, top_sites: int = 15) -> None:
+        print(self.report(top_sites))
+
+
+def profile_roundtrips(ctx: Dict[str, Any], workflow=None) -> RoundtripProfiler:
+    """Proxy every Playwright object in ``ctx`` and return the profiler collecting their calls.
+
+    ``workflow`` (a step_compiler.CompiledWorkflow) names the step functions
+    that calls are attributed to.
+    """
+    names = set()
+    if workflow is not None:
+        names = {getattr(func, "__name__", func) for func in workflow.funcs if func is not None}
+    profiler = RoundtripProfiler(names)
+    for key, value in list(ctx.items()):
+        if _is_playwright(value):
+            ctx[key] = profiler.wrap(value)
+    ctx["roundtrip_profiler"] = profiler
+    return profiler
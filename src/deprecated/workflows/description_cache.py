@@ -0,0 +1,198 @@
+"""Compressed on-disk cache of job descriptions and parsed fields.
+
+Records are keyed by (platform, job_id) and hold whatever the steps extracted:
+the description text, the about-company blurb, and parsed fields such as
+the experience required. Each record is serialised, compressed (zstd when
+``zstandard`` is installed, zlib otherwise) and written as a blob named by
+the hash of its content, so reposted jobs with identical text share a blob.
+
+``index.json`` maps keys to blobs with their size and last access. Entries
+older than ``ttl`` are dropped on lookup. When the blobs exceed
+``max_bytes`` or the index exceeds ``max_entries``, the least recently used
+entries are evicted first. A blob is deleted only once no entry refers to it.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:  # optional; zlib is the fallback
+    zstandard = None
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / "description_cache"
+DEFAULT_TTL = 14 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 20000
+ZSTD_LEVEL = 10
+
+
+def _compress(payload: bytes) -> tuple:
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return "zlib", zlib.compress(payload, 6)
+
+
+def _decompress(codec: str, blob: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("blob is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return zlib.decompress(blob)
+
+
+class DescriptionCache:
+    """Content-addressed LRU cache of job records with TTL and a size bound."""
+
+    def __init__(self, directory: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        try:
+            with open(self.directory / "index.json", "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Could not load description cache index: {e}")
+
+    @staticmethod
+    def key(platform: str, job_id: Any) -> str:
+        return f"{platform}:{job_id}"
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        return self.directory / digest[:2] / f"{digest}.{codec}"
+
+    def get(self, platform: str, job_id: Any) -> Optional[Dict[str, Any]]:
+        """The cached record, or None when missing, expired or unreadable."""
+        if not job_id:
+            return None
+        key = self.key(platform, job_id)
+        entry = self.index.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        now = time.time()
+        if now - entry["stored_at"] > self.ttl:
+            self._drop(key)
+            self.misses += 1
+            return None
+        try:
+            blob = self._blob_path(entry["digest"], entry["codec"]).read_bytes()
+            record = json.loads(_decompress(entry["codec"], blob))
+        except Exception as e:
+            print(f"Description cache entry {key} unreadable ({e}); dropping")
+            self._drop(key)
+            self.misses += 1
+            return None
+        entry["accessed_at"] = now
+        self._dirty = True
+        self.hits += 1
+        return record
+
+    def put(self, platform: str, job_id: Any, record: Dict[str, Any]) -> None:
+        if not job_id or not record:
+            return
+        payload = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        codec, blob = _compress(payload)
+        path = self._blob_path(digest, codec)
+        try:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(path.suffix + ".tmp")
+                tmp_path.write_bytes(blob)
+                tmp_path.replace(path)
+        except Exception as e:
+            print(f"Could not write description cache blob: {e}")
+            return
+        key = self.key(platform, job_id)
+        previous = self.index.get(key)
+        now = time.time()
+        self.index[key] = {"digest": digest, "codec": codec, "size": len(blob), "stored_at": now, "accessed_at": now}
+        if previous and previous["digest"] != digest:
+            self._release(previous)
+        self._dirty = True
+        self._evict()
+
+    def update(self, platform: str, job_id: Any, **fields: Any) -> None:
+        """Merge ``fields`` into the record for the job, creating it if needed."""
+        record = self.get(platform, job_id) or {}
+        record.update({k: v for k, v in fields.items() if v is not None})
+        self.put(platform, job_id, record)
+
+    def _drop(self, key: str) -> None:
+        entry = self.index.pop(key, None)
+        if entry is not None:
+            self._release(entry)
+            self._dirty = True
+
+    def _release(self, entry: Dict[str, Any]) -> None:
+        # Other jobs may share the blob
+        if any(e["digest"] == entry["digest"] for e in self.index.values()):
+            return
+        try:
+            self._blob_path(entry["digest"], entry["codec"]).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        refs = Counter(e["digest"] for e in self.index.values())
+        total = sum({e["digest"]: e["size"] for e in self.index.values()}.values())
+        if total <= self.max_bytes and len(self.index) <= self.max_entries:
+            return
+        for key in sorted(self.index, key=lambda k: self.index[k]["accessed_at"]):
+            if total <= self.max_bytes and len(self.index) <= self.max_entries:
+                break
+            entry = self.index.pop(key)
+            refs[entry["digest"]] -= 1
+            if not refs[entry["digest"]]:
+                total -= entry["size"]
+                try:
+                    self._blob_path(entry["digest"], entry["codec"]).unlink()
+                except FileNotFoundError:
+                    pass
+        self._dirty = True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self.index),
+            "bytes": sum({e["digest"]: e["size"] for e in self.index.values()}.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / "index.json"
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.index, f)
+            tmp_path.replace(path)
+            self._dirty = False
+        except Exception as e:
+            print(f"Could not save description cache index: {e}")
+
+
+_SHARED_CACHE: Optional[DescriptionCache] = None
+
+
+def get_description_cache() -> DescriptionCache:
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        _SHARED_CACHE = DescriptionCache()
+    return _SHARED_CACHE
@@ -0,0 +1,209 @@
+"""Registry of the events step functions yield and STEPS_CONFIG routes.
+
+Each platform has one enum listing every transition event its STEPS_CONFIG
+handles. Members are ``str`` subclasses, so ``yield LinkedInEvent.JOB_SAVED``
+matches the ``"job saved"`` transition key and older string yields keep
+working. ``validate_steps.py`` checks configs and yields against these enums.
+"""
+from __future__ import annotations
+from enum import Enum
+
+
+class WorkflowEvent(str, Enum):
+    """Base for event enums; formats as the plain event string."""
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class LinkedInEvent(WorkflowEvent):
+    APPLIED_JOB_IDS_LOADED = "applied job IDs loaded"
+    RETRY = "retry"
+    LOGIN_NOT_NEEDED = "login not needed"
+    USER_NEEDS_TO_LOG_IN = "user needs to log in"
+    CANNOT_DETERMINE_LOGIN_STATUS = "cannot determine login status"
+    NO_AVAILABLE_PAGE = "no available page"
+    FAILED_TO_NAVIGATE = "failed to navigate"
+    FAILED_CHECKING_LOGIN_STATUS = "failed checking login status"
+    LOGIN_SUCCESSFUL_ON_FEED = "login successful, on feed"
+    ON_FEED_LOGIN_SUCCESSFUL = "on feed, login successful"
+    NO_LOGIN_CREDENTIALS_FOUND = "no login credentials found"
+    CREDENTIALS_LOGIN_INCOMPLETE = "credentials login incomplete"
+    USERNAME_INPUT_NOT_FOUND = "username input not found"
+    PASSWORD_INPUT_NOT_FOUND = "password input not found"
+    SIGNIN_BUTTON_CLICK_FAILED = "signin button click failed"
+    WAIT_FOR_REDIRECT_TIMEOUT = "wait for redirect timeout"
+    CREDENTIAL_LOGIN_FAILED = "credential login failed"
+    PROMPT_DISPLAYED_TO_USER = "prompt displayed to user"
+    ERROR_SHOWING_MANUAL_LOGIN = "error showing manual login"
+    JOBS_PAGE_LOADED = "jobs page loaded"
+    FAILED_OPENING_JOBS_PAGE = "failed opening jobs page"
+    SEARCH_LOCATION_SET = "search location set"
+    NO_SEARCH_LOCATION_IN_SETTINGS = "no search location in settings"
+    LOCATION_INPUT_NOT_FOUND = "location input not found"
+    FAILED_SETTING_SEARCH_LOCATION = "failed setting search location"
+    JOBS_PAGE_MISSING = "jobs page missing"
+    SEARCH_KEYWORDS_SET = "search keywords set"
+    NO_KEYWORDS_IN_SETTINGS = "no keywords in settings"
+    KEYWORDS_INPUT_NOT_FOUND = "keywords input not found"
+    FAILED_SETTING_SEARCH_KEYWORDS = "failed setting search keywords"
+    FILTERS_APPLIED_SUCCESSFULLY = "filters applied successfully"
+    FILTERS_APPLICATION_FAILED = "filters application failed"
+    PAGE_INFO_EXTRACTED = "page info extracted"
+    PAGINATION_NOT_FOUND = "pagination not found"
+    FAILED_EXTRACTING_PAGE_INFO = "failed extracting page info"
+    PROCEED_TO_PROCESS_JOBS = "proceed to process jobs"
+    NO_JOBS_PAGE_FOUND = "no jobs page found"
+    NO_JOB_CARDS_FOUND = "no job cards found"
+    FAILED_EXTRACTING_JOBS = "failed extracting jobs"
+    STARTING_TO_PROCESS_JOBS = "starting to process jobs"
+    NO_JOBS_TO_PROCESS = "no jobs to process"
+    ERROR_PROCESSING_JOBS = "error processing jobs"
+    JOB_DESCRIPTION_EXTRACTED = "job description extracted"
+    COULD_NOT_FIND_DESCRIPTION = "could not find description"
+    PROCEEDING_TO_RESUME_UPLOAD = "proceeding to resume upload"
+    ATTEMPTING_EXTERNAL_APPLY = "attempting external apply"
+    NO_JOB_TO_PROCESS = "no job to process"
+    JOB_CARD_NOT_FOUND = "job card not found"
+    JOB_BLACKLISTED = "job blacklisted"
+    NO_EASY_APPLY_BUTTON_FOUND = "no easy apply button found"
+    FAILED_TO_CLICK_EASY_APPLY = "failed to click easy apply"
+    EASY_APPLY_PROCESS_ERROR = "easy apply process error"
+    RESUME_UPLOADED_SUCCESSFULLY = "resume uploaded successfully"
+    NO_RESUME_PATH_CONFIGURED = "no resume path configured"
+    RESUME_FILE_NOT_FOUND = "resume file not found"
+    PROCEEDING_WITHOUT_RESUME = "proceeding without resume"
+    FINISHED_ANSWERING_QUESTIONS = "finished answering questions"
+    ERROR_ANSWERING_QUESTIONS = "error answering questions"
+    PROCEEDING_TO_SAVE_JOB = "proceeding to save job"
+    APPLICATION_FAILED_TO_SUBMIT = "application failed to submit"
+    SUBMIT_APPLICATION_ERROR = "submit application error"
+    JOB_SAVED = "job saved"
+    NO_JOB_TO_SAVE = "no job to save"
+    SAVING_JOB_FAILED = "saving job failed"
+    EXTERNAL_APPLY_CLICKED = "external apply clicked"
+    EXTERNAL_APPLY_FAILED = "external apply failed"
+    NO_APPLY_BUTTON_FOUND = "no apply button found"
+    EXTERNAL_APPLY_PROCESS_ERROR = "external apply process error"
+    EXTERNAL_JOB_SAVED = "external job saved"
+    NO_EXTERNAL_JOB = "no external job"
+    SAVING_EXTERNAL_JOB_FAILED = "saving external job failed"
+    APPLICATION_MARKED_FAILED = "application marked failed"
+    NO_JOB_TO_MARK = "no job to mark"
+    FAILED_TO_MARK_APPLICATION_FAILED = "failed to mark application failed"
+    ALL_JOBS_PROCESSED = "all jobs processed"
+    NAVIGATING_TO_NEXT_PAGE = "navigating to next page"
+    CONTINUE_PROCESSING_ERROR = "continue processing error"
+    FINISHING_WORKFLOW = "finishing workflow"
+    PAGE_NAVIGATED = "page navigated"
+    NO_MORE_PAGES = "no more pages"
+    NAVIGATION_ERROR = "navigation error"
+    WORKFLOW_FINISHED = "workflow finished"
+
+
+class SeekEvent(WorkflowEvent):
+    CTX_READY = "ctx_ready"
+    HOMEPAGE_OPENED = "homepage_opened"
+    NO_BROWSER_CONTEXT = "no_browser_context"
+    PAGE_NAVIGATION_FAILED = "page_navigation_failed"
+    PAGE_REFRESHED = "page_refreshed"
+    NO_PAGE_TO_REFRESH = "no_page_to_refresh"
+    PAGE_RELOAD_FAILED = "page_reload_failed"
+    PAGE_LOADED = "page_loaded"
+    PAGE_LOAD_RETRY = "page_load_retry"
+    CARDS_PRESENT = "cards_present"
+    SIGN_IN_REQUIRED = "sign_in_required"
+    NO_CARDS_FOUND = "no_cards_found"
+    SIGNIN_BANNER_SHOWN = "signin_banner_shown"
+    SIGNIN_BANNER_RETRY = "signin_banner_retry"
+    CARDS_COLLECTED = "cards_collected"
+    CARDS_COLLECT_RETRY = "cards_collect_retry"
+    JOB_CARD_CLICKED = "job_card_clicked"
+    JOB_CARD_SKIPPED = "job_card_skipped"
+    DETAILS_PANEL_READY = "details_panel_ready"
+    DETAILS_PANEL_RETRY = "details_panel_retry"
+    QUICK_APPLY_FOUND = "quick_apply_found"
+    REGULAR_APPLY_FOUND = "regular_apply_found"
+    APPLY_MISSING = "apply_missing"
+    QUESTIONS_FOUND = "questions_found"
+    QUESTIONS_NOT_FOUND = "questions_not_found"
+    QUICK_APPLY_CLICKED = "quick_apply_clicked"
+    REGULAR_APPLY_CLICKED = "regular_apply_clicked"
+    MISSING_PAGE_OR_CONTEXT = "missing_page_or_context"
+    NO_APPLY_BUTTONS_FOUND = "no_apply_buttons_found"
+    NEW_TAB_NOT_OPENED = "new_tab_not_opened"
+    BUTTON_CLICK_FAILED = "button_click_failed"
+    NO_QUICK_APPLY_BUTTON_FOUND = "no_quick_apply_button_found"
+    NO_REGULAR_APPLY_BUTTON_FOUND = "no_regular_apply_button_found"
+    QUICK_APPLY_ERROR = "quick_apply_error"
+    QUICK_APPLY_PAGE_READY = "quick_apply_page_ready"
+    NO_QUICK_APPLY_PAGE = "no_quick_apply_page"
+    PAGE_LOAD_TIMEOUT = "page_load_timeout"
+    RESUME_SELECTED = "resume_selected"
+    RESUME_NOT_REQUIRED = "resume_not_required"
+    NO_RESUME_OPTIONS_AVAILABLE = "no_resume_options_available"
+    RESUME_OPTIONS_ERROR = "resume_options_error"
+    RESUME_METHOD_CHANGE_FAILED = "resume_method_change_failed"
+    NO_RESUME_AVAILABLE = "no_resume_available"
+    RESUME_SELECTION_ERROR = "resume_selection_error"
+    COVER_LETTER_FILLED = "cover_letter_filled"
+    COVER_LETTER_NOT_REQUIRED = "cover_letter_not_required"
+    COVER_LETTER_TEXTAREA_NOT_FOUND = "cover_letter_textarea_not_found"
+    COVER_LETTER_ERROR = "cover_letter_error"
+    CONTINUE_CLICKED = "continue_clicked"
+    CONTINUE_BUTTON_NOT_FOUND = "continue_button_not_found"
+    CONTINUE_BUTTON_ERROR = "continue_button_error"
+    DETAILS_EXTRACTED = "details_extracted"
+    PARSED = "parsed"
+    CURRENT_STEP_CHOOSE_DOCUMENTS = "current_step_choose_documents"
+    CURRENT_STEP_UPDATE_PROFILE = "current_step_update_profile"
+    CURRENT_STEP_EMPLOYER_QUESTIONS = "current_step_employer_questions"
+    CURRENT_STEP_REVIEW_SUBMIT = "current_step_review_submit"
+    CURRENT_STEP_UNKNOWN = "current_step_unknown"
+    PROGRESS_BAR_NOT_FOUND = "progress_bar_not_found"
+    PROGRESS_BAR_EVALUATION_ERROR = "progress_bar_evaluation_error"
+    BACK_BUTTON_CLICKED = "back_button_clicked"
+    BACK_BUTTON_NOT_FOUND = "back_button_not_found"
+    BACK_BUTTON_ERROR = "back_button_error"
+    UPDATE_PROFILE_BANNER_SHOWN = "update_profile_banner_shown"
+    UPDATE_PROFILE_ERROR = "update_profile_error"
+    EMPLOYER_QUESTIONS_HANDLED = "employer_questions_handled"
+    NO_EMPLOYER_QUESTIONS_FOUND = "no_employer_questions_found"
+    EMPLOYER_QUESTIONS_ERROR = "employer_questions_error"
+    APPLICATION_SUBMITTED = "application_submitted"
+    SUBMIT_BUTTON_NOT_FOUND = "submit_button_not_found"
+    SUBMIT_APPLICATION_ERROR = "submit_application_error"
+    NO_ORIGINAL_PAGE = "no_original_page"
+    HUNTING_NEXT_JOB = "hunting_next_job"
+    CLOSE_AND_CONTINUE_ERROR = "close_and_continue_error"
+    RUN_FINISHED = "run_finished"
+    FINISH_ERROR = "finish_error"
+
+
+class IndeedEvent(WorkflowEvent):
+    CTX_READY = "ctx_ready"
+    SEARCH_READY = "search_ready"
+    NO_BROWSER_CONTEXT = "no_browser_context"
+    PIPELINE_FINISHED = "pipeline_finished"
+    PIPELINE_FAILED = "pipeline_failed"
+    RUN_FINISHED = "run_finished"
+
+
+class Progress:
+    """A status update yielded in the middle of a step.
+
+    Progress is never routed. The template is only formatted when something
+    displays it, so a dispatcher that just skips progress pays nothing for it.
+    """
+
+    __slots__ = ("template", "args")
+
+    def __init__(self, template: str, *args: object):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.template.format(*self.args)
+
+    def __repr__(self) -> str:
+        return f"Progress({str(self)!r})"
@@ -0,0 +1,754 @@
+"""In-process fake of the Playwright async Page / Locator / ElementHandle API.
+
+The fake is backed by an HTML fixture (a replay_server DOM fixture, or any
+HTML string) parsed with BeautifulSoup, so step functions run unmodified
+against it in milliseconds, with no browser. Every awaited call counts as
+one roundtrip in ``page.calls`` and sleeps for a configurable simulated
+latency, which makes the fake usable both for unit tests of step logic and
+for microbenchmarks of the Python side of a step:
+
+    page = FakePage(html, url="https://www.seek.com.au/job/1", latency={"default": 0.002, "evaluate": 0.004})
+    ctx = {"page": page, "selectors": selectors}
+    events = [e async for e in detect_quick_apply(ctx)]
+    assert page.calls["Locator.inner_text"] == 1
+
+Selectors are CSS (soupsieve) plus the Playwright extensions the steps use:
+``>>`` chaining, ``text=...``, ``:has-text("...")``, ``:text("...")`` and
+``:visible``. Text matching is a case-insensitive substring match, like
+Playwright's.
+
+JavaScript cannot run here. ``page.evaluate`` / ``wait_for_function`` look the
+script up among handlers registered with ``register_script(match, fn)``,
+where ``match`` is any substring of the script and ``fn(target, arg)``
+receives the FakePage or FakeElementHandle it was called on. An unregistered
+script raises ``FakeScriptError`` naming it.
+
+Interactions mutate the parsed DOM: ``fill`` sets ``value``, ``check`` sets
+``checked``, ``select_option`` marks the option selected. ``on_click(selector,
+fn)`` lets a test model what a click does (open a modal, load a new page).
+"""
+from __future__ import annotations
+import asyncio
+import re
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:  # optional; the fake does not need Playwright installed
+    class PlaywrightTimeoutError(Exception):
+        pass
+
+try:
+    import lxml  # noqa: F401
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "figcaption", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "label", "legend", "li", "main", "nav",
+    "ol", "p", "pre", "section", "table", "tbody", "td", "th", "thead", "tr", "ul", "option",
+}
+_TEXT_PSEUDO = re.compile(r""":(?:has-text|text|text-is)\((["'])(.*?)\1\)""")
+_VISIBLE_PSEUDO = re.compile(r":visible\b")
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.IGNORECASE)
+
+
+class FakeScriptError(NotImplementedError):
+    """page.evaluate was given a script with no registered Python emulation."""
+
+
+# Text helpers
+
+def inner_text(node: Tag) -> str:
+    """Approximates HTMLElement.innerText: block elements and <br> break lines, whitespace collapses."""
+    lines: List[str] = []
+    current: List[str] = []
+
+    def walk(el) -> None:
+        for child in el.children:
+            if isinstance(child, NavigableString):
+                if type(child) is NavigableString:
+                    current.append(str(child))
+                continue
+            if child.name in ("script", "style", "template", "head") or not _visible(child, own_only=True):
+                continue
+            if child.name == "br":
+                flush()
+                continue
+            block = child.name in BLOCK_TAGS
+            if block:
+                flush()
+            walk(child)
+            if block:
+                flush()
+
+    def flush() -> None:
+        text = re.sub(r"\s+", " ", "".join(current)).strip()
+        if text:
+            lines.append(text)
+        current.clear()
+
+    walk(node)
+    flush()
+    return "\n".join(lines)
+
+
+def text_content(node: Tag) -> str:
+    return "".join(str(s) for s in node.find_all(string=True) if type(s) is NavigableString)
+
+
+def _visible(node: Tag, own_only: bool = False) -> bool:
+    for el in [node] if own_only else [node, *node.parents]:
+        if not isinstance(el, Tag) or el.name == "[document]":
+            continue
+        if el.has_attr("hidden") or _HIDDEN_STYLE.search(el.get("style", "")):
+            return False
+        if el.name == "input" and el.get("type", "").lower() == "hidden":
+            return False
+    return True
+
+
+# Selector engine
+
+def _split_top_level(selector: str, separator: str) -> List[str]:
+    parts, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(selector):
+        ch = selector[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif depth == 0 and selector.startswith(separator, i):
+            parts.append(selector[start:i].strip())
+            start = i = i + len(separator)
+            continue
+        i += 1
+    parts.append(selector[start:].strip())
+    return parts
+
+
+def _select_part(roots: List[Tag], part: str) -> List[Tag]:
+    if part.startswith("text="):
+        needle = part[5:].strip().strip("\"'").lower()
+        found = []
+        for root in roots:
+            candidates = [el for el in root.find_all(True) if needle in text_content(el).lower()]
+            # The deepest elements holding the text, not every ancestor
+            found.extend(el for el in candidates if not any(needle in text_content(c).lower() for c in el.find_all(True)))
+        return _unique(found)
+    if part.startswith(("xpath=", "//")):
+        raise NotImplementedError(f"fake browser does not support XPath selectors: {part}")
+    part = part[4:] if part.startswith("css=") else part
+    found = []
+    for alternative in _split_top_level(part, ","):
+        needles = [m.group(2).lower() for m in _TEXT_PSEUDO.finditer(alternative)]
+        visible_only = bool(_VISIBLE_PSEUDO.search(alternative))
+        css = _VISIBLE_PSEUDO.sub("", _TEXT_PSEUDO.sub("", alternative)).strip() or "*"
+        for root in roots:
+            for el in root.select(css):
+                if needles and not all(n in inner_text(el).lower() for n in needles):
+                    continue
+                if visible_only and not _visible(el):
+                    continue
+                found.append(el)
+    return _in_document_order(_unique(found), roots)
+
+
+def _unique(nodes: Iterable[Tag]) -> List[Tag]:
+    seen, result = set(), []
+    for node in nodes:
+        if id(node) not in seen:
+            seen.add(id(node))
+            result.append(node)
+    return result
+
+
+def _in_document_order(nodes: List[Tag], roots: List[Tag]) -> List[Tag]:
+    if len(nodes) < 2:
+        return nodes
+    wanted = {id(n) for n in nodes}
+    ordered = []
+    for root in roots:
+        for el in root.find_all(True):
+            if id(el) in wanted:
+                ordered.append(el)
+                wanted.discard(id(el))
+    return ordered
+
+
+def select(roots: List[Tag], selector: str) -> List[Tag]:
+    nodes = roots
+    for part in _split_top_level(selector, ">>"):
+        nodes = _select_part(nodes, part)
+    return nodes
+
+
+# Fake API
+
+class FakeKeyboard:
+    def __init__(self, page: "FakePage"):
+        self._page = page
+
+    async def press(self, key: str, **kwargs: Any) -> None:
+        await self._page._roundtrip("Keyboard.press")
+        self._page.actions.append(("press", None, key))
+
+    async def type(self, text: str, **kwargs: Any) -> None:
+        await self._page._roundtrip("Keyboard.type")
+        self._page.actions.append(("type", None, text))
+
+
+class FakeElementHandle:
+    """An ElementHandle bound to one parsed node."""
+
+    def __init__(self, page: "FakePage", node: Tag):
+        self._page = page
+        self.node = node
+        self.disposed = False
+        self._generation = page._generation
+        page.handles_created += 1
+
+    def _check(self) -> None:
+        if self.disposed:
+            raise RuntimeError("Element handle is disposed")
+        if self.node.decomposed or self._page._generation != self._generation:
+            raise RuntimeError("Element is not attached to the DOM")
+
+    async def query_selector(self, selector: str) -> Optional["FakeElementHandle"]:
+        await self._page._roundtrip("ElementHandle.query_selector")
+        self._check()
+        found = select([self.node], selector)
+        return self._page._handle(found[0]) if found else None
+
+    async def query_selector_all(self, selector: str) -> List["FakeElementHandle"]:
+        await self._page._roundtrip("ElementHandle.query_selector_all")
+        self._check()
+        return [self._page._handle(n) for n in select([self.node], selector)]
+
+    async def inner_text(self, **kwargs: Any) -> str:
+        await self._page._roundtrip("ElementHandle.inner_text")
+        self._check()
+        return inner_text(self.node)
+
+    async def text_content(self, **kwargs: Any) -> str:
+        await self._page._roundtrip("ElementHandle.text_content")
+        self._check()
+        return text_content(self.node)
+
+    async def inner_html(self, **kwargs: Any) -> str:
+        await self._page._roundtrip("ElementHandle.inner_html")
+        self._check()
+        return self.node.decode_contents()
+
+    async def get_attribute(self, name: str, **kwargs: Any) -> Optional[str]:
+        await self._page._roundtrip("ElementHandle.get_attribute")
+        self._check()
+        return _attribute(self.node, name)
+
+    async def is_visible(self) -> bool:
+        await self._page._roundtrip("ElementHandle.is_visible")
+        return _visible(self.node)
+
+    async def click(self, **kwargs: Any) -> None:
+        await self._page._roundtrip("ElementHandle.click")
+        self._check()
+        await self._page._click(self.node)
+
+    async def scroll_into_view_if_needed(self, **kwargs: Any) -> None:
+        await self._page._roundtrip("ElementHandle.scroll_into_view_if_needed")
+
+    async def evaluate(self, script: str, arg: Any = None) -> Any:
+        await self._page._roundtrip("ElementHandle.evaluate")
+        self._check()
+        return self._page._run_script(script, self, arg)
+
+    async def dispose(self) -> None:
+        await self._page._roundtrip("ElementHandle.dispose")
+        if not self.disposed:
+            self.disposed = True
+            self._page.handles_disposed += 1
+
+
+class FakeLocator:
+    """A lazy selector chain, re-resolved against the current DOM on every call."""
+
+    def __init__(self, page: "FakePage", steps: Tuple[Tuple[str, Any], ...]):
+        self._page = page
+        self._steps = steps
+
+    def _resolve(self) -> List[Tag]:
+        nodes: List[Tag] = [self._page.soup]
+        for kind, value in self._steps:
+            if kind == "css":
+                nodes = select(nodes, value)
+            elif kind == "nth":
+                nodes = nodes[value:value + 1] if value >= 0 else nodes[value:][:1]
+            elif kind == "has_text":
+                nodes = [n for n in nodes if _text_matches(inner_text(n), value)]
+            elif kind == "has_not_text":
+                nodes = [n for n in nodes if not _text_matches(inner_text(n), value)]
+            elif kind == "has":
+                nodes = [n for n in nodes if select([n], value)]
+        return nodes
+
+    def _one(self, method: str) -> Tag:
+        nodes = self._resolve()
+        if not nodes:
+            raise PlaywrightTimeoutError(f"Locator.{method}: no element matches {self}")
+        if len(nodes) > 1:
+            raise RuntimeError(f"strict mode violation: {self} resolved to {len(nodes)} elements")
+        return nodes[0]
+
+    def __repr__(self) -> str:
+        return "locator(" + " >> ".join(f"{k}={v!r}" for k, v in self._steps) + ")"
+
+    def locator(self, selector: str, **kwargs: Any) -> "FakeLocator":
+        return FakeLocator(self._page, self._steps + (("css", selector),)).filter(**kwargs)
+
+    def nth(self, index: int) -> "FakeLocator":
+        return FakeLocator(self._page, self._steps + (("nth", index),))
+
+    @property
+    def first(self) -> "FakeLocator":
+        return self.nth(0)
+
+    @property
+    def last(self) -> "FakeLocator":
+        return self.nth(-1)
+
+    def filter(self, has_text: Any = None, has_not_text: Any = None, has: Optional["FakeLocator"] = None, **kwargs: Any) -> "FakeLocator":
+        steps = self._steps
+        if has_text is not None:
+            steps += (("has_text", has_text),)
+        if has_not_text is not None:
+            steps += (("has_not_text", has_not_text),)
+        if has is not None:
+            steps += (("has", " >> ".join(v for k, v in has._steps if k == "css")),)
+        return FakeLocator(self._page, steps)
+
+    async def count(self) -> int:
+        await self._page._roundtrip("Locator.count")
+        return len(self._resolve())
+
+    async def all(self) -> List["FakeLocator"]:
+        await self._page._roundtrip("Locator.all")
+        return [self.nth(i) for i in range(len(self._resolve()))]
+
+    async def inner_text(self, **kwargs: Any) -> str:
+        await self._page._roundtrip("Locator.inner_text")
+        return inner_text(self._one("inner_text"))
+
+    async def text_content(self, **kwargs: Any) -> str:
+        await self._page._roundtrip("Locator.text_content")
+        return text_content(self._one("text_content"))
+
+    async def inner_html(self, **kwargs: Any) -> str:
+        await self._page._roundtrip("Locator.inner_html")
+        return self._one("inner_html").decode_contents()
+
+    async def all_inner_texts(self) -> List[str]:
+        await self._page._roundtrip("Locator.all_inner_texts")
+        return [inner_text(n) for n in self._resolve()]
+
+    async def all_text_contents(self) -> List[str]:
+        await self._page._roundtrip("Locator.all_text_contents")
+        return [text_content(n) for n in self._resolve()]
+
+    async def get_attribute(self, name: str, **kwargs: Any) -> Optional[str]:
+        await self._page._roundtrip("Locator.get_attribute")
+        return _attribute(self._one("get_attribute"), name)
+
+    async def input_value(self, **kwargs: Any) -> str:
+        await self._page._roundtrip("Locator.input_value")
+        return _attribute(self._one("input_value"), "value") or ""
+
+    async def is_visible(self, **kwargs: Any) -> bool:
+        await self._page._roundtrip("Locator.is_visible")
+        nodes = self._resolve()
+        return bool(nodes) and _visible(nodes[0])
+
+    async def is_enabled(self, **kwargs: Any) -> bool:
+        await self._page._roundtrip("Locator.is_enabled")
+        return not self._one("is_enabled").has_attr("disabled")
+
+    async def is_checked(self, **kwargs: Any) -> bool:
+        await self._page._roundtrip("Locator.is_checked")
+        return self._one("is_checked").has_attr("checked")
+
+    async def wait_for(self, state: str = "visible", timeout: Optional[float] = None) -> None:
+        await self._page._roundtrip("Locator.wait_for")
+        nodes = self._resolve()
+        present = bool(nodes) and (state != "visible" or _visible(nodes[0]))
+        if (state in ("attached", "visible")) != present:
+            raise PlaywrightTimeoutError(f"Locator.wait_for: {self} never reached state '{state}'")
+
+    async def click(self, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.click")
+        await self._page._click(self._one("click"))
+
+    async def fill(self, value: str, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.fill")
+        node = self._one("fill")
+        if node.name == "textarea":
+            node.string = value
+        else:
+            node["value"] = value
+        self._page.actions.append(("fill", node, value))
+
+    async def type(self, text: str, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.type")
+        node = self._one("type")
+        node["value"] = (node.get("value") or "") + text
+        self._page.actions.append(("type", node, text))
+
+    async def press(self, key: str, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.press")
+        self._page.actions.append(("press", self._one("press"), key))
+
+    async def check(self, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.check")
+        node = self._one("check")
+        if node.get("type", "").lower() == "radio" and node.get("name"):
+            for other in self._page.soup.select(f'input[type="radio"][name="{node["name"]}"]'):
+                other.attrs.pop("checked", None)
+        node["checked"] = ""
+        self._page.actions.append(("check", node, True))
+
+    async def uncheck(self, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.uncheck")
+        node = self._one("uncheck")
+        node.attrs.pop("checked", None)
+        self._page.actions.append(("check", node, False))
+
+    async def select_option(self, value: Any = None, label: Any = None, index: Any = None, **kwargs: Any) -> List[str]:
+        await self._page._roundtrip("Locator.select_option")
+        node = self._one("select_option")
+        options = node.find_all("option")
+        chosen = None
+        for i, option in enumerate(options):
+            option_value = option.get("value", option.get_text(strip=True))
+            if (value is not None and option_value == value) or (label is not None and option.get_text(strip=True) == label) \
+                    or (index is not None and i == index):
+                chosen = option
+        if chosen is None:
+            raise PlaywrightTimeoutError(f"Locator.select_option: no option matches value={value!r} label={label!r} index={index!r}")
+        for option in options:
+            option.attrs.pop("selected", None)
+        chosen["selected"] = ""
+        selected = chosen.get("value", chosen.get_text(strip=True))
+        self._page.actions.append(("select", node, selected))
+        return [selected]
+
+    async def set_input_files(self, files: Any, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.set_input_files")
+        self._page.actions.append(("files", self._one("set_input_files"), files))
+
+    async def scroll_into_view_if_needed(self, **kwargs: Any) -> None:
+        await self._page._roundtrip("Locator.scroll_into_view_if_needed")
+
+    async def evaluate(self, script: str, arg: Any = None, **kwargs: Any) -> Any:
+        await self._page._roundtrip("Locator.evaluate")
+        # The browser releases a locator's element after the call; only handles the caller holds stay open
+        handle = self._page._handle(self._one("evaluate"))
+        try:
+            return self._page._run_script(script, handle, arg)
+        finally:
+            handle.disposed = True
+            self._page.handles_disposed += 1
+
+    async def element_handle(self, **kwargs: Any) -> FakeElementHandle:
+        await self._page._roundtrip("Locator.element_handle")
+        return self._page._handle(self._one("element_handle"))
+
+    async def element_handles(self) -> List[FakeElementHandle]:
+        await self._page._roundtrip("Locator.element_handles")
+        return [self._page._handle(n) for n in self._resolve()]
+
+
+ScriptHandler = Callable[[Any, Any], Any]
+ClickHandler = Callable[["FakePage", Tag], Any]
+
+
+class FakePage:
+    """A Page over a parsed HTML fixture; counts and delays every awaited call."""
+
+    def __init__(self, html: str = "", url: str = "about:blank", latency: Union[float, Dict[str, float]] = 0.0,
+                 routes: Optional[Dict[str, str]] = None, context: Optional["FakeContext"] = None):
+        self.url = url
+        self.latency = latency if isinstance(latency, dict) else {"default": float(latency)}
+        self.routes = dict(routes or {})
+        self.context = context
+        self.calls: Counter = Counter()
+        # Like a real page, handles stay alive in the browser until disposed, whatever Python does with them
+        self.handles_created = 0
+        self.handles_disposed = 0
+        self.actions: List[Tuple[str, Optional[Tag], Any]] = []
+        self.keyboard = FakeKeyboard(self)
+        self._scripts: List[Tuple[str, ScriptHandler]] = []
+        self._click_handlers: List[Tuple[str, ClickHandler]] = []
+        self._listeners: Dict[str, List[Callable]] = {}
+        self._closed = False
+        self._generation = 0
+        self._html = html
+        self.soup = BeautifulSoup(html, _PARSER)
+
+    # Test hooks
+
+    def register_script(self, match: str, fn: ScriptHandler) -> "FakePage":
+        """Emulate scripts containing ``match``: ``fn(target, arg)`` is called in their place."""
+        self._scripts.append((match, fn))
+        return self
+
+    def on_click(self, selector: str, fn: ClickHandler) -> "FakePage":
+        """Run ``fn(page, node)`` when an element matching ``selector`` is clicked."""
+        self._click_handlers.append((selector, fn))
+        return self
+
+    def set_content_sync(self, html: str, url: Optional[str] = None) -> None:
+        """Replace the DOM (as a navigation would); outstanding element handles go stale."""
+        self._html = html
+        self.soup = BeautifulSoup(html, _PARSER)
+        self._generation += 1
+        if url is not None:
+            self.url = url
+
+    @property
+    def roundtrips(self) -> int:
+        return sum(self.calls.values())
+
+    @property
+    def open_handles(self) -> int:
+        return self.handles_created - self.handles_disposed
+
+    # Internals
+
+    async def _roundtrip(self, name: str) -> None:
+        if self._closed:
+            raise RuntimeError(f"{name}: Target page, context or browser has been closed")
+        self.calls[name] += 1
+        delay = self.latency.get(name.split(".", 1)[1], self.latency.get(name, self.latency.get("default", 0.0)))
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _handle(self, node: Tag) -> FakeElementHandle:
+        return FakeElementHandle(self, node)
+
+    def _run_script(self, script: str, target: Any, arg: Any) -> Any:
+        for match, fn in self._scripts:
+            if match in script:
+                return fn(target, arg)
+        first_line = next((line.strip() for line in script.strip().splitlines() if line.strip()), "")
+        raise FakeScriptError(f"no emulation registered for script starting {first_line[:80]!r}")
+
+    async def _click(self, node: Tag) -> None:
+        self.actions.append(("click", node, None))
+        for selector, fn in self._click_handlers:
+            if any(match is node for match in select([self.soup], selector)):
+                result = fn(self, node)
+                if asyncio.iscoroutine(result):
+                    await result
+                return
+
+    # Page API
+
+    def locator(self, selector: str, **kwargs: Any) -> FakeLocator:
+        return FakeLocator(self, (("css", selector),)).filter(**kwargs)
+
+    def get_by_text(self, text: str, exact: bool = False) -> FakeLocator:
+        return FakeLocator(self, (("css", f"text={text}"),))
+
+    async def query_selector(self, selector: str) -> Optional[FakeElementHandle]:
+        await self._roundtrip("Page.query_selector")
+        found = select([self.soup], selector)
+        return self._handle(found[0]) if found else None
+
+    async def query_selector_all(self, selector: str) -> List[FakeElementHandle]:
+        await self._roundtrip("Page.query_selector_all")
+        return [self._handle(n) for n in select([self.soup], selector)]
+
+    async def wait_for_selector(self, selector: str, state: str = "visible", timeout: Optional[float] = None, **kwargs: Any):
+        await self._roundtrip("Page.wait_for_selector")
+        found = select([self.soup], selector)
+        if state in ("detached", "hidden"):
+            if found and (state == "detached" or _visible(found[0])):
+                raise PlaywrightTimeoutError(f"Page.wait_for_selector: '{selector}' never became {state}")
+            return None
+        if not found or (state == "visible" and not _visible(found[0])):
+            raise PlaywrightTimeoutError(f"Page.wait_for_selector: '{selector}' never became {state}")
+        return self._handle(found[0])
+
+    async def wait_for_load_state(self, state: str = "load", **kwargs: Any) -> None:
+        await self._roundtrip("Page.wait_for_load_state")
+
+    async def wait_for_timeout(self, timeout: float) -> None:
+        await self._roundtrip("Page.wait_for_timeout")
+
+    async def wait_for_url(self, url: Any, **kwargs: Any) -> None:
+        await self._roundtrip("Page.wait_for_url")
+
+    async def wait_for_function(self, script: str, arg: Any = None, **kwargs: Any) -> Any:
+        await self._roundtrip("Page.wait_for_function")
+        result = self._run_script(script, self, arg)
+        if not result:
+            raise PlaywrightTimeoutError("Page.wait_for_function: predicate never held")
+        return result
+
+    async def evaluate(self, script: str, arg: Any = None) -> Any:
+        await self._roundtrip("Page.evaluate")
+        return self._run_script(script, self, arg)
+
+    async def content(self) -> str:
+        await self._roundtrip("Page.content")
+        return str(self.soup)
+
+    async def set_content(self, html: str, **kwargs: Any) -> None:
+        await self._roundtrip("Page.set_content")
+        self.set_content_sync(html)
+
+    async def title(self) -> str:
+        await self._roundtrip("Page.title")
+        return self.soup.title.get_text(strip=True) if self.soup.title else ""
+
+    async def goto(self, url: str, **kwargs: Any) -> None:
+        await self._roundtrip("Page.goto")
+        if url not in self.routes:
+            raise RuntimeError(f"Page.goto: no fake route for {url}")
+        self.set_content_sync(self.routes[url], url)
+
+    async def reload(self, **kwargs: Any) -> None:
+        await self._roundtrip("Page.reload")
+        self.set_content_sync(self.routes.get(self.url, self._html))
+
+    async def bring_to_front(self) -> None:
+        await self._roundtrip("Page.bring_to_front")
+
+    async def screenshot(self, **kwargs: Any) -> bytes:
+        await self._roundtrip("Page.screenshot")
+        return b""
+
+    async def close(self, **kwargs: Any) -> None:
+        await self._roundtrip("Page.close")
+        self._closed = True
+        if self.context is not None and self in self.context.pages:
+            self.context.pages.remove(self)
+        for listener in self._listeners.get("close", []):
+            listener(self)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def on(self, event: str, handler: Callable) -> None:
+        self._listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event: str, handler: Callable) -> None:
+        if handler in self._listeners.get(event, []):
+            self._listeners[event].remove(handler)
+
+
+class FakeContext:
+    """Just enough BrowserContext for steps that open and close tabs."""
+
+    def __init__(self, routes: Optional[Dict[str, str]] = None, latency: Union[float, Dict[str, float]] = 0.0):
+        self.routes = dict(routes or {})
+        self.latency = latency
+        self.pages: List[FakePage] = []
+        self._listeners: Dict[str, List[Callable]] = {}
+
+    def open_tab(self, html: str = "", url: str = "about:blank") -> FakePage:
+        """A tab opened by the page (a popup from a click), announced with the "page" event."""
+        page = FakePage(html, url=url, routes=self.routes, latency=self.latency, context=self)
+        self.pages.append(page)
+        for listener in list(self._listeners.get("page", [])):
+            listener(page)
+        return page
+
+    async def new_page(self) -> FakePage:
+        return self.open_tab()
+
+    def on(self, event: str, handler: Callable) -> None:
+        self._listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event: str, handler: Callable) -> None:
+        if handler in self._listeners.get(event, []):
+            self._listeners[event].remove(handler)
+
+    async def close(self) -> None:
+        for page in list(self.pages):
+            await page.close()
+
+
+def _attribute(node: Tag, name: str) -> Optional[str]:
+    value = node.get(name)
+    if isinstance(value, list):  # bs4 splits multi-valued attributes such as class
+        return " ".join(value)
+    return value
+
+
+def _text_matches(text: str, expected: Any) -> bool:
+    if isinstance(expected, re.Pattern):
+        return bool(expected.search(text))
+    return str(expected).lower() in text.lower()
+
+
+def _classify_apply_buttons(page: FakePage, selector: str) -> Dict[str, Any]:
+    """Emulation of quick_apply_utils.APPLY_BUTTONS_SCRIPT."""
+    buttons = []
+    for index, node in enumerate(select([page.soup], selector)):
+        text = re.sub(r"\s+", " ", re.sub(r"[\u00A0\u2000-\u200D\u202F\u2060]", " ", inner_text(node))).strip().lower()
+        buttons.append({"index": index, "text": text, "quick": "quick apply" in text})
+    quick = next((b["index"] for b in buttons if b["quick"]), -1)
+    regular = next((b["index"] for b in buttons if not b["quick"]), -1)
+    return {"count": len(buttons), "buttons": buttons, "quickIndex": quick, "regularIndex": regular}
+
+
+def _stable_wait(page: FakePage, args: Dict[str, Any]) -> bool:
+    """Emulation of waits.wait_until_stable's script. The fake DOM only changes
+    between calls, so it is always quiet; a custom ``predicate`` is not evaluated."""
+    roots = select([page.soup], args["selector"]) if args.get("selector") else [page.soup.body or page.soup]
+    if not roots:
+        return False
+    text = inner_text(roots[0])
+    if args.get("minTextLength") and len(text) < args["minTextLength"]:
+        return False
+    if args.get("contains") and args["contains"] not in text.lower():
+        return False
+    return not args.get("present") or bool(select(roots, args["present"]))
+
+
+async def _demo() -> None:
+    """Microbenchmark detect_quick_apply and wait_for_details_panel against a synthetic Seek detail page."""
+    from ..seek_impl import detect_quick_apply, wait_for_details_panel
+
+    html = (
+        '<html><body><div data-automation="jobDetailsPage"><h1>Python Developer</h1>'
+        + "<p>" + "Build and run data pipelines. " * 10 + "</p>"
+        + '<a data-automation="job-detail-apply" href="/apply">Apply now</a>'
+        + '<a data-automation="job-detail-apply" href="/quick">Quick apply</a></div></body></html>'
+    )
+    for latency in (0.0, 0.002):
+        page = FakePage(html, url="https://www.seek.com.au/job/1", latency=latency)
+        page.register_script("__guuStableWait", _stable_wait)
+        page.register_script("quickIndex", _classify_apply_buttons)
+        ctx = {"page": page, "selectors": {"job_details_panel": '[data-automation="jobDetailsPage"]'}}
+        started = time.perf_counter()
+        rounds = 200
+        for _ in range(rounds):
+            [event async for event in wait_for_details_panel(ctx)]
+            events = [str(event) async for event in detect_quick_apply(ctx)]
+        elapsed = time.perf_counter() - started
+        print(f"latency {latency * 1000:.0f}ms: {elapsed / rounds * 1000:.2f}ms per job, "
+              f"{page.roundtrips / rounds:.0f} roundtrips per job {dict(page.calls)}; last events {events}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
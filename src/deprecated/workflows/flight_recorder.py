@@ -0,0 +1,177 @@
+"""Failure-only trace capture for workflow runs.
+
+A ``FlightRecorder`` keeps the recent history of a session in bounded ring
+buffers:
+
+- actions: every ``rate_governor.pace`` call (navigations, clicks, applies)
+  and every step transition
+- network: request failures and error responses, plus main-frame
+  navigations, from the pages it is attached to
+- DOM: opt-in compressed snapshots of the page after earlier steps
+
+Nothing is written while the run is healthy, and by default nothing is
+read from the browser either: recording is a deque append per event. When a
+step fails, ``dump`` writes a bundle under ``traces/``: the buffered events,
+the live page HTML and a screenshot. Which events are failures is the
+workflow's call (``CompiledWorkflow.is_failure``), not the event's wording.
+Only the newest ``MAX_BUNDLES`` bundles are kept on disk.
+
+DOM snapshots of earlier steps cost a ``page.content()`` roundtrip and a
+compression each, so they are off unless ``dom_capacity`` is set, and then
+taken only every ``snapshot_every`` transitions.
+
+``step_compiler.run_workflow`` attaches a recorder to every run that does
+not bring its own in ``ctx["flight_recorder"]``; set it to None to opt out.
+
+    ctx["flight_recorder"] = FlightRecorder("seek", dom_capacity=3, snapshot_every=5)
+    await run_workflow(compiled, ctx)
+"""
+from __future__ import annotations
+import json
+import re
+import shutil
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+TRACES_DIR = Path(__file__).resolve().parent / "traces"
+ACTION_CAPACITY = 200
+NETWORK_CAPACITY = 300
+# DOM snapshots are opt-in
+DOM_CAPACITY = 0
+SNAPSHOT_EVERY = 1
+# Bundles kept in the traces directory (and written by one recorder); older ones are deleted
+MAX_BUNDLES = 20
+# The same failure from the same step is only dumped once per this many seconds
+DUMP_COOLDOWN = 120.0
+
+
+class FlightRecorder:
+    """Per-session ring buffers, dumped to disk only on failure."""
+
+    def __init__(self, name: str, directory: Optional[str] = None, action_capacity: int = ACTION_CAPACITY,
+                 network_capacity: int = NETWORK_CAPACITY, dom_capacity: int = DOM_CAPACITY,
+                 snapshot_every: int = SNAPSHOT_EVERY):
+        self.name = name
+        self.directory = Path(directory) if directory else TRACES_DIR
+        self.actions: deque = deque(maxlen=action_capacity)
+        self.network: deque = deque(maxlen=network_capacity)
+        self.dom: deque = deque(maxlen=dom_capacity)
+        self.snapshot_every = max(1, snapshot_every)
+        self._transitions = 0
+        self.bundles: List[Path] = []
+        self._attached: set = set()
+        self._last_dump: Dict[Tuple[str, str], float] = {}
+
+    def record(self, kind: str, *data: Any) -> None:
+        self.actions.append((time.time(), kind, data))
+
+    # Network listeners only keep what helps explain a failure
+    def _on_response(self, response) -> None:
+        if response.status >= 400:
+            self.network.append((time.time(), "response", response.status, response.request.method, response.url))
+
+    def _on_request_failed(self, request) -> None:
+        self.network.append((time.time(), "failed", request.failure, request.method, request.url))
+
+    def _on_navigated(self, frame) -> None:
+        if frame.parent_frame is None:
+            self.network.append((time.time(), "navigated", None, "GET", frame.url))
+
+    def attach(self, page) -> None:
+        """Start listening to a page's network events; attaching twice is a no-op."""
+        if page is None or id(page) in self._attached:
+            return
+        self._attached.add(id(page))
+        try:
+            page.on("response", self._on_response)
+            page.on("requestfailed", self._on_request_failed)
+            page.on("framenavigated", self._on_navigated)
+            page.on("close", lambda _: self._attached.discard(id(page)))
+        except Exception as e:
+            print(f"[{self.name}] flight recorder could not attach to page: {e}")
+
+    async def snapshot(self, page, label: str) -> None:
+        try:
+            html = await page.content()
+        except Exception:
+            return
+        self.dom.append((time.time(), label, page.url, zlib.compress(html.encode("utf-8"), 1)))
+
+    async def dump(self, page, step: str, event: Optional[str], reason: str = "") -> Optional[Path]:
+        """Write the buffers and the live page state to a new bundle directory."""
+        now = time.time()
+        key = (step, str(event))
+        if len(self.bundles) >= MAX_BUNDLES or now - self._last_dump.get(key, 0) < DUMP_COOLDOWN:
+            return None
+        self._last_dump[key] = now
+        slug = re.sub(r"[^a-z0-9]+", "-", f"{self.name}-{step}".lower()).strip("-")
+        bundle = self.directory / f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{slug}"
+        try:
+            bundle.mkdir(parents=True, exist_ok=True)
+            meta = {"session": self.name, "step": step, "event": event, "reason": reason, "at": now,
+                    "url": getattr(page, "url", None)}
+            (bundle / "meta.json").write_text(json.dumps(meta, indent=1), encoding="utf-8")
+            with open(bundle / "actions.jsonl", "w", encoding="utf-8") as f:
+                for at, kind, data in self.actions:
+                    f.write(json.dumps({"at": at, "kind": kind, "data": [str(d) for d in data]}) + "\n")
+            with open(bundle / "network.jsonl", "w", encoding="utf-8") as f:
+                for at, kind, status, method, url in self.network:
+                    f.write(json.dumps({"at": at, "kind": kind, "status": status, "method": method, "url": url}) + "\n")
+            for i, (at, label, url, compressed) in enumerate(self.dom):
+                name = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+                (bundle / f"dom-{i}-{name}.html").write_bytes(zlib.decompress(compressed))
+            if page is not None:
+                try:
+                    (bundle / "page.html").write_text(await page.content(), encoding="utf-8")
+                    await page.screenshot(path=str(bundle / "screenshot.png"), full_page=True)
+                except Exception as e:
+                    print(f"[{self.name}] could not capture page for trace: {e}")
+        except Exception as e:
+            print(f"[{self.name}] could not write trace bundle: {e}")
+            return None
+        self.bundles.append(bundle)
+        print(f"[{self.name}] failure trace for '{step}' ({event}) written to {bundle}")
+        self.prune()
+        return bundle
+
+    def prune(self, keep: int = MAX_BUNDLES) -> int:
+        """Delete all but the newest ``keep`` bundles in the traces directory; returns how many went."""
+        try:
+            bundles = sorted((p for p in self.directory.iterdir() if (p / "meta.json").is_file()),
+                             key=lambda p: p.stat().st_mtime, reverse=True)
+        except OSError:
+            return 0
+        for old in bundles[keep:]:
+            shutil.rmtree(old, ignore_errors=True)
+        return len(bundles[keep:])
+
+    def hooks(self, ctx: Dict[str, Any], is_failure: Callable[[str, Optional[str]], bool],
+              page_keys: Tuple[str, ...] = ("page", "jobs_page")):
+        """``on_progress`` / ``on_transition`` callbacks for step_compiler.run_workflow.
+
+        ``is_failure(step, event)`` decides which transitions get a bundle.
+        """
+        def current_page():
+            for key in page_keys:
+                if ctx.get(key) is not None:
+                    return ctx[key]
+            return None
+
+        def on_progress(step: str, value: Any) -> None:
+            # Keep the object; it is only formatted if a bundle is written
+            self.actions.append((time.time(), "progress", (step, value)))
+
+        async def on_transition(step: str, event: Optional[str], next_step: Optional[str], timed_out: bool = False) -> None:
+            self.record("transition", step, event, next_step)
+            self._transitions += 1
+            page = current_page()
+            self.attach(page)
+            if is_failure(step, event):
+                await self.dump(page, step, event, "timeout event" if timed_out else "failure event")
+            elif page is not None and self.dom.maxlen and self._transitions % self.snapshot_every == 0:
+                await self.snapshot(page, step)
+
+        return on_progress, on_transition
@@ -0,0 +1,147 @@
+"""Structural fingerprint cache for application forms.
+
+Employers reuse the same application forms across jobs. A form's fingerprint
+is a hash of its fillable fields (tag, type, name, label, option set) in
+document order, ignoring ids, classes and current values, which change
+between visits. The cache maps a fingerprint to the parsed schema and the
+fills chosen last time, so a repeat form can be filled in one batched call
+without re-detection.
+
+Accepts the form dicts produced by form_parser / form_snapshot (``fields`` or
+``questions``) and by formsBeautifulshup_fixed.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .form_fill import NON_FILLABLE_TYPES, apply_fills
+
+# Runtime data, kept out of version control next to sessions/ and description_cache/
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / "user_data" / "form_fill_cache.json"
+
+
+def _norm(text: Any) -> str:
+    return re.sub(r"\s+", " ", str(text or "")).strip().lower()
+
+
+def _field_signature(field: Dict[str, Any]) -> Optional[List[Any]]:
+    tag = _norm(field.get("tag"))
+    field_type = _norm(field.get("type")) or ("text" if tag == "input" else tag)
+    if tag not in ("input", "textarea", "select") or field_type in NON_FILLABLE_TYPES:
+        return None
+    options = sorted(
+        _norm(opt.get("text") or opt.get("value"))
+        for opt in field.get("options") or []
+        if isinstance(opt, dict)
+    )
+    return [tag, field_type, _norm(field.get("name")), _norm(field.get("label")), options]
+
+
+def form_fields(form: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the field list of a parsed form, whichever parser produced it."""
+    return form.get("fields") or form.get("questions") or []
+
+
+def form_fingerprint(form: Dict[str, Any]) -> Optional[str]:
+    """Hash the fillable structure of a parsed form; None if it has no fillable fields."""
+    signature = []
+    seen_groups = set()
+    for field in form_fields(form):
+        sig = _field_signature(field)
+        if sig is None:
+            continue
+        # Radio/checkbox groups list every option on each member; keep one entry per group
+        if sig[1] in ("radio", "checkbox") and sig[2]:
+            if (sig[1], sig[2]) in seen_groups:
+                continue
+            seen_groups.add((sig[1], sig[2]))
+        signature.append(sig)
+    if not signature:
+        return None
+    payload = json.dumps(signature, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class FormFillCache:
+    """JSON-backed map of form fingerprint -> schema and remembered fills."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Could not load form cache {self.path}: {e}")
+
+    def lookup(self, form: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cache entry for a structurally identical form, if any."""
+        key = form_fingerprint(form)
+        entry = self.entries.get(key) if key else None
+        if entry and entry.get("fills"):
+            entry["hits"] = entry.get("hits", 0) + 1
+            self._dirty = True
+            return entry
+        return None
+
+    def remember(self, form: Dict[str, Any], fills: List[Dict[str, Any]], source: str = "") -> Optional[str]:
+        """Store the fills chosen for ``form``; returns its fingerprint."""
+        key = form_fingerprint(form)
+        if not key or not fills:
+            return None
+        previous = self.entries.get(key, {})
+        self.entries[key] = {
+            "schema": form_fields(form),
+            "fills": fills,
+            "hits": previous.get("hits", 0),
+            "updated_at": time.time(),
+            "source": source or previous.get("source", ""),
+        }
+        self._dirty = True
+        return key
+
+    def forget(self, form: Dict[str, Any]) -> None:
+        key = form_fingerprint(form)
+        if key and self.entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=1)
+            tmp_path.replace(self.path)
+            self._dirty = False
+        except Exception as e:
+            print(f"Could not save form cache {self.path}: {e}")
+
+
+async def fill_from_cache(page, form: Dict[str, Any], cache: FormFillCache, root: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """Replay remembered fills for ``form`` in one evaluate.
+
+    Returns the per-fill results, or None on a cache miss. A replay where any
+    fill fails drops the entry so the caller falls back to full detection.
+    """
+    entry = cache.lookup(form)
+    if not entry:
+        return None
+    form_index = None if root else form.get("form_index")
+    results = await apply_fills(page, entry["fills"], root=root, form_index=form_index)
+    if not all(r.get("ok") for r in results):
+        failed = [f for f, r in zip(entry["fills"], results) if not r.get("ok")]
+        print(f"Cached fills did not apply cleanly ({len(failed)} failed); forgetting entry")
+        cache.forget(form)
+        cache.save()
+        return None
+    cache.save()
+    return results
@@ -0,0 +1,150 @@
+"""Batched form reads and fills in a single page evaluation.
+
+Fields are addressed by ``name``, then ``id``, then by their position among
+the scope's fillable controls (inputs, textareas and selects that are not
+hidden/buttons), so a fill spec recorded on one page can be replayed on a
+structurally identical form elsewhere.
+
+A fill spec is ``{"name"?, "id"?, "index"?, "type", "value"}`` where ``value``
+is text for text-like inputs, an option value/label for selects, the option
+value/label for radio groups and a boolean for checkboxes.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+
+NON_FILLABLE_TYPES = ("hidden", "submit", "button", "reset", "image", "file")
+
+_SCOPE_JS = """
+    const scopeOf = ({ root, formIndex }) => {
+        if (root) return document.querySelector(root);
+        if (formIndex !== null && formIndex !== undefined) return document.querySelectorAll('form')[formIndex] || null;
+        return document;
+    };
+    const NON_FILLABLE = %s;
+    const fillableIn = (scope) => Array.from(scope.querySelectorAll('input, textarea, select'))
+        .filter(el => !NON_FILLABLE.includes((el.getAttribute('type') || '').toLowerCase()));
+    const labelOf = (el) => {
+        if (el.labels && el.labels.length) return (el.labels[0].innerText || '').trim();
+        return (el.getAttribute('aria-label') || '').trim();
+    };
+""" % (list(NON_FILLABLE_TYPES),)
+
+READ_FORM_SCRIPT = "(args) => {" + _SCOPE_JS + """
+    const scope = scopeOf(args);
+    if (!scope) return null;
+    return fillableIn(scope).map((el, index) => {
+        const type = el.tagName.toLowerCase() === 'input' ? (el.getAttribute('type') || 'text').toLowerCase() : el.tagName.toLowerCase();
+        const entry = { index, name: el.getAttribute('name'), id: el.id || null, type, label: labelOf(el) };
+        // The question for a radio/checkbox group is its legend; the per-input label is the option
+        const legend = el.closest('fieldset') && el.closest('fieldset').querySelector('legend');
+        entry.question = (type === 'radio' || type === 'checkbox') && legend ? (legend.innerText || '').trim() : entry.label;
+        if (type === 'checkbox') entry.value = el.checked;
+        else if (type === 'radio') entry.value = el.checked ? el.value : null;
+        else entry.value = el.value || null;
+        if (type === 'select') entry.text = el.selectedIndex >= 0 ? (el.options[el.selectedIndex].textContent || '').trim() : null;
+        if (type === 'radio' && el.checked) entry.text = entry.label;
+        return entry;
+    });
+}"""
+
+APPLY_FILLS_SCRIPT = "(args) => {" + _SCOPE_JS + """
+    const scope = scopeOf(args);
+    if (!scope) return args.fills.map(() => ({ ok: false, reason: 'scope_not_found' }));
+    const fields = fillableIn(scope);
+    const norm = (s) => String(s === null || s === undefined ? '' : s).replace(/\\s+/g, ' ').trim().toLowerCase();
+    const fire = (el) => {
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    };
+    // React tracks the last value it saw; go through the prototype setter so it notices the change
+    const setNativeValue = (el, value) => {
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+            : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    };
+    const targetsFor = (fill) => {
+        if (fill.name) return fields.filter(el => el.getAttribute('name') === fill.name);
+        if (fill.id) return fields.filter(el => el.id === fill.id);
+        return fields[fill.index] ? [fields[fill.index]] : [];
+    };
+
+    return args.fills.map(fill => {
+        const targets = targetsFor(fill);
+        if (!targets.length) return { ok: false, reason: 'field_not_found' };
+        const el = targets[0];
+        const type = (fill.type || '').toLowerCase();
+        const wanted = norm(fill.value);
+
+        if (type === 'radio') {
+            const radio = targets.find(r => norm(r.value) === wanted) || targets.find(r => norm(labelOf(r)) === wanted)
+                || targets.find(r => wanted && norm(labelOf(r)).includes(wanted));
+            if (!radio) return { ok: false, reason: 'option_not_found' };
+            if (!radio.checked) radio.click();
+            return { ok: radio.checked };
+        }
+        if (type === 'checkbox') {
+            const desired = fill.value === true || ['true', 'yes', 'checked', 'on', '1'].includes(wanted);
+            if (el.checked !== desired) el.click();
+            return { ok: el.checked === desired };
+        }
+        if (el instanceof HTMLSelectElement) {
+            const options = Array.from(el.options);
+            const option = options.find(o => norm(o.value) === wanted) || options.find(o => norm(o.textContent) === wanted)
+                || options.find(o => wanted && norm(o.textContent).includes(wanted));
+            if (!option) return { ok: false, reason: 'option_not_found' };
+            setNativeValue(el, option.value);
+            fire(el);
+            return { ok: el.value === option.value };
+        }
+        el.focus();
+        setNativeValue(el, fill.value === null || fill.value === undefined ? '' : String(fill.value));
+        fire(el);
+        el.blur();
+        return { ok: true };
+    });
+}"""
+
+
+def _scope_args(root: Optional[str], form_index: Optional[int]) -> Dict[str, Any]:
+    return {"root": root, "formIndex": form_index}
+
+
+async def read_form_values(page, root: Optional[str] = None, form_index: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+    """Return the current value of every fillable control in the scope, in one evaluate."""
+    return await page.evaluate(READ_FORM_SCRIPT, _scope_args(root, form_index))
+
+
+async def apply_fills(page, fills: List[Dict[str, Any]], root: Optional[str] = None, form_index: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Apply every fill spec in one evaluate, firing input/change events.
+
+    Returns one ``{"ok": bool, "reason"?: str}`` result per fill, in order.
+    """
+    if not fills:
+        return []
+    args = _scope_args(root, form_index)
+    args["fills"] = fills
+    return await page.evaluate(APPLY_FILLS_SCRIPT, args)
+
+
+def fills_from_values(values: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn read_form_values() output into replayable fill specs (one per radio group)."""
+    fills: List[Dict[str, Any]] = []
+    seen_groups = set()
+    for entry in values or []:
+        field_type = entry.get("type")
+        value = entry.get("value")
+        if field_type == "radio":
+            group = entry.get("name") or entry.get("id")
+            if value is None or group in seen_groups:
+                continue
+            seen_groups.add(group)
+        elif value is None or value == "":
+            continue
+        fill = {"type": field_type, "value": value}
+        # Generated ids (React ":r5:") differ between visits; position is stable for an identical form
+        if entry.get("name"):
+            fill["name"] = entry["name"]
+        else:
+            fill["index"] = entry.get("index")
+        fills.append(fill)
+    return fills
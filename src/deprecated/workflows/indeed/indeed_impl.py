@@ -1,29 +1,582 @@
-from .steps_config import INDEED_STEPS
+"""Indeed workflow: search pages stream through parse -> filter -> apply.
 
-def fetch_jobs():
-    # TODO: Implement fetching jobs from Indeed
-    pass
+The stages are async generators chained by ``run_pipeline``:
 
-def parse_results():
-    # TODO: Implement parsing job results
-    pass
+    fetch_jobs -> parse_results -> filter_jobs -> apply_to_jobs -> log_applications
 
-def filter_jobs():
-    # TODO: Implement job filtering logic
-    pass
+``fetch_jobs`` runs ahead of the consumers through a small bounded queue, so
+the next results page loads while the current one is parsed and applied to,
+but never more than ``FETCH_AHEAD`` pages ahead. ``apply_to_jobs`` feeds a
+bounded queue read by ``workers`` apply tasks, each on its own tab. When
+every worker is busy the queue fills up, the feeder blocks, and fetching
+stops until a worker frees up. Each result is logged as soon as it arrives.
 
-def apply_to_jobs():
-    # TODO: Implement job application logic
-    pass
+Without a browser context no apply tab can be opened; the applies then run
+one at a time on the search tab and nothing is fetched ahead, so a search
+page never loads while an application is open in the same tab.
+
+Steps follow the LinkedIn/Seek conventions: they take ``ctx``, yield events
+routed by ``steps_config.STEPS_CONFIG``, and keep state in ``ctx``.
+
+``replay`` runs the workflow offline over saved (or generated) search pages,
+with a stub apply:
+
+    cd src/deprecated && python -m workflows.indeed.replay [--html-dir DIR]
+"""
+from __future__ import annotations
+import asyncio
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from ..answer_kb import get_answer_kb
+from ..events import IndeedEvent, Progress
+from ..form_fill import apply_fills, read_form_values
+from ..rate_governor import pace
+from ..tab_manager import get_tab_manager, stop_tab_manager
+
+BASE_URL = "https://au.indeed.com"
+RESULTS_PER_PAGE = 10
+MAX_SEARCH_PAGES = 10
+FETCH_AHEAD = 2
+DEFAULT_APPLY_WORKERS = 1
+MAX_APPLY_PAGES = 10
+# Applications left open for the user; past this the oldest tab is closed
+MAX_NEEDS_INPUT_TABS = 3
+APPLICATIONS_LOG = "indeed_applications.jsonl"
+
+JOBCARDS_MARKER = 'window.mosaic.providerData["mosaic-provider-jobcards"]'
+NEXT_PAGE_MARKER = 'data-testid="pagination-page-next"'
+
+APPLY_BUTTON_SELECTORS = [
+    "#indeedApplyButton",
+    "button[id*='indeedApplyButton']",
+    "button:has-text('Apply now')",
+]
+CONTINUE_SELECTORS = [
+    "button:has-text('Continue')",
+    "[data-testid*='continue-button']",
+]
+SUBMIT_SELECTORS = [
+    "button:has-text('Submit your application')",
+    "[data-testid*='submit-application-button']",
+]
+SUBMITTED_TEXT = ("application has been submitted", "your application was sent")
+
+ApplyJob = Callable[[Dict[str, Any], Any, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+# -----------------------------
+# Parsing (pure functions)
+# -----------------------------
+
+def search_url(query: str, location: str = "", start: int = 0, base_url: str = BASE_URL) -> str:
+    params = {"q": query, "l": location}
+    if start:
+        params["start"] = start
+    return f"{base_url}/jobs?{urlencode(params)}"
+
+
+def _job_from_card(card: Dict[str, Any], base_url: str) -> Optional[Dict[str, Any]]:
+    job_key = card.get("jobkey")
+    if not job_key:
+        return None
+    return {
+        "job_key": job_key,
+        "title": card.get("displayTitle") or card.get("title") or "",
+        "company": card.get("company") or "",
+        "location": card.get("formattedLocation") or "",
+        "salary": (card.get("salarySnippet") or {}).get("text") or "",
+        "snippet": re.sub(r"<[^>]+>", " ", card.get("snippet") or "").strip(),
+        "indeed_apply": bool(card.get("indeedApplyEnabled") or card.get("indeedApplyable")),
+        "url": f"{base_url}/viewjob?jk={job_key}",
+    }
+
+
+def parse_search_html(html: str, base_url: str = BASE_URL) -> List[Dict[str, Any]]:
+    """Jobs on a search results page.
+
+    Reads the job card JSON Indeed embeds for its own hydration; falls back to
+    the ``data-jk`` attributes on the cards when it is missing.
+    """
+    start = html.find(JOBCARDS_MARKER)
+    if start != -1:
+        brace = html.find("{", start)
+        try:
+            data, _ = json.JSONDecoder().raw_decode(html, brace)
+            cards = data["metaData"]["mosaicProviderJobCardsModel"]["results"]
+            return [job for job in (_job_from_card(card, base_url) for card in cards) if job]
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"[indeed.parse] job card JSON unreadable ({e}); falling back to HTML")
+    jobs = []
+    for match in re.finditer(r'data-jk="([0-9a-f]+)"', html):
+        block = html[match.end():match.end() + 2000]
+        title = re.search(r'<span[^>]*title="([^"]+)"', block)
+        jobs.append({
+            "job_key": match.group(1),
+            "title": title.group(1) if title else "",
+            "company": "",
+            "location": "",
+            "salary": "",
+            "snippet": "",
+            "indeed_apply": "indeedApply" in block or "Easily apply" in block,
+            "url": f"{base_url}/viewjob?jk={match.group(1)}",
+        })
+    return jobs
+
+
+def has_next_page(html: str) -> bool:
+    return NEXT_PAGE_MARKER in html
+
+
+# -----------------------------
+# Pipeline stages
+# -----------------------------
+
+class _Failed:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def bounded(source: AsyncIterator[Any], maxsize: int) -> AsyncGenerator[Any, None]:
+    """Run ``source`` in its own task, at most ``maxsize`` items ahead of the consumer."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+    end = object()
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+            await queue.put(end)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(_Failed(e))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is end:
+                break
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+async def fetch_jobs(ctx: Dict[str, Any], page) -> AsyncGenerator[Dict[str, Any], None]:
+    """Yield ``{"url", "html", "page"}`` for each results page of the search."""
+    search = ctx.get("indeed_search") or {}
+    base_url = ctx.get("indeed_base_url") or BASE_URL
+    max_pages = int(ctx.get("indeed_max_pages") or MAX_SEARCH_PAGES)
+    for page_no in range(max_pages):
+        url = search_url(search.get("q", ""), search.get("l", ""), page_no * RESULTS_PER_PAGE, base_url)
+        await pace(ctx, "indeed", "navigate")
+        await page.goto(url, wait_until="domcontentloaded")
+        html = await page.content()
+        ctx["indeed_stats"]["pages"] += 1
+        yield {"url": url, "html": html, "page": page_no}
+        if not has_next_page(html):
+            break
+
+
+async def parse_results(ctx: Dict[str, Any], pages: AsyncIterator[Dict[str, Any]]) -> AsyncGenerator[Dict[str, Any], None]:
+    """Yield each job once, in result order."""
+    base_url = ctx.get("indeed_base_url") or BASE_URL
+    seen = set()
+    async for fetched in pages:
+        jobs = parse_search_html(fetched["html"], base_url)
+        if not jobs:
+            print(f"[indeed.parse] no jobs on results page {fetched['page'] + 1}")
+        for job in jobs:
+            if job["job_key"] in seen:
+                continue
+            seen.add(job["job_key"])
+            ctx["indeed_stats"]["parsed"] += 1
+            yield job
+
+
+def job_rejection(ctx: Dict[str, Any], job: Dict[str, Any]) -> Optional[str]:
+    """Why ``job`` should not be applied to, or None."""
+    if job["job_key"] in ctx.get("indeed_applied_ids", ()):
+        return "already applied"
+    if ctx.get("indeed_apply_only", True) and not job.get("indeed_apply"):
+        return "no Indeed Apply"
+    title = job.get("title", "").lower()
+    for word in ctx.get("indeed_title_blacklist") or []:
+        if word.lower() in title:
+            return f"title contains '{word}'"
+    company = job.get("company", "").lower()
+    for name in ctx.get("indeed_company_blacklist") or []:
+        if name.lower() == company:
+            return f"company '{name}' blacklisted"
+    return None
+
+
+async def filter_jobs(ctx: Dict[str, Any], jobs: AsyncIterator[Dict[str, Any]]) -> AsyncGenerator[Dict[str, Any], None]:
+    async for job in jobs:
+        reason = job_rejection(ctx, job)
+        if reason:
+            ctx["indeed_stats"]["filtered"] += 1
+            continue
+        yield job
+
+
+async def _apply_one(ctx: Dict[str, Any], apply_job: ApplyJob, page, job: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.monotonic()
+    try:
+        result = await apply_job(ctx, page, job)
+    except Exception as e:
+        result = {"status": "error", "reason": str(e)}
+    return {**result, "job": job, "seconds": round(time.monotonic() - started, 2)}
+
+
+async def apply_to_jobs(ctx: Dict[str, Any], jobs: AsyncIterator[Dict[str, Any]],
+                        apply_job: Optional[ApplyJob] = None,
+                        pages: Optional[List[Any]] = None) -> AsyncGenerator[Dict[str, Any], None]:
+    """Apply to jobs with one worker per tab in ``pages``; yield one result dict per job, in completion order.
+
+    Without ``pages`` (no tab of their own could be opened) the jobs are applied
+    to one at a time on the search tab, each before the next job is pulled.
+    """
+    apply_job = apply_job or ctx.get("indeed_apply_job") or apply_indeed_job
+    max_applications = ctx.get("indeed_max_applications")
+    if not pages:
+        sent = 0
+        async for job in jobs:
+            if max_applications is not None and sent >= max_applications:
+                break
+            sent += 1
+            yield await _apply_one(ctx, apply_job, ctx.get("page"), job)
+        return
+
+    workers = len(pages)
+    pending: asyncio.Queue = asyncio.Queue(maxsize=workers)
+    results: asyncio.Queue = asyncio.Queue()
+    stop = object()
+
+    async def feed() -> None:
+        sent = 0
+        try:
+            async for job in jobs:
+                if max_applications is not None and sent >= max_applications:
+                    break
+                await pending.put(job)
+                sent += 1
+        except Exception as e:
+            await results.put(_Failed(e))
+        finally:
+            for _ in range(workers):
+                await pending.put(stop)
+
+    async def work(page) -> None:
+        try:
+            while True:
+                job = await pending.get()
+                if job is stop:
+                    break
+                await results.put(await _apply_one(ctx, apply_job, page, job))
+        finally:
+            await results.put(stop)
+
+    tasks = [asyncio.create_task(feed())] + [asyncio.create_task(work(page)) for page in pages]
+    try:
+        finished = 0
+        while finished < workers:
+            result = await results.get()
+            if result is stop:
+                finished += 1
+            elif isinstance(result, _Failed):
+                raise result.error
+            else:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def log_applications(ctx: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Append one result to the applications log and the run's stats."""
+    job = result["job"]
+    status = result.get("status", "error")
+    stats = ctx["indeed_stats"]
+    stats[status] = stats.get(status, 0) + 1
+    if status == "applied":
+        ctx.setdefault("indeed_applied_ids", set()).add(job["job_key"])
+    record = {
+        "job_key": job["job_key"],
+        "title": job.get("title"),
+        "company": job.get("company"),
+        "url": job.get("url"),
+        "status": status,
+        "reason": result.get("reason"),
+        "seconds": result.get("seconds"),
+        "at": time.time(),
+    }
+    try:
+        with open(_log_path(ctx), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception as e:
+        print(f"[indeed.log] could not write application log: {e}")
+
+
+# -----------------------------
+# Applying on a job page
+# -----------------------------
+
+async def open_apply_pages(ctx: Dict[str, Any], workers: int) -> List[Any]:
+    """A tab of its own for each apply worker; empty without a browser context to open them in.
+
+    The tabs live only in the workers' locals, so each is leased until
+    ``close_apply_pages`` to keep the tab manager from reclaiming it.
+    """
+    tabs = get_tab_manager(ctx)
+    if tabs is None:
+        return []
+    pages = []
+    for _ in range(max(1, workers)):
+        page = await tabs.new_page("apply_to_jobs", "apply worker")
+        tabs.lease(page)
+        pages.append(page)
+    return pages
+
+
+async def close_apply_pages(ctx: Dict[str, Any], pages: List[Any]) -> None:
+    tabs = get_tab_manager(ctx)
+    for page in pages:
+        if tabs is not None:
+            await tabs.close(page)
+        else:
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+
+async def _first_visible(page, selectors: List[str]):
+    for selector in selectors:
+        try:
+            locator = page.locator(selector).first
+            if await locator.count() and await locator.is_visible():
+                return locator
+        except Exception:
+            continue
+    return None
+
+
+async def _application_submitted(page) -> bool:
+    try:
+        text = (await page.inner_text("body")).lower()
+    except Exception:
+        return False
+    return any(marker in text for marker in SUBMITTED_TEXT)
+
+
+async def _fill_known_answers(page) -> int:
+    """Fill empty fields that the answer knowledge base can answer; returns the number filled."""
+    values = await read_form_values(page) or []
+    answer_kb = get_answer_kb()
+    radio_groups: Dict[str, List[Dict[str, Any]]] = {}
+    fills = []
+    for entry in values:
+        if entry["type"] == "radio":
+            radio_groups.setdefault(entry.get("name") or entry.get("id"), []).append(entry)
+        elif entry["type"] not in ("checkbox",) and not entry.get("value"):
+            known = answer_kb.resolve(entry.get("question") or entry.get("label") or "")
+            if known:
+                fills.append({"index": entry["index"], "type": entry["type"], "value": known["answer"]})
+    for name, group in radio_groups.items():
+        if any(entry.get("value") for entry in group):
+            continue
+        known = answer_kb.resolve(group[0].get("question") or "", [entry.get("label") or "" for entry in group])
+        if known and name:
+            fills.append({"name": name, "type": "radio", "value": known["option"]})
+    if not fills:
+        return 0
+    results = await apply_fills(page, fills)
+    return sum(1 for r in results if r.get("ok"))
+
+
+async def apply_indeed_job(ctx: Dict[str, Any], page, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Open a job, start Indeed Apply and walk its pages; returns ``{"status", "reason"}``.
+
+    Stops with ``needs_input`` on a page it cannot complete from the answer
+    knowledge base, leaving the tab for the user.
+    """
+    await pace(ctx, "indeed", "navigate")
+    await page.goto(job["url"], wait_until="domcontentloaded")
+    button = await _first_visible(page, APPLY_BUTTON_SELECTORS)
+    if button is None:
+        return {"status": "skipped", "reason": "no apply button"}
+
+    pages_before = list(page.context.pages)
+    await pace(ctx, "indeed", "click")
+    await button.click()
+    await page.wait_for_load_state("domcontentloaded")
+    # Indeed Apply opens either in this tab or in a new one
+    opened = [p for p in page.context.pages if p not in pages_before]
+    apply_page = opened[-1] if opened else page
+    await apply_page.wait_for_load_state("domcontentloaded")
+    if apply_page is page:
+        return await _complete_application(ctx, apply_page)
+
+    tabs = get_tab_manager(ctx)
+    if tabs is None:
+        return await _complete_application(ctx, apply_page)
+    tabs.adopt(apply_page, "apply_to_jobs", "indeed apply")
+    with tabs.in_use(apply_page):
+        result = await _complete_application(ctx, apply_page)
+    if result["status"] == "needs_input":
+        await _leave_for_user(ctx, tabs, apply_page)
+    else:
+        await tabs.close(apply_page)
+    return result
+
+
+async def _leave_for_user(ctx: Dict[str, Any], tabs, apply_page) -> None:
+    """Pin an application tab for the user to finish, closing the oldest beyond ``MAX_NEEDS_INPUT_TABS``.
+
+    The job is logged as ``needs_input`` with its URL either way, so a closed
+    tab can be reopened from the applications log.
+    """
+    left_open = ctx.setdefault("indeed_needs_input_tabs", [])
+    # Tabs the user has finished and closed no longer count
+    left_open[:] = [p for p in left_open if not p.is_closed()]
+    tabs.pin(apply_page)
+    left_open.append(apply_page)
+    while len(left_open) > MAX_NEEDS_INPUT_TABS:
+        oldest = left_open.pop(0)
+        print(f"[indeed.apply] {MAX_NEEDS_INPUT_TABS} applications already waiting for input; "
+              f"closing {getattr(oldest, 'url', '')} (see the applications log)")
+        tabs.pin(oldest, False)
+        await tabs.close(oldest)
+
+
+async def _complete_application(ctx: Dict[str, Any], apply_page) -> Dict[str, Any]:
+    """Walk the Indeed Apply pages in ``apply_page`` until submitted or stuck."""
+    for _ in range(MAX_APPLY_PAGES):
+        if await _application_submitted(apply_page):
+            return {"status": "applied"}
+        await _fill_known_answers(apply_page)
+        submit = await _first_visible(apply_page, SUBMIT_SELECTORS)
+        if submit is not None:
+            await pace(ctx, "indeed", "apply")
+            await submit.click()
+            await apply_page.wait_for_load_state("domcontentloaded")
+            if await _application_submitted(apply_page):
+                return {"status": "applied"}
+            return {"status": "failed", "reason": "no confirmation after submit"}
+        next_button = await _first_visible(apply_page, CONTINUE_SELECTORS)
+        if next_button is None:
+            return {"status": "needs_input", "reason": "no continue or submit button"}
+        url_before = apply_page.url
+        await pace(ctx, "indeed", "click")
+        await next_button.click()
+        await apply_page.wait_for_load_state("domcontentloaded")
+        if apply_page.url == url_before and await _first_visible(apply_page, ["[role='alert']", ".ia-ErrorText"]):
+            return {"status": "needs_input", "reason": "validation errors"}
+    return {"status": "failed", "reason": f"more than {MAX_APPLY_PAGES} application pages"}
+
+
+# -----------------------------
+# Steps
+# -----------------------------
+
+def _log_path(ctx: Dict[str, Any]) -> Path:
+    return Path(ctx.get("base_dir") or ".") / APPLICATIONS_LOG
+
+
+def _load_applied_ids(ctx: Dict[str, Any]) -> set:
+    applied = set()
+    try:
+        with open(_log_path(ctx), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("status") == "applied":
+                    applied.add(record.get("job_key"))
+    except FileNotFoundError:
+        pass
+    return applied
+
+
+async def step0(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
+    """Read the search and filters from settings and load already-applied job keys."""
+    if "indeed_search" not in ctx:
+        from helpers.config_manager import load_settings
+        settings = load_settings(str(ctx.get("base_dir", ".")), "indeed")
+        prefs = settings.get("job_preferences", {}) if isinstance(settings, dict) else {}
+        kws = prefs.get("keywords", [])
+        locs = prefs.get("locations", [])
+        ctx["indeed_search"] = {
+            "q": kws[0] if isinstance(kws, list) and kws else (kws if isinstance(kws, str) else ""),
+            "l": locs[0] if isinstance(locs, list) and locs else (locs if isinstance(locs, str) else ""),
+        }
+        ctx.setdefault("indeed_title_blacklist", prefs.get("title_blacklist") or [])
+        ctx.setdefault("indeed_company_blacklist", prefs.get("company_blacklist") or [])
+    ctx["indeed_applied_ids"] = _load_applied_ids(ctx)
+    ctx["indeed_stats"] = {"pages": 0, "parsed": 0, "filtered": 0}
+    yield IndeedEvent.CTX_READY
+
+
+async def open_search(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
+    """Make sure there is a tab for the search pages."""
+    if ctx.get("page") is None:
+        context = ctx.get("browser_context")
+        if context is None:
+            print("[indeed.open_search] No browser context")
+            yield IndeedEvent.NO_BROWSER_CONTEXT
+            return
+        ctx["page"] = await get_tab_manager(ctx).new_page("open_search", "search")
+    yield IndeedEvent.SEARCH_READY
+
+
+async def run_pipeline(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
+    """Stream search pages through parsing, filtering and applying, logging each result."""
+    workers = int(ctx.get("indeed_apply_workers") or DEFAULT_APPLY_WORKERS)
+    apply_pages = await open_apply_pages(ctx, workers)
+    if apply_pages:
+        pages = bounded(fetch_jobs(ctx, ctx["page"]), FETCH_AHEAD)
+    else:
+        print("[indeed.run_pipeline] no browser context for apply tabs; applying one job at a time on the search tab")
+        pages = fetch_jobs(ctx, ctx["page"])
+    jobs = filter_jobs(ctx, parse_results(ctx, pages))
+    results = apply_to_jobs(ctx, jobs, pages=apply_pages)
+    try:
+        async for result in results:
+            await log_applications(ctx, result)
+            yield Progress("{}: {} {}", result["job"]["title"], result.get("status"), result.get("reason") or "")
+    except Exception as e:
+        print(f"[indeed.run_pipeline] pipeline error: {e}")
+        yield IndeedEvent.PIPELINE_FAILED
+        return
+    finally:
+        await results.aclose()
+        await close_apply_pages(ctx, apply_pages)
+    yield IndeedEvent.PIPELINE_FINISHED
+
+
+async def finish(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
+    print(f"[indeed.finish] {ctx.get('indeed_stats')}")
+    await stop_tab_manager(ctx)
+    yield IndeedEvent.RUN_FINISHED
 
-def log_applications():
-    # TODO: Implement logging of applications
-    pass
 
 STEP_FUNCTIONS = {
-    "fetch_jobs": fetch_jobs,
-    "parse_results": parse_results,
-    "filter_jobs": filter_jobs,
-    "apply_to_jobs": apply_to_jobs,
-    "log_applications": log_applications,
+    "step0": step0,
+    "open_search": open_search,
+    "run_pipeline": run_pipeline,
+    "finish": finish,
 }
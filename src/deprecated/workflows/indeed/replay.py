@@ -0,0 +1,96 @@
+"""Offline replay of the Indeed workflow over saved or generated search pages.
+
+The search pages are served by a ``fake_browser.FakeContext`` whose routes are
+the URLs ``fetch_jobs`` requests, so the real steps run unchanged with no
+browser. Applications are simulated unless ``apply_job`` is given.
+
+    cd src/deprecated && python -m workflows.indeed.replay [--html-dir DIR] [--workers N]
+"""
+from __future__ import annotations
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..fake_browser import FakeContext
+from .indeed_impl import BASE_URL, JOBCARDS_MARKER, NEXT_PAGE_MARKER, RESULTS_PER_PAGE, ApplyJob, search_url
+
+REPLAY_SEARCH = {"q": "software engineer", "l": "Sydney"}
+
+
+def synthetic_search_pages(count: int = 3, per_page: int = RESULTS_PER_PAGE) -> List[str]:
+    """Search pages in Indeed's embedded job card format, for replay without saved HTML.
+
+    On every page cards 0 and 5 lack Indeed Apply and cards 0, 4 and 8 are "(Senior)".
+    """
+    pages = []
+    for page_no in range(count):
+        cards = [
+            {
+                "jobkey": f"{page_no:03x}{i:05x}",
+                "displayTitle": f"Software Engineer {page_no * per_page + i}" + (" (Senior)" if i % 4 == 0 else ""),
+                "company": f"Company {i % 3}",
+                "formattedLocation": "Sydney NSW",
+                "indeedApplyEnabled": i % 5 != 0,
+                "snippet": "<ul><li>Python</li></ul>",
+            }
+            for i in range(per_page)
+        ]
+        data = {"metaData": {"mosaicProviderJobCardsModel": {"results": cards}}}
+        next_link = f'<a {NEXT_PAGE_MARKER} href="#">Next</a>' if page_no < count - 1 else ""
+        pages.append(f"<html><script>{JOBCARDS_MARKER}={json.dumps(data)};</script>{next_link}</html>")
+    return pages
+
+
+def search_routes(pages: List[str], search: Dict[str, str] = REPLAY_SEARCH, base_url: str = BASE_URL) -> Dict[str, str]:
+    """``FakeContext`` routes serving ``pages`` in order at the search URLs fetch_jobs loads."""
+    return {
+        search_url(search.get("q", ""), search.get("l", ""), page_no * RESULTS_PER_PAGE, base_url): html
+        for page_no, html in enumerate(pages)
+    }
+
+
+async def replay(pages: List[str], workers: int = 2, apply_seconds: float = 0.05, base_dir: str = ".",
+                 apply_job: Optional[ApplyJob] = None, quiet: bool = False, latency: float = 0.01) -> Dict[str, Any]:
+    """Run the whole workflow offline; applies are simulated unless ``apply_job`` is given. Returns the run's stats."""
+    from .steps_config import STEPS_CONFIG, WORKFLOW_META
+    from ..step_compiler import compile_workflow, run_workflow
+
+    async def stub_apply(ctx: Dict[str, Any], page, job: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(apply_seconds)
+        return {"status": "applied"}
+
+    ctx = {
+        "base_dir": base_dir,
+        "browser_context": FakeContext(search_routes(pages), latency={"default": 0.0, "goto": latency}),
+        "indeed_search": dict(REPLAY_SEARCH),
+        "indeed_title_blacklist": ["senior"],
+        "indeed_apply_job": apply_job or stub_apply,
+        "indeed_apply_workers": workers,
+        "rate_limits": {"navigate": {"rate": 1000, "burst": 1000}},
+        # A failed replay is reproduced by running it again, not from a trace bundle
+        "flight_recorder": None,
+    }
+    on_progress = None if quiet else (lambda step, value: print(f"  {value}"))
+    started = time.monotonic()
+    last = await run_workflow(compile_workflow(STEPS_CONFIG, WORKFLOW_META), ctx, on_progress=on_progress)
+    stats = dict(ctx["indeed_stats"], seconds=round(time.monotonic() - started, 2), last_step=last)
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Replay the Indeed pipeline over saved search pages")
+    parser.add_argument("--html-dir", help="directory of saved search pages (*.html, in page order)")
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.html_dir:
+        replay_pages = [p.read_text(encoding="utf-8") for p in sorted(Path(args.html_dir).glob("*.html"))]
+    else:
+        replay_pages = synthetic_search_pages()
+    with tempfile.TemporaryDirectory() as tmp:
+        print(asyncio.run(replay(replay_pages, workers=args.workers, base_dir=tmp)))
@@ -1,8 +1,43 @@
-# Boilerplate workflow steps for Indeed
-INDEED_STEPS = [
-    "fetch_jobs",
-    "parse_results",
-    "filter_jobs",
-    "apply_to_jobs",
-    "log_applications"
-]
+from __future__ import annotations
+from .indeed_impl import step0, open_search, run_pipeline, finish
+
+WORKFLOW_META = {
+    "title": "Indeed",
+    "description": "Search and apply on Indeed Jobs",
+    "start_step": "init_context",
+    "circuit_breaker": {"threshold": 3, "window": 600, "cooldown": 300},
+}
+
+STEPS_CONFIG = {
+    "init_context": {
+        "step": 0,
+        "func": step0,
+        "transitions": {"ctx_ready": "open_search"},
+        "timeout": 30,
+        "on_timeout_event": "ctx_ready",
+    },
+    "open_search": {
+        "step": 1,
+        "func": open_search,
+        "transitions": {"search_ready": "run_pipeline", "no_browser_context": "finish"},
+        "timeout": 20,
+        "on_timeout_event": "no_browser_context",
+    },
+    "run_pipeline": {
+        "step": 2,
+        "func": run_pipeline,
+        "transitions": {"pipeline_finished": "finish", "pipeline_failed": "finish"},
+        "timeout": 3600,
+        "on_timeout_event": "pipeline_failed",
+    },
+    "finish": {
+        "step": 3,
+        "func": finish,
+        "transitions": {"run_finished": None},
+        "timeout": 10,
+        "on_timeout_event": "run_finished",
+    },
+}
+
+# Step order, kept for callers of the old flat list
+INDEED_STEPS = list(STEPS_CONFIG)
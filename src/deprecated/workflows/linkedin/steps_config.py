@@ -11,6 +11,7 @@ WORKFLOW_META = {
 	"title": "LinkedIn Jobs",
 	"description": "Search and apply on LinkedIn Jobs",
 	"start_step": "step0",
+	"circuit_breaker": {"threshold": 3, "window": 600, "cooldown": 300},
 }
 
 STEPS_CONFIG = {
@@ -32,6 +33,7 @@ STEPS_CONFIG = {
 			"failed to navigate": "open_check_login",
 			"failed checking login status": "open_check_login"
 		},
+		"retry": {"max_attempts": 3, "backoff": 5, "on_exhausted": "finish"},
 		"timeout": 30,
 		"on_timeout_event": "failed to navigate"
 	},
@@ -71,6 +73,7 @@ STEPS_CONFIG = {
 		"step": 5,
 		"func": open_jobs_page,
 		"transitions": {"jobs page loaded": "set_search_location", "failed opening jobs page": "open_jobs_page"},
+		"retry": {"max_attempts": 4, "backoff": 5, "on_exhausted": "finish"},
 		"timeout": 30,
 		"on_timeout_event": "failed opening jobs page"
 	},
@@ -78,6 +81,7 @@ STEPS_CONFIG = {
 		"step": 6,
 		"func": set_search_location,
 		"transitions": {"search location set": "set_search_keywords", "no search location in settings": "set_search_keywords", "location input not found": "set_search_location", "failed setting search location": "set_search_location", "jobs page missing": "set_search_location"},
+		"retry": {"max_attempts": 3, "backoff": 2, "on_exhausted": "set_search_keywords"},
 		"timeout": 30,
 		"on_timeout_event": "failed setting search location"
 	},
@@ -85,6 +89,7 @@ STEPS_CONFIG = {
 		"step": 7,
 		"func": set_search_keywords,
 		"transitions": {"search keywords set": "apply_filters", "no keywords in settings": "apply_filters", "keywords input not found": "set_search_keywords", "failed setting search keywords": "set_search_keywords", "jobs page missing": "set_search_keywords"},
+		"retry": {"max_attempts": 3, "backoff": 2, "on_exhausted": "apply_filters"},
 		"timeout": 30,
 		"on_timeout_event": "failed setting search keywords"
 	},
@@ -92,6 +97,7 @@ STEPS_CONFIG = {
 		"step": 8,
 		"func": apply_filters,
 		"transitions": {"filters applied successfully": "get_page_info", "filters application failed": "get_page_info", "jobs page missing": "apply_filters"},
+		"retry": {"max_attempts": 3, "backoff": 2, "on_exhausted": "get_page_info"},
 		"timeout": 40,
 		"on_timeout_event": "filters application failed"
 	},
@@ -99,6 +105,7 @@ STEPS_CONFIG = {
 		"step": 9,
 		"func": get_page_info,
 		"transitions": {"page info extracted": "extract_job_details", "pagination not found": "extract_job_details", "failed extracting page info": "get_page_info", "jobs page missing": "get_page_info"},
+		"retry": {"max_attempts": 3, "backoff": 2, "on_exhausted": "extract_job_details"},
 		"timeout": 20,
 		"on_timeout_event": "failed extracting page info"
 	},
@@ -111,6 +118,7 @@ STEPS_CONFIG = {
 			"no job cards found": "navigate_to_next_page",
 			"failed extracting jobs": "extract_job_details"
 		},
+		"retry": {"max_attempts": 3, "backoff": 3, "on_exhausted": "navigate_to_next_page"},
 		"timeout": 60,
 		"on_timeout_event": "failed extracting jobs"
 	},
@@ -132,6 +140,7 @@ STEPS_CONFIG = {
 		"step": 13,
 		"func": extract_job_description,
 		"transitions": {"job description extracted": "attempt_easy_apply", "could not find description": "continue_processing", "jobs page missing": "extract_job_description"},
+		"retry": {"max_attempts": 3, "backoff": 2, "on_exhausted": "continue_processing"},
 		"timeout": 30,
 		"on_timeout_event": "could not find description"
 	},
@@ -144,6 +153,7 @@ STEPS_CONFIG = {
 			"no jobs page found": "open_jobs_page",
 			"no job to process": "continue_processing",
 			"job card not found": "continue_processing",
+			"job blacklisted": "continue_processing",
 			"no easy apply button found": "external_apply",
 			"failed to click easy apply": "external_apply",
 			"easy apply process error": "continue_processing"
@@ -155,6 +165,7 @@ STEPS_CONFIG = {
 		"step": 15,
 		"func": upload_resume,
 		"transitions": {"resume uploaded successfully": "answer_questions", "no resume path configured": "answer_questions", "resume file not found": "answer_questions", "proceeding without resume": "answer_questions", "jobs page missing": "upload_resume"},
+		"retry": {"max_attempts": 2, "backoff": 2, "on_exhausted": "answer_questions"},
 		"timeout": 30,
 		"on_timeout_event": "proceeding without resume"
 	},
@@ -162,6 +173,7 @@ STEPS_CONFIG = {
 		"step": 16,
 		"func": answer_questions,
 		"transitions": {"finished answering questions": "submit_application", "error answering questions": "answer_questions", "jobs page missing": "answer_questions"},
+		"retry": {"max_attempts": 2, "backoff": 2, "on_exhausted": "application_failed"},
 		"timeout": 60,
 		"on_timeout_event": "error answering questions"
 	},
@@ -169,13 +181,15 @@ STEPS_CONFIG = {
 		"step": 17,
 		"func": submit_application,
 		"transitions": {"proceeding to save job": "save_applied_job", "application failed to submit": "application_failed", "submit application error": "submit_application", "no jobs page found": "submit_application"},
-		"timeout": 30,
+		"retry": {"max_attempts": 2, "backoff": 3, "on_exhausted": "application_failed"},
+		"timeout": 90,
 		"on_timeout_event": "submit application error"
 	},
 	"save_applied_job": {
 		"step": 18,
 		"func": save_applied_job,
-		"transitions": {"job saved": "continue_processing", "saving job failed": "save_applied_job"},
+		"transitions": {"job saved": "continue_processing", "no job to save": "continue_processing", "saving job failed": "save_applied_job"},
+		"retry": {"max_attempts": 3, "backoff": 1, "on_exhausted": "continue_processing"},
 		"timeout": 20,
 		"on_timeout_event": "saving job failed"
 	},
@@ -183,20 +197,23 @@ STEPS_CONFIG = {
 		"step": 19,
 		"func": external_apply,
 		"transitions": {"external apply clicked": "save_external_job", "external apply failed": "application_failed", "no apply button found": "application_failed", "external apply process error": "external_apply", "jobs page missing": "external_apply"},
+		"retry": {"max_attempts": 2, "backoff": 2, "on_exhausted": "application_failed"},
 		"timeout": 30,
 		"on_timeout_event": "external apply process error"
 	},
 	"save_external_job": {
 		"step": 20,
 		"func": save_external_job,
-		"transitions": {"external job saved": "continue_processing", "saving external job failed": "save_external_job"},
+		"transitions": {"external job saved": "continue_processing", "no external job": "continue_processing", "saving external job failed": "save_external_job"},
+		"retry": {"max_attempts": 3, "backoff": 1, "on_exhausted": "continue_processing"},
 		"timeout": 20,
 		"on_timeout_event": "saving external job failed"
 	},
 	"application_failed": {
 		"step": 21,
 		"func": application_failed,
-		"transitions": {"application marked failed": "continue_processing", "failed to mark application failed": "application_failed"},
+		"transitions": {"application marked failed": "continue_processing", "no job to mark": "continue_processing", "failed to mark application failed": "application_failed"},
+		"retry": {"max_attempts": 3, "backoff": 1, "on_exhausted": "continue_processing"},
 		"timeout": 20,
 		"on_timeout_event": "failed to mark application failed"
 	},
@@ -210,7 +227,7 @@ STEPS_CONFIG = {
 	"navigate_to_next_page": {
 		"step": 23,
 		"func": navigate_to_next_page,
-		"transitions": {"page navigated": "extract_job_details", "no more pages": "finish", "navigation error": "finish"},
+		"transitions": {"page navigated": "extract_job_details", "no more pages": "finish", "navigation error": "finish", "jobs page missing": "open_jobs_page"},
 		"timeout": 30,
 		"on_timeout_event": "navigation error"
 	},
@@ -1,10 +1,19 @@
 from __future__ import annotations
-import asyncio
 import json
 import os
 from typing import Any, Dict, AsyncGenerator
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from helpers.config_manager import load_settings
+from ..events import LinkedInEvent, Progress
+from ..answer_kb import get_answer_kb, match_option, normalize_question
+from ..form_fill import apply_fills, read_form_values
+from ..rate_governor import pace
+from ..session_cache import restore_session, save_session
+from ..description_cache import get_description_cache
+from ..tab_manager import get_tab_manager, stop_tab_manager
+from ..memory_watchdog import between_jobs
+from ..waits import wait_until_stable
 
 SELECTORS: Dict[str, Any] = {}
 
@@ -45,12 +54,10 @@ async def scroll_to_view(page, target, top: bool = False, smooth: bool = False)
 		loc = page.locator(target) if isinstance(target, str) else target
 		if await loc.count() == 0:
 			return
-		handle = await loc.first.element_handle()
-		if not handle:
-			return
 		block = "start" if top else "center"
 		behavior = "smooth" if smooth else "auto"
-		await page.evaluate("(el, b, beh) => el.scrollIntoView({block: b, behavior: beh})", handle, block, behavior)
+		# Evaluate on the locator rather than an element handle, which would stay alive until disposed
+		await loc.first.evaluate("(el, [b, beh]) => el.scrollIntoView({block: b, behavior: beh})", [block, behavior])
 	except Exception:
 		pass
 
@@ -60,6 +67,14 @@ async def open_check_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	print("LinkedIn Step0: open and check login")
 	context = ctx["browser_context"]
 	await ensure_selectors(ctx)
+	if not ctx.get("account"):
+		secrets = load_settings(str(ctx.get("base_dir", ".")), "linkedin").get("secrets", {})
+		ctx["account"] = ((secrets.get("username") or {}).get("value") or "").strip() or None
+	# Warm start: a cached session that still checks out skips the home page probe
+	if await restore_session(ctx, "linkedin"):
+		print("[linkedin.step0] Restored cached session")
+		yield "login not needed"
+		return
 	try:
 		# Use an existing non-UI page if available
 		page = ctx.get("page")
@@ -70,8 +85,9 @@ async def open_check_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 					break
 		if page is None:
 			print("[linkedin.step0] No available page to use; waiting")
-			yield "no_page_available"
+			yield LinkedInEvent.NO_AVAILABLE_PAGE
 			return
+		await pace(ctx, "linkedin", "navigate")
 		await page.goto(SELECTORS.get("home_url", "https://www.linkedin.com/"), wait_until="domcontentloaded")
 		ctx["page"] = page
 		yield "home page loaded"
@@ -83,6 +99,7 @@ async def open_check_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	try:
 		# Check if already on feed (logged in)
 		if page.url.startswith(SELECTORS["feed_url"]):
+			await save_session(ctx, "linkedin")
 			yield "login not needed"
 			return
 			
@@ -131,8 +148,11 @@ async def credential_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		print("[linkedin.step1] Missing credentials in config; require manual login")
 		yield "no login credentials found"
 		return
+	# Rate governor buckets are per account
+	ctx["account"] = username
 
 	try:
+		await pace(ctx, "linkedin", "navigate")
 		await page.goto(SELECTORS.get("login_url", "https://www.linkedin.com/login"), wait_until="domcontentloaded")
 		yield "login page loaded successfully"
 		
@@ -141,7 +161,7 @@ async def credential_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 			yield "username filled successfully"
 		except Exception:
 			print("[linkedin.step1] username input not found")
-			yield "username_input_not_found"
+			yield LinkedInEvent.USERNAME_INPUT_NOT_FOUND
 			return
 			
 		try:
@@ -149,10 +169,11 @@ async def credential_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 			yield "password filled successfully"
 		except Exception:
 			print("[linkedin.step1] password input not found")
-			yield "password_input_not_found"
+			yield LinkedInEvent.PASSWORD_INPUT_NOT_FOUND
 			return
 			
 		try:
+			await pace(ctx, "linkedin", "click")
 			await page.locator(f"xpath={SELECTORS['signin_button_xpath']}").click()
 			yield "signin button clicked"
 		except Exception as e:
@@ -163,6 +184,7 @@ async def credential_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 		# Wait for redirect to feed
 		try:
 			await page.wait_for_url(SELECTORS.get("feed_url", "https://www.linkedin.com/feed/") + "*")
+			await save_session(ctx, "linkedin")
 			yield "login successful, on feed"
 			return
 		except Exception:
@@ -170,6 +192,7 @@ async def credential_login(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 
 		# Fallback: check if on feed page
 		if page.url.startswith(SELECTORS.get("feed_url", "https://www.linkedin.com/feed/")):
+			await save_session(ctx, "linkedin")
 			yield "on feed, login successful"
 			return
 
@@ -187,20 +210,16 @@ async def open_jobs_page(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 	context = ctx["browser_context"]
 	await ensure_selectors(ctx)
 	try:
-		# Close other LinkedIn pages (except potential UI page)
-		for p in list(context.pages):
-			try:
-				if p is ctx.get("jobs_page"):
-					continue
-				u = p.url or ""
-				if "linkedin.com" in u and "127.0.0.1:6666" not in u:
-					await p.close()
-			except Exception:
-				pass
-		# Create fresh Jobs page
-		jobs_page = await context.new_page()
+		tabs = get_tab_manager(ctx)
+		# Close other LinkedIn pages (the dashboard UI page is protected by the tab manager)
+		old_jobs_page = ctx.get("jobs_page")
+		await tabs.close_where(lambda tab: tab.page is not old_jobs_page and "linkedin.com" in (tab.page.url or ""))
+		# Create fresh Jobs page, then drop the one it replaces
+		jobs_page = await tabs.new_page("open_jobs_page", "jobs")
+		await pace(ctx, "linkedin", "navigate")
 		await jobs_page.goto(SELECTORS.get("jobs_url", "https://www.linkedin.com/jobs/"), wait_until="domcontentloaded")
 		ctx["jobs_page"] = jobs_page
+		await tabs.close(old_jobs_page)
 		yield "jobs page loaded"
 	except Exception as e:
 		print(f"[linkedin.open_jobs_page] error: {e}")
@@ -237,7 +256,7 @@ async def show_manual_login_prompt(ctx: Dict[str, Any]) -> AsyncGenerator[str, N
 				break
 				
 		if ui_page is None:
-			ui_page = await context.new_page()
+			ui_page = await get_tab_manager(ctx).new_page("show_manual_login_prompt", "dashboard", pinned=True)
 			try:
 				await ui_page.goto("http://127.0.0.1:6666/")
 			except Exception:
@@ -764,7 +783,7 @@ async def extract_job_details(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         else:
             print("[extract_job_details] No job cards found with any selector")
             ctx["extracted_jobs"] = []
-            yield "no_job_cards_found"
+            yield LinkedInEvent.NO_JOB_CARDS_FOUND
             return
 
         print(f"[extract_job_details] Total job cards found: {job_count}")
@@ -969,7 +988,59 @@ async def process_jobs(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         
     except Exception as e:
         print(f"[linkedin.process_jobs] error: {e}")
-        yield "finish"
+        yield LinkedInEvent.ERROR_PROCESSING_JOBS
+
+
+JOB_DETAILS_PANEL_SELECTOR = ".jobs-details__main-content"
+EASY_APPLY_MODAL_SELECTOR = ".jobs-easy-apply-modal, [role='dialog']"
+
+
+async def wait_for_job_details(page, job_id: str | None, timeout_ms: int = 3000) -> bool:
+    """
+    Wait until the details panel shows the clicked job and has stopped re-rendering
+    """
+    return await wait_until_stable(page, JOB_DETAILS_PANEL_SELECTOR, quiet_ms=250, min_text_length=50,
+                                   timeout_ms=timeout_ms, arg=str(job_id or ""),
+                                   predicate="!arg || location.href.includes('currentJobId=' + arg)")
+
+
+def cached_about_company(job_id: str | None) -> str | None:
+    """
+    About-company text recorded for this job on an earlier run, if any
+    """
+    return (get_description_cache().get("linkedin", job_id) or {}).get("about_company")
+
+
+async def read_about_company(page, job_id: str | None) -> str | None:
+    """
+    Read the about-company box of the open job and record it in the description cache
+    """
+    try:
+        about_company_element = page.locator(".jobs-company__box")
+        if await about_company_element.count() == 0:
+            return None
+        about_company_text = await about_company_element.inner_text()
+    except Exception as e:
+        print(f"[linkedin.read_about_company] error: {e}")
+        return None
+    if job_id:
+        description_cache = get_description_cache()
+        description_cache.update("linkedin", job_id, about_company=about_company_text)
+        description_cache.save()
+    return about_company_text
+
+
+def blacklisted_word(ctx: Dict[str, Any], about_company_text: str | None) -> str | None:
+    """
+    First about_company_bad_words entry found in the about-company text
+    """
+    if not about_company_text:
+        return None
+    settings = load_settings(str(ctx.get("base_dir", ".")), "linkedin")
+    for word in (settings.get("search", {}) or {}).get("about_company_bad_words", []) or []:
+        if word.lower() in about_company_text.lower():
+            return word
+    return None
 
 
 async def check_job_blacklist(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
@@ -992,33 +1063,27 @@ async def check_job_blacklist(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
             yield "job not blacklisted"
             return
         
-        # Click on job to load details
-        job_card = page.locator(f"[data-occludable-job-id='{job_info['job_id']}']")
-        if await job_card.count() > 0:
-            await job_card.click()
-            await asyncio.sleep(2)  # Wait for details to load
-        
-        # Extract about company text
-        about_company_element = page.locator(".jobs-company__box")
-        if await about_company_element.count() > 0:
-            about_company_text = await about_company_element.inner_text()
-            
-            # Load blacklisted words from settings - look in search section
-            settings = load_settings(str(ctx.get("base_dir", ".")), "linkedin")
-            search_settings = settings.get("search", {})
-            blacklisted_words = search_settings.get("about_company_bad_words", [])
-            
-            # Check for blacklisted words
-            for word in blacklisted_words:
-                if word.lower() in about_company_text.lower():
-                    # Add to rejected jobs
-                    rejected_jobs = ctx.get("rejected_jobs", set())
-                    rejected_jobs.add(job_info["job_id"])
-                    ctx["rejected_jobs"] = rejected_jobs
-                    
-                    print(f"[linkedin.check_job_blacklist] Job {job_info['job_id']} contains blacklisted word: {word}")
-                    yield "job blacklisted"
-                    return
+        # A cached record lets the check run without opening the job
+        about_company_text = cached_about_company(job_info.get("job_id"))
+        if about_company_text is None:
+            job_card = page.locator(f"[data-occludable-job-id='{job_info['job_id']}']")
+            if await job_card.count() > 0:
+                await pace(ctx, "linkedin", "click")
+                await job_card.click()
+                await wait_for_job_details(page, job_info.get("job_id"))
+            about_company_text = await read_about_company(page, job_info.get("job_id"))
+
+        if about_company_text is not None:
+            word = blacklisted_word(ctx, about_company_text)
+            if word:
+                # Add to rejected jobs
+                rejected_jobs = ctx.get("rejected_jobs", set())
+                rejected_jobs.add(job_info["job_id"])
+                ctx["rejected_jobs"] = rejected_jobs
+                
+                print(f"[linkedin.check_job_blacklist] Job {job_info['job_id']} contains blacklisted word: {word}")
+                yield "job blacklisted"
+                return
             
             print(f"[linkedin.check_job_blacklist] Job {job_info['job_id']} passed blacklist check")
             yield "job not blacklisted"
@@ -1046,11 +1111,22 @@ async def extract_job_description(ctx: Dict[str, Any]) -> AsyncGenerator[str, No
         return
 
     try:
-        # Wait for job description to load
-        description_element = page.locator(".jobs-box__html-content")
-        if await description_element.count() > 0:
-            job_description = await description_element.inner_text()
-            
+        job_id = (ctx.get("current_job") or {}).get("job_id")
+        description_cache = get_description_cache()
+        cached = description_cache.get("linkedin", job_id) or {}
+        job_description = cached.get("description")
+        experience_required = cached.get("experience_required")
+        if job_description is None:
+            description_element = page.locator(".jobs-box__html-content")
+            if await description_element.count() > 0:
+                job_description = await description_element.inner_text()
+                experience_required = extract_years_of_experience(job_description)
+                description_cache.update("linkedin", job_id, description=job_description, experience_required=experience_required)
+                description_cache.save()
+        else:
+            print(f"[linkedin.extract_job_description] Using cached description for job {job_id}")
+
+        if job_description is not None:
             # Load bad words from settings - look in search section
             settings = load_settings(str(ctx.get("base_dir", ".")), "linkedin")
             search_settings = settings.get("search", {})
@@ -1063,8 +1139,8 @@ async def extract_job_description(ctx: Dict[str, Any]) -> AsyncGenerator[str, No
                     yield "could not find description"
                     return
             
-            # Extract experience requirements
-            experience_required = extract_years_of_experience(job_description)
+            if experience_required is None:
+                experience_required = extract_years_of_experience(job_description)
             
             ctx["job_description"] = job_description
             ctx["experience_required"] = experience_required
@@ -1123,19 +1199,32 @@ async def attempt_easy_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         company = job_info.get("company", "Unknown")
         
         print(f"[linkedin.attempt_easy_apply] Processing job: {job_title} at {company} (ID: {job_id})")
-        yield f"processing job: {job_title} at {company}"
+        yield Progress("processing job: {} at {}", job_title, company)
         
+        # A job already seen with a blacklisted company is skipped without opening it
+        word = blacklisted_word(ctx, cached_about_company(job_id))
+        if word:
+            print(f"[linkedin.attempt_easy_apply] Job {job_id} contains blacklisted word: {word} (cached)")
+            yield LinkedInEvent.JOB_BLACKLISTED
+            return
+
         # First, click on the job to load its details
         if job_id:
             job_card = page.locator(f"[data-occludable-job-id='{job_id}']")
             if await job_card.count() > 0:
+                await pace(ctx, "linkedin", "click")
                 await job_card.click()
                 print(f"[linkedin.attempt_easy_apply] Clicked on job {job_id} to load details")
                 yield "job details loaded"
-                await asyncio.sleep(2)  # Wait for job details to load
+                await wait_for_job_details(page, job_id)
+                word = blacklisted_word(ctx, await read_about_company(page, job_id))
+                if word:
+                    print(f"[linkedin.attempt_easy_apply] Job {job_id} contains blacklisted word: {word}")
+                    yield LinkedInEvent.JOB_BLACKLISTED
+                    return
             else:
                 print(f"[linkedin.attempt_easy_apply] Could not find job card for ID {job_id}")
-                yield "job_card_not_found"
+                yield LinkedInEvent.JOB_CARD_NOT_FOUND
                 return
         
         # Look for Easy Apply button - try multiple selectors
@@ -1161,7 +1250,7 @@ async def attempt_easy_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                     easy_apply_button = button.first
                     selected_selector = selector
                     print(f"[linkedin.attempt_easy_apply] Found Easy Apply button with selector: {selector}")
-                    yield f"easy apply button found: {selector}"
+                    yield Progress("easy apply button found: {}", selector)
                     break
             except Exception as e:
                 print(f"[linkedin.attempt_easy_apply] Error checking selector '{selector}': {e}")
@@ -1171,13 +1260,14 @@ async def attempt_easy_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
             try:
                 # Scroll to button and click
                 await scroll_to_view(page, easy_apply_button, top=True)
-                await asyncio.sleep(1)  # Small delay to ensure element is stable
+                await pace(ctx, "linkedin", "click")
                 await easy_apply_button.click()
+                ctx["linkedin_auto_answers"] = {}
                 print("[linkedin.attempt_easy_apply] Successfully clicked Easy Apply button")
                 yield "easy apply button clicked"
                 
-                # Wait for modal to appear
-                await asyncio.sleep(2)
+                # Wait for modal to appear and finish rendering its first page
+                await wait_until_stable(page, present=EASY_APPLY_MODAL_SELECTOR, quiet_ms=250, timeout_ms=5000)
                 yield "application modal opened"
                 yield "proceeding to resume upload"
             except Exception as e:
@@ -1251,8 +1341,8 @@ async def upload_resume(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                 await file_input.set_input_files(resume_path)
                 print(f"[linkedin.upload_resume] Successfully uploaded resume: {os.path.basename(resume_path)}")
                 
-                # Wait for upload to complete
-                await asyncio.sleep(2)
+                # Wait for the modal to finish showing the uploaded file
+                await wait_until_stable(page, EASY_APPLY_MODAL_SELECTOR, quiet_ms=300, timeout_ms=5000)
                 
                 # Store resume info in context
                 ctx["uploaded_resume"] = os.path.basename(resume_path)
@@ -1271,6 +1361,116 @@ async def upload_resume(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         yield "proceeding without resume"
 
 
+# One pass over every Easy Apply form element: type (same precedence as determine_question_type),
+# its own question label, options, current value and how to address the control
+EASY_APPLY_FIELDS_SCRIPT = """
+(selector) => Array.from(document.querySelectorAll(selector)).map((el, index) => {
+    const q = (sel) => el.querySelector(sel);
+    const text = (node) => node ? (node.innerText || node.textContent || '').trim() : '';
+    let type = 'unknown';
+    let control = null;
+    if ((control = q('select'))) type = 'select';
+    else if ((control = q("input[type='radio']"))) type = 'radio';
+    else if ((control = q("input[type='text']"))) type = 'text';
+    else if ((control = q('textarea'))) type = 'textarea';
+    else if ((control = q("input[type='checkbox']"))) type = 'checkbox';
+
+    let options = [];
+    let value = null;
+    if (type === 'select') {
+        options = Array.from(control.options).map(o => text(o))
+            .filter(t => t && t.toLowerCase() !== 'select an option');
+        value = control.selectedIndex > 0 ? text(control.options[control.selectedIndex]) : null;
+    } else if (type === 'radio') {
+        const radios = Array.from(el.querySelectorAll("input[type='radio']"));
+        const labelOf = (r) => (r.labels && r.labels.length ? text(r.labels[0]) : '') || r.value;
+        options = radios.map(labelOf);
+        const checked = radios.find(r => r.checked);
+        value = checked ? labelOf(checked) : null;
+    } else if (type === 'checkbox') {
+        value = control.checked;
+    } else if (control) {
+        value = control.value || null;
+    }
+    return {
+        index,
+        type,
+        question: text(q('legend, label')),
+        options,
+        value,
+        id: control ? control.id || null : null,
+        name: control ? control.getAttribute('name') : null
+    };
+})
+"""
+
+
+def easy_apply_fill(field: Dict[str, Any], answer: str) -> Dict[str, Any] | None:
+    """
+    Turn a generated answer into a form_fill spec for one Easy Apply form element
+    """
+    question_type = field.get("type")
+    options = field.get("options") or []
+    if question_type in ("text", "textarea"):
+        if not answer:
+            return None
+        value: Any = answer
+    elif question_type in ("select", "radio"):
+        # Same fallback as fill_answer: the first real option when the answer is not offered
+        value = match_option(answer, options) or (options[0] if options else None)
+        if value is None:
+            return None
+    elif question_type == "checkbox":
+        value = normalize_question(answer) in ("checked", "yes", "true")
+    else:
+        return None
+
+    spec: Dict[str, Any] = {"type": question_type, "value": value}
+    # Radios are addressed as a group by name; everything else by its own id
+    if question_type == "radio" and field.get("name"):
+        spec["name"] = field["name"]
+    elif field.get("id"):
+        spec["id"] = field["id"]
+    elif field.get("name"):
+        spec["name"] = field["name"]
+    else:
+        return None
+    return spec
+
+
+async def answer_questions_batched(page, ctx: Dict[str, Any], user_info: Dict[str, str], answer_kb, auto_answers: Dict[str, Any]):
+    """
+    Read every form element in one evaluate, answer in Python and apply all fills in a second one.
+    Returns (filled, total).
+    """
+    fields = await page.evaluate(EASY_APPLY_FIELDS_SCRIPT, "[data-test-form-element]")
+    print(f"[linkedin.answer_questions] Found {len(fields)} form elements to process")
+    fills = []
+    for field in fields:
+        question_type = field.get("type")
+        if question_type == "unknown":
+            continue
+        question_text = field.get("question") or ""
+        known = answer_kb.resolve(question_text, field.get("options") or None) if question_text else None
+        if known:
+            answer = known["option"] or known["answer"]
+            print(f"[linkedin.answer_questions] Known answer for '{question_text}': {answer} ({known['score']:.2f})")
+        else:
+            answer = await generate_answer(question_type, ctx, user_info, label_text=question_text.lower())
+        spec = easy_apply_fill(field, answer)
+        if spec is None:
+            continue
+        fills.append(spec)
+        if question_text:
+            auto_answers[normalize_question(question_text)] = spec["value"]
+
+    results = await apply_fills(page, fills)
+    for spec, result in zip(fills, results):
+        if not result.get("ok"):
+            print(f"[linkedin.answer_questions] Could not fill {spec.get('id') or spec.get('name')}: {result.get('reason', 'not applied')}")
+    return sum(1 for r in results if r.get("ok")), len(fields)
+
+
 async def answer_questions(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
     """
     Answer questions in the Easy Apply modal
@@ -1305,6 +1505,29 @@ async def answer_questions(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
             secrets_settings = settings.get("secrets", {})
             email = ((secrets_settings.get("username") or {}).get("value") or "").strip()
         
+        user_info = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "full_name": full_name,
+            "phone_number": phone_number,
+            "email": email,
+            "years_of_experience": years_of_experience
+        }
+        # Shared with Seek; learned answers take priority over the label heuristics below
+        ctx["linkedin_user_info"] = user_info
+        answer_kb = get_answer_kb()
+        answer_kb.seed_profile(user_info)
+        auto_answers = ctx.setdefault("linkedin_auto_answers", {})
+        
+        try:
+            filled, total = await answer_questions_batched(page, ctx, user_info, answer_kb, auto_answers)
+            answer_kb.save()
+            print(f"[linkedin.answer_questions] Batched fill: {filled}/{total} form elements answered")
+            yield "finished answering questions"
+            return
+        except Exception as e:
+            print(f"[linkedin.answer_questions] Batched fill failed ({e}); answering element by element")
+        
         # Find all form elements
         form_elements = page.locator("[data-test-form-element]")
         form_count = await form_elements.count()
@@ -1317,21 +1540,23 @@ async def answer_questions(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                 
                 # Determine question type and answer accordingly
                 question_type = await determine_question_type(element)
-                answer = await generate_answer(question_type, ctx, {
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "full_name": full_name,
-                    "phone_number": phone_number,
-                    "email": email,
-                    "years_of_experience": years_of_experience
-                })
+                question_text, options = await read_question(element, question_type)
+                known = answer_kb.resolve(question_text, options) if question_text else None
+                if known:
+                    answer = known["option"] or known["answer"]
+                    print(f"[linkedin.answer_questions] Known answer for '{question_text}': {answer} ({known['score']:.2f})")
+                else:
+                    answer = await generate_answer(question_type, ctx, user_info, label_text=question_text.lower())
                 
                 await fill_answer(element, answer, question_type)
+                if question_text:
+                    auto_answers[normalize_question(question_text)] = answer
                 
             except Exception as e:
                 print(f"[linkedin.answer_questions] Error processing form element {i}: {e}")
                 continue
         
+        answer_kb.save()
         print("[linkedin.answer_questions] Finished answering questions")
         yield "finished answering questions"
         
@@ -1340,6 +1565,46 @@ async def answer_questions(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         yield "error answering questions"
 
 
+async def read_question(element, question_type: str):
+    """
+    Return the question text of a form element and, for selects and radios, its option labels
+    """
+    try:
+        question = element.locator("legend, label")
+        question_text = (await question.first.inner_text()).strip() if await question.count() > 0 else ""
+        options = []
+        if question_type == "select":
+            options = [o.strip() for o in await element.locator("select option").all_inner_texts()]
+            options = [o for o in options if o and o.lower() != "select an option"]
+        elif question_type == "radio":
+            options = [o.strip() for o in await element.locator("input[type='radio'] + label, label[for]").all_inner_texts()]
+        return question_text, options
+    except Exception:
+        return "", []
+
+
+async def learn_manual_answers(ctx: Dict[str, Any], page) -> None:
+    """
+    Teach the answer knowledge base what the user typed or changed in the Easy Apply modal
+    """
+    try:
+        values = await read_form_values(page, root=".jobs-easy-apply-modal")
+        auto_answers = ctx.get("linkedin_auto_answers", {})
+        manual = []
+        for entry in values or []:
+            question = normalize_question(entry.get("question") or entry.get("label"))
+            value = entry.get("text") or entry.get("value")
+            # Skip what answer_questions filled in itself
+            if question in auto_answers and normalize_question(value) == normalize_question(auto_answers[question]):
+                continue
+            manual.append(entry)
+        answer_kb = get_answer_kb()
+        if answer_kb.learn_from_form_values(manual, source="linkedin"):
+            answer_kb.save()
+    except Exception as e:
+        print(f"[linkedin.learn_manual_answers] error: {e}")
+
+
 async def determine_question_type(element) -> str:
     """
     Determine the type of question/form element
@@ -1375,16 +1640,17 @@ async def determine_question_type(element) -> str:
         return "unknown"
 
 
-async def generate_answer(question_type: str, ctx: Dict[str, Any], user_info: Dict[str, str]) -> str:
+async def generate_answer(question_type: str, ctx: Dict[str, Any], user_info: Dict[str, str], label_text: str | None = None) -> str:
     """
     Generate appropriate answer based on question type and user information
     """
     try:
-        # Get question label to determine what to answer
-        label_element = ctx.get("jobs_page").locator("label")
-        label_text = ""
-        if await label_element.count() > 0:
-            label_text = (await label_element.first.inner_text()).lower()
+        if label_text is None:
+            # Get question label to determine what to answer
+            label_element = ctx.get("jobs_page").locator("label")
+            label_text = ""
+            if await label_element.count() > 0:
+                label_text = (await label_element.first.inner_text()).lower()
         
         if question_type == "text":
             if "name" in label_text:
@@ -1454,9 +1720,12 @@ async def fill_answer(element, answer: str, question_type: str) -> None:
                     await select_element.first.select_option(index=1)
         
         elif question_type == "radio":
-            # Click first radio button
+            # Click the radio labelled with the answer, else the first one
+            radio_label = element.locator("label").filter(has_text=answer) if answer else None
             radio_buttons = element.locator("input[type='radio']")
-            if await radio_buttons.count() > 0:
+            if radio_label is not None and await radio_label.count() > 0:
+                await radio_label.first.click()
+            elif await radio_buttons.count() > 0:
                 await radio_buttons.first.click()
         
         elif question_type == "checkbox":
@@ -1471,6 +1740,66 @@ async def fill_answer(element, answer: str, question_type: str) -> None:
         print(f"[linkedin.fill_answer] Error filling answer: {e}")
 
 
+MAX_EASY_APPLY_PAGES = 12
+MODAL_PAGE_CHANGE_TIMEOUT = 5.0
+
+# Current Easy Apply modal page in one evaluate: a signature that changes with the page,
+# inline validation errors and which of Next / Review / Submit are offered
+EASY_APPLY_MODAL_STATE_SCRIPT = """
+() => {
+    const modal = document.querySelector('.jobs-easy-apply-modal') || document.querySelector("[role='dialog']");
+    if (!modal) return null;
+    const text = (node) => node ? (node.innerText || node.textContent || '').trim() : '';
+    const buttons = Array.from(modal.querySelectorAll('button'));
+    const offers = (re) => buttons.some(b => re.test(text(b)) || re.test(b.getAttribute('aria-label') || ''));
+    const progress = modal.querySelector('progress, [role="progressbar"]');
+    const questions = Array.from(modal.querySelectorAll('[data-test-form-element]'))
+        .map(el => text(el.querySelector('legend, label')));
+    return {
+        signature: [
+            progress ? (progress.getAttribute('value') || progress.getAttribute('aria-valuenow') || '') : '',
+            text(modal.querySelector('h3')),
+            questions.join('|')
+        ].join('#'),
+        errors: Array.from(modal.querySelectorAll('.artdeco-inline-feedback--error, [data-test-form-element-error-messages]'))
+            .map(text).filter(Boolean),
+        hasNext: offers(/^next$|continue to next step/i),
+        hasReview: offers(/^review$|review your application/i),
+        hasSubmit: offers(/submit application/i)
+    };
+}
+"""
+
+
+async def easy_apply_modal_state(page) -> Dict[str, Any] | None:
+    """
+    Snapshot the Easy Apply modal page, or None when no modal is open
+    """
+    try:
+        return await page.evaluate(EASY_APPLY_MODAL_STATE_SCRIPT)
+    except Exception as e:
+        print(f"[linkedin.easy_apply_modal_state] error: {e}")
+        return None
+
+
+# The page-change condition of wait_for_modal_page_change, checked in the page against arg (the before state).
+# Errors left over from the previous click only count once they have had time to re-render.
+MODAL_PAGE_CHANGED_PREDICATE = (
+    "((s) => !s || s.signature !== arg.signature"
+    " || (s.errors.length > 0 && (s.errors.join('\\n') !== arg.errors.join('\\n') || elapsed > 1000)))"
+    "((" + EASY_APPLY_MODAL_STATE_SCRIPT.strip() + ")())"
+)
+
+
+async def wait_for_modal_page_change(page, before: Dict[str, Any], timeout: float = MODAL_PAGE_CHANGE_TIMEOUT) -> Dict[str, Any] | None:
+    """
+    Wait in the page until the modal's page signature changes, validation errors show up, or timeout
+    """
+    await wait_until_stable(page, quiet_ms=0, timeout_ms=int(timeout * 1000),
+                            predicate=MODAL_PAGE_CHANGED_PREDICATE, arg=before)
+    return await easy_apply_modal_state(page)
+
+
 async def submit_application(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
     """
     Submit the Easy Apply application
@@ -1491,38 +1820,73 @@ async def submit_application(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         company = job_info.get("company", "Unknown")
         
         print(f"[linkedin.submit_application] Submitting application for: {job_title} at {company}")
-        yield f"submitting application: {job_title} at {company}"
+        yield Progress("submitting application: {} at {}", job_title, company)
         
-        # First, check if there are any "Next" buttons to click through
+        # Walk the modal pages: answer each new page, click Next/Review, wait for the page to change
         next_button_selectors = [
             "button:has-text('Next')",
             "//button[normalize-space()='Next']",
             "button[aria-label*='Next']",
-            "//button[contains(@aria-label, 'Next')]"
+            "//button[contains(@aria-label, 'Next')]",
+            "button[aria-label='Review your application']",
+            "button:has-text('Review')"
         ]
         
-        next_clicked = True
         next_count = 0
-        while next_clicked:
-            next_clicked = False
+        user_info = ctx.get("linkedin_user_info") or {}
+        answer_kb = get_answer_kb()
+        auto_answers = ctx.setdefault("linkedin_auto_answers", {})
+        state = await easy_apply_modal_state(page)
+        # answer_questions already filled the first page
+        answered_signature = state["signature"] if state else None
+        retried_signature = None
+        while state and not state["hasSubmit"] and (state["hasNext"] or state["hasReview"]):
+            if next_count >= MAX_EASY_APPLY_PAGES:
+                print(f"[linkedin.submit_application] Gave up after {next_count} modal pages")
+                yield LinkedInEvent.APPLICATION_FAILED_TO_SUBMIT
+                return
+            if state["signature"] != answered_signature:
+                filled, total = await answer_questions_batched(page, ctx, user_info, answer_kb, auto_answers)
+                answered_signature = state["signature"]
+                yield Progress("answered modal page {}: {}/{}", next_count + 1, filled, total)
+            await learn_manual_answers(ctx, page)
+            
+            clicked_selector = None
             for selector in next_button_selectors:
                 try:
                     next_btn = page.locator(selector)
-                    count = await next_btn.count()
-                    if count > 0:
+                    if await next_btn.count() > 0:
+                        await pace(ctx, "linkedin", "click")
                         await next_btn.first.click()
-                        next_count += 1
-                        print(f"[linkedin.submit_application] Clicked Next button #{next_count} using selector: {selector}")
-                        yield f"clicked next button: {next_count}"
-                        await asyncio.sleep(1)
-                        next_clicked = True
+                        clicked_selector = selector
                         break
                 except Exception as e:
                     print(f"[linkedin.submit_application] Error clicking Next with selector '{selector}': {e}")
                     continue
+            if clicked_selector is None:
+                break
+            next_count += 1
+            print(f"[linkedin.submit_application] Clicked Next button #{next_count} using selector: {clicked_selector}")
+            yield Progress("clicked next button: {}", next_count)
+            
+            new_state = await wait_for_modal_page_change(page, state)
+            if new_state and new_state["signature"] == state["signature"]:
+                # Still on the same page: answer what is left (required fields) once and click again
+                if new_state["errors"] and retried_signature != state["signature"]:
+                    print(f"[linkedin.submit_application] Validation errors: {new_state['errors']}")
+                    retried_signature = state["signature"]
+                    answered_signature = None
+                    state = new_state
+                    continue
+                print(f"[linkedin.submit_application] Modal page could not be completed: {new_state['errors'] or 'page did not change'}")
+                answer_kb.save()
+                yield LinkedInEvent.APPLICATION_FAILED_TO_SUBMIT
+                return
+            state = new_state
+        answer_kb.save()
         
         if next_count > 0:
-            yield f"next buttons completed: {next_count}"
+            yield Progress("next buttons completed: {}", next_count)
         
         # Look for Submit button
         submit_selectors = [
@@ -1547,7 +1911,7 @@ async def submit_application(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                     submit_button = button.first
                     selected_submit_selector = selector
                     print(f"[linkedin.submit_application] Found Submit button with selector: {selector}")
-                    yield f"submit button found: {selector}"
+                    yield Progress("submit button found: {}", selector)
                     break
             except Exception as e:
                 print(f"[linkedin.submit_application] Error checking selector '{selector}': {e}")
@@ -1555,12 +1919,15 @@ async def submit_application(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         
         if submit_button:
             try:
+                await learn_manual_answers(ctx, page)
+                await pace(ctx, "linkedin", "apply")
                 await submit_button.click()
                 print("[linkedin.submit_application] Successfully clicked Submit button")
                 yield "submit button clicked"
                 
-                # Wait for submission to complete
-                await asyncio.sleep(3)
+                # Wait for submission to complete: the confirmation shows up or the page settles
+                await wait_until_stable(page, quiet_ms=500, timeout_ms=5000,
+                                        predicate="/submitted/i.test(root.innerText || '') || elapsed > 1500")
                 yield "submission is processing"
                 
                 # Look for success confirmation
@@ -1585,7 +1952,7 @@ async def submit_application(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                         continue
                 
                 if success_found:
-                    yield "save_applied_job"
+                    yield LinkedInEvent.PROCEEDING_TO_SAVE_JOB
                 else:
                     # Try to look for "Done" button as alternative success indicator
                     done_selectors = [
@@ -1607,24 +1974,24 @@ async def submit_application(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                             continue
                     
                     if done_found:
-                        yield "save_applied_job"
+                        yield LinkedInEvent.PROCEEDING_TO_SAVE_JOB
                     else:
                         print("[linkedin.submit_application] Could not confirm submission success")
                         yield "submission_confirmation_failed"
-                        yield "application_failed"
+                        yield LinkedInEvent.APPLICATION_FAILED_TO_SUBMIT
                     
             except Exception as e:
                 print(f"[linkedin.submit_application] Error clicking Submit button: {e}")
                 yield "submit_button_click_failed"
-                yield "application_failed"
+                yield LinkedInEvent.APPLICATION_FAILED_TO_SUBMIT
         else:
             print("[linkedin.submit_application] No Submit button found")
             yield "submit_button_not_found"
-            yield "application_failed"
+            yield LinkedInEvent.APPLICATION_FAILED_TO_SUBMIT
             
     except Exception as e:
         print(f"[linkedin.submit_application] error: {e}")
-        yield "submit_application_error"
+        yield LinkedInEvent.SUBMIT_APPLICATION_ERROR
 
 
 async def save_applied_job(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
@@ -1645,14 +2012,14 @@ async def save_applied_job(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                 json.dump(list(applied_job_ids), f)
             
             print(f"[linkedin.save_applied_job] Saved job ID: {current_job['job_id']}")
-            yield "job_saved"
+            yield LinkedInEvent.JOB_SAVED
             return
         
-        yield "no_job_to_save"
+        yield LinkedInEvent.NO_JOB_TO_SAVE
     
     except Exception as e:
         print(f"[linkedin.save_applied_job] error: {e}")
-        yield "save_job_failed"
+        yield LinkedInEvent.SAVING_JOB_FAILED
 
 
 async def save_external_job(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
@@ -1667,14 +2034,14 @@ async def save_external_job(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         
         if current_job and current_job.get("job_id"):
             print(f"[linkedin.save_external_job] External job saved - ID: {current_job['job_id']}, URL: {external_url}")
-            yield "external_job_saved"
+            yield LinkedInEvent.EXTERNAL_JOB_SAVED
             return
         
-        yield "no_external_job"
+        yield LinkedInEvent.NO_EXTERNAL_JOB
     
     except Exception as e:
         print(f"[linkedin.save_external_job] error: {e}")
-        yield "save_external_failed"
+        yield LinkedInEvent.SAVING_EXTERNAL_JOB_FAILED
 
 
 async def application_failed(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
@@ -1692,14 +2059,14 @@ async def application_failed(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
             ctx["failed_jobs"] = failed_jobs
             
             print(f"[linkedin.application_failed] Added job ID to failed list: {current_job['job_id']}")
-            yield "application_marked_failed"
+            yield LinkedInEvent.APPLICATION_MARKED_FAILED
             return
         
-        yield "no_job_to_mark"
+        yield LinkedInEvent.NO_JOB_TO_MARK
     
     except Exception as e:
         print(f"[linkedin.application_failed] error: {e}")
-        yield "mark_failed_error"
+        yield LinkedInEvent.FAILED_TO_MARK_APPLICATION_FAILED
 
 
 async def external_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
@@ -1738,6 +2105,7 @@ async def external_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         
         if apply_button:
             try:
+                await pace(ctx, "linkedin", "click")
                 await apply_button.click()
                 print("[linkedin.external_apply] Successfully clicked Apply button")
                 
@@ -1746,7 +2114,8 @@ async def external_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                 await context.wait_for_event("page", timeout=10000)
                 
                 # Switch to new tab and get URL
-                new_page = context.pages[-1]
+                tabs = get_tab_manager(ctx)
+                new_page = tabs.adopt(context.pages[-1], "external_apply", "external application")
                 external_url = new_page.url
                 
                 # Store external application link
@@ -1756,17 +2125,18 @@ async def external_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
                 # Close external tab if configured
                 settings = load_settings(str(ctx.get("base_dir", ".")), "linkedin")
                 close_tabs = settings.get("close_tabs", True)
+                # Tabs left open are reclaimed by the tab manager once over budget or idle
                 if close_tabs:
-                    await new_page.close()
+                    await tabs.close(new_page)
                 
-                yield "save_external_job"
+                yield LinkedInEvent.EXTERNAL_APPLY_CLICKED
                 
             except Exception as e:
                 print(f"[linkedin.external_apply] Error handling external apply: {e}")
-                yield "application_failed"
+                yield LinkedInEvent.EXTERNAL_APPLY_FAILED
         else:
             print("[linkedin.external_apply] No Apply button found")
-            yield "application_failed"
+            yield LinkedInEvent.NO_APPLY_BUTTON_FOUND
             
     except Exception as e:
         print(f"[linkedin.external_apply] error: {e}")
@@ -1776,6 +2146,22 @@ async def external_apply(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 
 
 
+JOBS_PER_PAGE = 25
+
+
+def jobs_search_url(ctx: Dict[str, Any], url: str) -> str:
+    """The search URL of the current results page, for reopening the jobs tab where it was."""
+    parts = urlparse(url)
+    query = parse_qs(parts.query)
+    query.pop("currentJobId", None)
+    page_number = int(ctx.get("pagination_current_page", 1) or 1)
+    if page_number > 1:
+        query["start"] = [str(JOBS_PER_PAGE * (page_number - 1))]
+    else:
+        query.pop("start", None)
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+
 async def continue_processing(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
     """
     Continue processing next job or move to next page
@@ -1788,7 +2174,7 @@ async def continue_processing(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
         current_job_index = ctx.get("current_job_index", 0)
         
         print(f"[linkedin.continue_processing] Current job index: {current_job_index}, Total jobs: {len(extracted_jobs)}")
-        yield f"processing_status: job={current_job_index + 1}/{len(extracted_jobs)}"
+        yield Progress("processing_status: job={}/{}", current_job_index + 1, len(extracted_jobs))
         
         if current_job_index < len(extracted_jobs) - 1:
             # Process next job
@@ -1801,18 +2187,18 @@ async def continue_processing(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
             company = next_job.get("company", "Unknown")
             
             print(f"[linkedin.continue_processing] Moving to next job: {next_job_index + 1}/{len(extracted_jobs)} - {job_title} at {company}")
-            yield f"moving to next job: {job_title} at {company}"
-            yield "starting next application"
+            # The SPA's heap grows job after job; reopen the jobs tab when it gets too big
+            await between_jobs(ctx, "jobs_page", "linkedin", restore_url=jobs_search_url)
+            yield Progress("moving to next job: {} at {}", job_title, company)
+            yield LinkedInEvent.STARTING_TO_PROCESS_JOBS
         else:
             # All jobs processed, move to next page
             print("[linkedin.continue_processing] All jobs processed, moving to next page")
-            yield "all_jobs_processed"
-            yield "navigate_to_next_page"
+            yield LinkedInEvent.ALL_JOBS_PROCESSED
         
     except Exception as e:
         print(f"[linkedin.continue_processing] error: {e}")
-        yield "continue_processing_error"
-        yield "finish"
+        yield LinkedInEvent.CONTINUE_PROCESSING_ERROR
 
 
 async def navigate_to_next_page(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
@@ -1825,7 +2211,7 @@ async def navigate_to_next_page(ctx: Dict[str, Any]) -> AsyncGenerator[str, None
     
     if page is None:
         print("[linkedin.navigate_to_next_page] jobs_page missing; waiting")
-        yield "jobs page missing"
+        yield LinkedInEvent.JOBS_PAGE_MISSING
         return
 
     try:
@@ -1833,17 +2219,18 @@ async def navigate_to_next_page(ctx: Dict[str, Any]) -> AsyncGenerator[str, None
         next_page_button = page.locator(f"button[aria-label='Page {current_page + 1}']")
         
         if await next_page_button.count() > 0:
+            await pace(ctx, "linkedin", "navigate")
             await next_page_button.click()
             ctx["pagination_current_page"] = current_page + 1
             print(f"[linkedin.navigate_to_next_page] Moved to page {current_page + 1}")
-            yield "extract_job_details"
+            yield LinkedInEvent.PAGE_NAVIGATED
         else:
             print("[linkedin.navigate_to_next_page] No more pages available")
-            yield "finish"
+            yield LinkedInEvent.NO_MORE_PAGES
             
     except Exception as e:
         print(f"[linkedin.navigate_to_next_page] error: {e}")
-        yield "finish"
+        yield LinkedInEvent.NAVIGATION_ERROR
 
 
 async def finish(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
@@ -1855,4 +2242,5 @@ async def finish(ctx: Dict[str, Any]) -> AsyncGenerator[str, None]:
 			ctx.pop("jobs_page", None)
 	except Exception:
 		pass
-	yield "done"
+	await stop_tab_manager(ctx)
+	yield LinkedInEvent.WORKFLOW_FINISHED
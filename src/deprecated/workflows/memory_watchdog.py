@@ -0,0 +1,171 @@
+"""Renderer memory watchdog that recycles long-lived pages between jobs.
+
+Single-page apps such as LinkedIn's jobs search keep growing their JS heap
+and DOM over hundreds of detail and apply cycles, and every later step gets
+slower. The steps call ``between_jobs`` once per job; every ``check_every``
+jobs the watchdog samples the page through the CDP ``Performance.getMetrics``
+call (JS heap, DOM nodes, listeners) and, when psutil is installed, the RSS of
+the browser processes. When a sample crosses a limit, the page is recycled:
+a fresh tab is opened on the same search URL (with pagination restored by
+the platform's ``restore_url``), every ctx entry pointing at the old page is
+repointed at the new one, and the old tab is closed.
+
+Limits default to ``DEFAULT_LIMITS`` and can be overridden per run with
+``ctx["memory_limits"] = {"js_heap_mb": 512}``.
+
+    recycled = await between_jobs(ctx, "jobs_page", "linkedin", restore_url=linkedin_search_url)
+"""
+from __future__ import annotations
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .rate_governor import pace
+from .tab_manager import get_tab_manager
+
+try:
+    import psutil
+except ImportError:  # optional; without it only the page's own metrics are checked
+    psutil = None
+
+DEFAULT_LIMITS: Dict[str, float] = {
+    "js_heap_mb": 768,      # JSHeapUsedSize of the page
+    "dom_nodes": 200_000,   # Nodes
+    "browser_rss_mb": 4096,  # all browser processes together (psutil only)
+}
+CHECK_EVERY = 10
+_MB = 1024 * 1024
+_BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+def browser_rss_mb() -> Optional[float]:
+    """Summed RSS of the browser processes started under this process, or None without psutil."""
+    if psutil is None:
+        return None
+    total = 0
+    try:
+        for child in psutil.Process(os.getpid()).children(recursive=True):
+            try:
+                if any(name in child.name().lower() for name in _BROWSER_PROCESS_NAMES):
+                    total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    except Exception:
+        return None
+    return total / _MB
+
+
+class MemoryWatchdog:
+    """Samples page memory every ``check_every`` jobs and recycles pages over the limits."""
+
+    def __init__(self, limits: Optional[Dict[str, float]] = None, check_every: int = CHECK_EVERY):
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.check_every = max(1, int(check_every))
+        self.jobs = 0
+        self.recycles = 0
+        self.history: deque = deque(maxlen=200)
+        # id(page) -> (page, CDP session); dropped when the page closes
+        self._sessions: Dict[int, Tuple[Any, Any]] = {}
+
+    async def _session(self, page):
+        entry = self._sessions.get(id(page))
+        if entry is not None and entry[0] is page:
+            return entry[1]
+        session = await page.context.new_cdp_session(page)
+        await session.send("Performance.enable")
+        self._sessions[id(page)] = (page, session)
+        page.on("close", lambda _: self._drop_session(page))
+        return session
+
+    def _drop_session(self, page):
+        entry = self._sessions.get(id(page))
+        if entry is not None and entry[0] is page:
+            del self._sessions[id(page)]
+            return entry[1]
+        return None
+
+    async def sample(self, page) -> Dict[str, float]:
+        session = await self._session(page)
+        metrics = {m["name"]: m["value"] for m in (await session.send("Performance.getMetrics")).get("metrics", [])}
+        sample = {
+            "at": time.time(),
+            "js_heap_mb": round(metrics.get("JSHeapUsedSize", 0) / _MB, 1),
+            "js_heap_total_mb": round(metrics.get("JSHeapTotalSize", 0) / _MB, 1),
+            "dom_nodes": int(metrics.get("Nodes", 0)),
+            "listeners": int(metrics.get("JSEventListeners", 0)),
+            "documents": int(metrics.get("Documents", 0)),
+        }
+        rss = browser_rss_mb()
+        if rss is not None:
+            sample["browser_rss_mb"] = round(rss, 1)
+        self.history.append(sample)
+        return sample
+
+    def over_limit(self, sample: Dict[str, float]) -> Optional[str]:
+        for name, limit in self.limits.items():
+            if limit and sample.get(name, 0) > limit:
+                return f"{name} {sample[name]} > {limit}"
+        return None
+
+    async def check(self, ctx: Dict[str, Any], key: str, platform: str,
+                    restore_url: Optional[Callable[[Dict[str, Any], str], str]] = None) -> bool:
+        """Count one job; on every ``check_every``-th, sample ``ctx[key]`` and recycle it if needed."""
+        self.jobs += 1
+        page = ctx.get(key)
+        if page is None or self.jobs % self.check_every:
+            return False
+        try:
+            sample = await self.sample(page)
+        except Exception as e:
+            print(f"[memory] could not sample {key}: {e}")
+            return False
+        reason = self.over_limit(sample)
+        if reason is None:
+            return False
+        print(f"[memory] {key} over limit after {self.jobs} jobs ({reason}); recycling the tab")
+        try:
+            await self.recycle(ctx, key, platform, restore_url)
+        except Exception as e:
+            print(f"[memory] recycling {key} failed: {e}")
+            return False
+        return True
+
+    async def recycle(self, ctx: Dict[str, Any], key: str, platform: str,
+                      restore_url: Optional[Callable[[Dict[str, Any], str], str]] = None):
+        """Reopen ``ctx[key]`` in a fresh tab at the same place and close the old tab."""
+        old = ctx[key]
+        url = restore_url(ctx, old.url) if restore_url else old.url
+        tabs = get_tab_manager(ctx)
+        page = await tabs.new_page("memory_watchdog", key) if tabs is not None else await old.context.new_page()
+        await pace(ctx, platform, "navigate")
+        await page.goto(url, wait_until="domcontentloaded")
+        for name, value in list(ctx.items()):
+            if value is old:
+                ctx[name] = page
+        session = self._drop_session(old)
+        if session is not None:
+            try:
+                await session.detach()
+            except Exception:
+                pass
+        if tabs is not None:
+            await tabs.close(old)
+        else:
+            await old.close()
+        self.recycles += 1
+        return page
+
+
+def get_memory_watchdog(ctx: Dict[str, Any]) -> MemoryWatchdog:
+    watchdog = ctx.get("memory_watchdog")
+    if watchdog is None:
+        watchdog = ctx["memory_watchdog"] = MemoryWatchdog(ctx.get("memory_limits"),
+                                                           int(ctx.get("memory_check_every") or CHECK_EVERY))
+    return watchdog
+
+
+async def between_jobs(ctx: Dict[str, Any], key: str, platform: str,
+                       restore_url: Optional[Callable[[Dict[str, Any], str], str]] = None) -> bool:
+    """Call once per job; True when ``ctx[key]`` was replaced by a fresh tab."""
+    return await get_memory_watchdog(ctx).check(ctx, key, platform, restore_url)
@@ -0,0 +1,137 @@
+"""Token-bucket pacing of browser actions per platform and account.
+
+Every navigation, click and apply in the LinkedIn and Seek steps calls
+``await pace(ctx, "linkedin", "click")`` first. Each (platform, account,
+action) has its own bucket holding up to ``burst`` tokens that refills at
+``rate`` tokens per second. An action spends one token, and only waits when
+the bucket is empty, for exactly as long as the next token takes to arrive.
+
+Buckets are shared by every run in the process, so concurrent sessions on the
+same account draw from the same budget. Token reservation happens under a
+threading lock and the wait happens outside it, so callers on different event
+loops or threads each get their own slot instead of all waking at once.
+
+Rates come from ``DEFAULT_RATES`` and can be overridden per run with
+``ctx["rate_limits"] = {"click": {"rate": 0.5, "burst": 3}}`` (read when the
+account's bucket is first created) or process-wide with ``configure()``.
+"""
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# action -> (tokens per second, burst size)
+DEFAULT_RATES: Dict[str, Dict[str, Tuple[float, int]]] = {
+    "linkedin": {
+        "navigate": (0.2, 3),   # page loads: one every 5s, 3 back to back
+        "click": (1.0, 5),
+        "apply": (1 / 30, 2),   # submitted applications: about two a minute at most
+    },
+    "seek": {
+        "navigate": (0.33, 3),
+        "click": (1.5, 6),
+        "apply": (1 / 20, 2),
+    },
+    "indeed": {
+        "navigate": (0.25, 3),
+        "click": (1.0, 5),
+        "apply": (1 / 30, 2),
+    },
+}
+FALLBACK_RATE = (1.0, 5)
+
+
+class TokenBucket:
+    """Thread- and task-safe token bucket."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.waited = 0.0
+        self.acquired = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` now and return how long the caller must wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Tokens may go negative: later callers queue behind the reservations already made
+            self.tokens -= tokens
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.acquired += 1
+            self.waited += wait
+            return wait
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateGovernor:
+    """Registry of token buckets keyed by (platform, account, action)."""
+
+    def __init__(self, rates: Optional[Dict[str, Dict[str, Tuple[float, int]]]] = None):
+        self.rates = {platform: dict(actions) for platform, actions in (rates or DEFAULT_RATES).items()}
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, platform: str, action: str, rate: float, burst: int) -> None:
+        """Set the rate for an action; existing buckets are updated in place."""
+        self.rates.setdefault(platform, {})[action] = (rate, burst)
+        with self._lock:
+            for (p, _, a), bucket in self._buckets.items():
+                if p == platform and a == action:
+                    bucket.rate, bucket.burst = float(rate), max(1, int(burst))
+
+    def bucket(self, platform: str, account: str, action: str,
+               override: Optional[Dict[str, Any]] = None) -> TokenBucket:
+        key = (platform, account, action)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if override:
+                    rate, burst = override.get("rate", FALLBACK_RATE[0]), override.get("burst", FALLBACK_RATE[1])
+                else:
+                    rate, burst = self.rates.get(platform, {}).get(action, FALLBACK_RATE)
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Acquisitions and total wait per bucket."""
+        with self._lock:
+            return {
+                "/".join(key): {"acquired": b.acquired, "waited_seconds": round(b.waited, 3), "rate": b.rate, "burst": b.burst}
+                for key, b in self._buckets.items()
+            }
+
+
+_GOVERNOR = RateGovernor()
+
+
+def get_rate_governor() -> RateGovernor:
+    return _GOVERNOR
+
+
+def configure(platform: str, action: str, rate: float, burst: int) -> None:
+    _GOVERNOR.configure(platform, action, rate, burst)
+
+
+def account_key(ctx: Dict[str, Any]) -> str:
+    return str(ctx.get("account") or ctx.get("user_id") or "default")
+
+
+async def pace(ctx: Dict[str, Any], platform: str, action: str) -> float:
+    """Wait for a token for ``action`` on ``platform``; returns the seconds waited."""
+    recorder = ctx.get("flight_recorder")
+    if recorder is not None:
+        recorder.record("action", platform, action)
+    override = (ctx.get("rate_limits") or {}).get(action)
+    bucket = _GOVERNOR.bucket(platform, account_key(ctx), action, override)
+    return await bucket.acquire()
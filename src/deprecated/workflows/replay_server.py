@@ -0,0 +1,420 @@
+"""Record live sessions and replay them offline for end-to-end benchmarks.
+
+Recording (against the live site):
+
+    context = await start_recording(browser, "seek-2024-06")  # HAR with embedded bodies
+    ...run the workflow...
+    await capture_fixture(page, "seek-2024-06", "search", "results-p1")
+    await context.close()                                     # flushes session.har
+
+An archive is a directory under ``replays/`` holding ``session.har`` and
+``fixtures/<kind>/<label>.html`` with a ``manifest.json``. Fixtures are DOM
+snapshots (scripts stripped) of the pages the steps read: search results,
+detail panels and Quick Apply / Easy Apply forms.
+
+Replay: ``ReplayServer`` serves an archive over HTTP on localhost, at
+``http://127.0.0.1:<port>/<host>/<path>``. ``install_replay`` routes every
+request of a browser context through it, rewriting ``https://<host>/<path>``
+to the local URL, so the pages keep their real URLs and the real step
+implementations run unmodified. Hosts that were never recorded (ads,
+analytics) are aborted, and local UI pages are passed through. Repeated
+requests for one URL are answered with the recorded responses in order.
+
+``benchmark`` runs a platform's STEPS_CONFIG against the replay with pacing
+disabled and fresh caches and knowledge base, and reports jobs/hour and
+per-step latency:
+
+    python -m deprecated.workflows.replay_server bench seek seek-2024-06 --runs 3
+    python -m deprecated.workflows.replay_server bench seek seek-2024-06 --profile  # + browser roundtrips per step
+    python -m deprecated.workflows.replay_server serve seek-2024-06
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import base64
+import importlib
+import json
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+REPLAYS_DIR = Path(__file__).resolve().parent / "replays"
+FIXTURE_KINDS = ("search", "detail", "apply_form")
+PASSTHROUGH_HOSTS = ("127.0.0.1", "localhost")
+# Recorded bodies are stored decoded, so transport headers no longer apply
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+_SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+# Pacing off for benchmarks: the replay measures the workflow, not the governor
+UNPACED = {action: {"rate": 1e6, "burst": 1000} for action in ("navigate", "click", "apply")}
+
+
+def archive_path(archive: str) -> Path:
+    path = Path(archive)
+    return path if path.is_absolute() or path.exists() else REPLAYS_DIR / archive
+
+
+# Recording
+
+async def start_recording(browser, archive: str, **context_kwargs: Any):
+    """A new context that records every request into ``<archive>/session.har`` when closed."""
+    path = archive_path(archive)
+    path.mkdir(parents=True, exist_ok=True)
+    return await browser.new_context(record_har_path=str(path / "session.har"),
+                                      record_har_content="embed", **context_kwargs)
+
+
+async def capture_fixture(page, archive: str, kind: str, label: str) -> Path:
+    """Save the page's current DOM, without scripts, as a fixture of ``kind``."""
+    if kind not in FIXTURE_KINDS:
+        raise ValueError(f"unknown fixture kind '{kind}' (expected one of {', '.join(FIXTURE_KINDS)})")
+    path = archive_path(archive)
+    slug = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+    target = path / "fixtures" / kind / f"{slug}.html"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(_SCRIPT_TAG.sub("", await page.content()), encoding="utf-8")
+    manifest_path = path / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {"fixtures": []}
+    manifest["fixtures"] = [f for f in manifest["fixtures"] if (f["kind"], f["label"]) != (kind, slug)]
+    manifest["fixtures"].append({"kind": kind, "label": slug, "url": page.url,
+                                 "file": str(target.relative_to(path)), "captured_at": time.time()})
+    manifest_path.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    return target
+
+
+# Replay
+
+class ReplayArchive:
+    """Recorded responses indexed by (method, url), plus the DOM fixtures."""
+
+    def __init__(self, archive: str, use_fixtures: bool = False):
+        self.path = archive_path(archive)
+        self.responses: Dict[Tuple[str, str], List[Tuple[int, List[Tuple[str, str]], bytes]]] = defaultdict(list)
+        self.by_path: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self.hosts: set = set()
+        self.fixtures: List[Dict[str, Any]] = []
+        self._cursors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._load_har(self.path / "session.har")
+        manifest_path = self.path / "manifest.json"
+        if manifest_path.exists():
+            self.fixtures = json.loads(manifest_path.read_text(encoding="utf-8")).get("fixtures", [])
+        if use_fixtures:
+            # Static mode: a fixture replaces the recorded document for its URL
+            for fixture in self.fixtures:
+                body = (self.path / fixture["file"]).read_bytes()
+                self._add("GET", fixture["url"], 200, [("content-type", "text/html; charset=utf-8")], body, replace=True)
+
+    def _load_har(self, har_path: Path) -> None:
+        if not har_path.exists():
+            print(f"Replay archive {self.path} has no session.har")
+            return
+        with open(har_path, "r", encoding="utf-8") as f:
+            entries = json.load(f).get("log", {}).get("entries", [])
+        for entry in entries:
+            request, response = entry["request"], entry["response"]
+            content = response.get("content") or {}
+            text = content.get("text") or ""
+            body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+            headers = [(h["name"], h["value"]) for h in response.get("headers", [])
+                       if h["name"].lower() not in _DROPPED_HEADERS]
+            self._add(request["method"], request["url"], response["status"], headers, body)
+
+    def _add(self, method: str, url: str, status: int, headers, body: bytes, replace: bool = False) -> None:
+        url = url.split("#", 1)[0]
+        parts = urlsplit(url)
+        self.hosts.add(parts.hostname)
+        key = (method.upper(), url)
+        if replace:
+            self.responses[key] = []
+        self.responses[key].append((status, headers, body))
+        self.by_path.setdefault((method.upper(), f"{parts.hostname}{parts.path}"), key)
+
+    def lookup(self, method: str, url: str) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        """The next recorded response for the URL; falls back to the same path with any query."""
+        url = url.split("#", 1)[0]
+        key = (method.upper(), url)
+        if key not in self.responses:
+            parts = urlsplit(url)
+            key = self.by_path.get((method.upper(), f"{parts.hostname}{parts.path}"))
+            if key is None:
+                return None
+        recorded = self.responses[key]
+        with self._lock:
+            index = min(self._cursors[key], len(recorded) - 1)
+            self._cursors[key] += 1
+        return recorded[index]
+
+    def fixture_html(self, kind: str, label: str) -> Optional[str]:
+        for fixture in self.fixtures:
+            if fixture["kind"] == kind and fixture["label"] == label:
+                return (self.path / fixture["file"]).read_text(encoding="utf-8")
+        return None
+
+    def reset(self) -> None:
+        """Start every URL's responses from the first recording again."""
+        with self._lock:
+            self._cursors.clear()
+
+
+class ReplayServer:
+    """Serves a ReplayArchive on localhost from a background thread."""
+
+    def __init__(self, archive: ReplayArchive, port: int = 0):
+        self.archive = archive
+        self.requests = 0
+        self.misses: List[str] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _serve(self) -> None:
+                length = int(self.headers.get("content-length") or 0)
+                if length:
+                    self.rfile.read(length)
+                host, _, rest = self.path.lstrip("/").partition("/")
+                if host == "__fixtures__":
+                    kind, _, label = rest.partition("/")
+                    html = server.archive.fixture_html(kind, label.removesuffix(".html"))
+                    found = None if html is None else (200, [("content-type", "text/html; charset=utf-8")], html.encode("utf-8"))
+                else:
+                    found = server.lookup(self.command, f"https://{host}/{rest}")
+                status, headers, body = found or (404, [("content-type", "text/plain")], b"not recorded")
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = do_OPTIONS = _serve
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.port = self.httpd.server_address[1]
+        self._thread: Optional[threading.Thread] = None
+
+    def lookup(self, method: str, url: str):
+        self.requests += 1
+        found = self.archive.lookup(method, url)
+        if found is None:
+            self.misses.append(f"{method} {url}")
+        return found
+
+    def rewrite(self, url: str) -> str:
+        """``https://host/path?q`` -> ``http://127.0.0.1:<port>/host/path?q``."""
+        parts = urlsplit(url)
+        local = f"http://127.0.0.1:{self.port}/{parts.hostname}{quote(parts.path or '/', safe='/%:@!$&()*+,;=-._~')}"
+        return f"{local}?{parts.query}" if parts.query else local
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+async def install_replay(context, server: ReplayServer, passthrough: Tuple[str, ...] = PASSTHROUGH_HOSTS) -> None:
+    """Route every request of ``context`` to the replay server, keeping page URLs unchanged."""
+    async def handle(route) -> None:
+        url = route.request.url
+        host = urlsplit(url).hostname
+        if host in passthrough or url.startswith(("data:", "blob:")):
+            await route.continue_()
+        elif host not in server.archive.hosts:
+            await route.abort()
+        else:
+            response = await route.fetch(url=server.rewrite(url), max_redirects=0)
+            await route.fulfill(response=response)
+
+    await context.route("**/*", handle)
+
+
+# Benchmark
+
+class StepTimer:
+    """on_transition hook recording how long each step took and counting jobs and applications."""
+
+    def __init__(self, job_steps: Tuple[str, ...] = (), apply_events: Tuple[str, ...] = ()):
+        self.job_steps = set(job_steps)
+        self.apply_events = set(apply_events)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.jobs = 0
+        self.applications = 0
+        self._last = time.perf_counter()
+
+    def start(self) -> None:
+        self._last = time.perf_counter()
+
+    async def on_transition(self, step: str, event: Optional[str], next_step: Optional[str], timed_out: bool = False) -> None:
+        now = time.perf_counter()
+        self.latencies[step].append(now - self._last)
+        self._last = now
+        if step in self.job_steps:
+            self.jobs += 1
+        if event in self.apply_events:
+            self.applications += 1
+
+
+# Per platform: the step entered once per job and the events that mean an application went in
+BENCHMARK_COUNTERS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "seek": {"job_steps": ("click_job_card",), "apply_events": ("application_submitted",)},
+    "linkedin": {"job_steps": ("attempt_easy_apply",), "apply_events": ("proceeding to save job",)},
+    "indeed": {"job_steps": (), "apply_events": ()},
+}
+
+
+async def benchmark(steps_config: Dict[str, Dict[str, Any]], meta: Dict[str, Any],
+                    make_ctx: Callable[[], Awaitable[Dict[str, Any]]], runs: int = 1,
+                    job_steps: Tuple[str, ...] = (), apply_events: Tuple[str, ...] = (),
+                    max_steps: int = 2000) -> Dict[str, Any]:
+    """Run the workflow ``runs`` times on fresh contexts from ``make_ctx``; returns the report dict.
+
+    The description and session caches, the form fill cache and the answer
+    knowledge base point at a throwaway directory for the duration, fresh for
+    each run, so every run does the same work and user_data is left alone.
+    """
+    from . import answer_kb, description_cache, session_cache
+    from .form_cache import FormFillCache
+    from .step_compiler import compile_workflow, run_workflow
+
+    workflow = compile_workflow(steps_config, meta)
+    timer = StepTimer(job_steps, apply_events)
+    saved = (description_cache._SHARED_CACHE, session_cache._CACHE, answer_kb._SHARED_KBS)
+    wall = 0.0
+    with tempfile.TemporaryDirectory(prefix="replay-bench-") as tmp:
+        try:
+            for run in range(runs):
+                description_cache._SHARED_CACHE = description_cache.DescriptionCache(directory=f"{tmp}/descriptions-{run}")
+                session_cache._CACHE = session_cache.SessionCache(directory=f"{tmp}/sessions-{run}")
+                answer_kb._SHARED_KBS = {
+                    str(answer_kb.DEFAULT_KB_PATH): answer_kb.AnswerKnowledgeBase(f"{tmp}/answers-{run}.json"),
+                }
+                ctx = await make_ctx()
+                ctx.setdefault("form_fill_cache", FormFillCache(f"{tmp}/form-fill-{run}.json"))
+                ctx.setdefault("rate_limits", UNPACED)
+                ctx.setdefault("account", f"replay-benchmark-{run}")
+                # Failure traces would add their page.content() and screenshot to the timings
+                ctx.setdefault("flight_recorder", None)
+                timer.start()
+                started = time.perf_counter()
+                try:
+                    await run_workflow(workflow, ctx, max_steps=max_steps, on_transition=timer.on_transition)
+                finally:
+                    wall += time.perf_counter() - started
+                    context = ctx.get("browser_context")
+                    if context is not None:
+                        await context.close()
+        finally:
+            description_cache._SHARED_CACHE, session_cache._CACHE, answer_kb._SHARED_KBS = saved
+
+    steps = {}
+    for step, samples in timer.latencies.items():
+        ordered = sorted(samples)
+        steps[step] = {
+            "calls": len(samples),
+            "total_s": round(sum(samples), 4),
+            "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+            "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+        }
+    return {
+        "runs": runs,
+        "wall_s": round(wall, 3),
+        "jobs": timer.jobs,
+        "applications": timer.applications,
+        "jobs_per_hour": round(timer.jobs / wall * 3600, 1) if wall else 0.0,
+        "applications_per_hour": round(timer.applications / wall * 3600, 1) if wall else 0.0,
+        "steps": steps,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"runs: {report['runs']}  wall: {report['wall_s']:.1f}s  jobs: {report['jobs']}  applications: {report['applications']}",
+        f"jobs/hour: {report['jobs_per_hour']}  applications/hour: {report['applications_per_hour']}",
+        "",
+        f"{'step':<40} {'calls':>6} {'total s':>9} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}",
+    ]
+    for step, s in sorted(report["steps"].items(), key=lambda item: -item[1]["total_s"]):
+        lines.append(f"{step[:40]:<40} {s['calls']:>6} {s['total_s']:>9.2f} {s['mean_ms']:>9.1f} {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+async def _bench(args: argparse.Namespace) -> int:
+    from playwright.async_api import async_playwright
+
+    config = importlib.import_module(f".{args.platform}.steps_config", __package__)
+    archive = ReplayArchive(args.archive, use_fixtures=args.fixtures)
+    with ReplayServer(archive) as server:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+
+            async def make_ctx() -> Dict[str, Any]:
+                archive.reset()
+                context = await browser.new_context()
+                await install_replay(context, server)
+                return {"browser_context": context, "profile_roundtrips": args.profile}
+
+            report = await benchmark(config.STEPS_CONFIG, config.WORKFLOW_META, make_ctx, runs=args.runs,
+                                     **BENCHMARK_COUNTERS.get(args.platform, {}))
+            await browser.close()
+    print(format_report(report))
+    if server.misses:
+        print(f"\n{len(server.misses)} requests were not in the archive, e.g. {server.misses[0]}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=1), encoding="utf-8")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve recorded sessions and benchmark workflows against them")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="serve an archive on localhost")
+    serve.add_argument("archive")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--fixtures", action="store_true", help="serve DOM fixtures in place of recorded documents")
+    bench = sub.add_parser("bench", help="run a platform's workflow against an archive")
+    bench.add_argument("platform", choices=sorted(BENCHMARK_COUNTERS))
+    bench.add_argument("archive")
+    bench.add_argument("--runs", type=int, default=1)
+    bench.add_argument("--fixtures", action="store_true")
+    bench.add_argument("--json", help="also write the report to this file")
+    bench.add_argument("--profile", action="store_true", help="print each run's browser roundtrips per step")
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        return asyncio.run(_bench(args))
+    archive = ReplayArchive(args.archive, use_fixtures=args.fixtures)
+    server = ReplayServer(archive, args.port)
+    print(f"Serving {archive.path} ({len(archive.responses)} URLs, hosts: {', '.join(sorted(filter(None, archive.hosts)))})")
+    print(f"  http://127.0.0.1:{server.port}/<host>/<path>")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
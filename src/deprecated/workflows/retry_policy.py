@@ -0,0 +1,135 @@
+"""Retry budgets, backoff and a platform-wide circuit breaker for workflow steps.
+
+A step opts in with a ``retry`` entry in its STEPS_CONFIG:
+
+    "retry": {
+        "events": ["failed opening jobs page"],  # transitions that count as a failed attempt
+        "max_attempts": 4,        # failed attempts allowed before giving up
+        "backoff": 2.0,           # first delay in seconds, doubled per attempt
+        "max_backoff": 30.0,
+        "jitter": 0.3,            # +/- fraction of the delay, randomised
+        "on_exhausted": "finish", # step to go to once the budget is spent
+    }
+
+``events`` defaults to every transition that leads back to the step itself.
+The attempt count resets once the step yields any other routed event.
+
+Each exhausted budget is reported to the platform's ``CircuitBreaker``
+(``WORKFLOW_META["circuit_breaker"]``). When ``threshold`` budgets run out
+within ``window`` seconds the breaker opens and every run of that platform
+pauses for ``cooldown`` seconds before its next step.
+
+Per-step counters are kept in a ``RetryStats`` (``ctx["retry_stats"]`` when
+run through step_compiler.run_workflow).
+"""
+from __future__ import annotations
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = 1.0
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_JITTER = 0.3
+
+
+@dataclass
+class RetryPolicy:
+    events: List[str]
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    backoff: float = DEFAULT_BACKOFF
+    max_backoff: float = DEFAULT_MAX_BACKOFF
+    jitter: float = DEFAULT_JITTER
+    on_exhausted: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, step_name: str, config: Dict[str, Any]) -> Optional["RetryPolicy"]:
+        """Build the policy for a STEPS_CONFIG entry; None if it has no ``retry`` key."""
+        retry = config.get("retry")
+        if not retry:
+            return None
+        events = retry.get("events")
+        if events is None:
+            events = [event for event, target in (config.get("transitions") or {}).items() if target == step_name]
+        return cls(
+            events=list(events),
+            max_attempts=int(retry.get("max_attempts", DEFAULT_MAX_ATTEMPTS)),
+            backoff=float(retry.get("backoff", DEFAULT_BACKOFF)),
+            max_backoff=float(retry.get("max_backoff", DEFAULT_MAX_BACKOFF)),
+            jitter=float(retry.get("jitter", DEFAULT_JITTER)),
+            on_exhausted=retry.get("on_exhausted"),
+        )
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (1-based)."""
+        base = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        if self.jitter:
+            base *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, base)
+
+
+@dataclass
+class RetryStats:
+    """Per-step retry telemetry for one run."""
+    attempts: Dict[str, int] = field(default_factory=dict)  # current consecutive failures
+    retries: Dict[str, int] = field(default_factory=dict)   # total retries over the run
+    exhausted: Dict[str, int] = field(default_factory=dict)
+    backoff_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        steps = set(self.retries) | set(self.exhausted)
+        return {
+            step: {
+                "retries": self.retries.get(step, 0),
+                "exhausted": self.exhausted.get(step, 0),
+                "backoff_seconds": round(self.backoff_seconds.get(step, 0.0), 3),
+            }
+            for step in sorted(steps)
+        }
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` exhausted retry budgets within ``window`` seconds."""
+
+    def __init__(self, name: str, threshold: int = 3, window: float = 600.0, cooldown: float = 300.0):
+        self.name = name
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self.failures: deque = deque()
+        self.open_until = 0.0
+        self.trips = 0
+
+    def record_failure(self, step: str) -> None:
+        now = time.monotonic()
+        self.failures.append(now)
+        while self.failures and now - self.failures[0] > self.window:
+            self.failures.popleft()
+        if len(self.failures) >= self.threshold and now >= self.open_until:
+            self.open_until = now + self.cooldown
+            self.trips += 1
+            self.failures.clear()
+            print(f"[{self.name}] circuit breaker open after '{step}' exhausted its retries; pausing {self.cooldown:.0f}s")
+
+    def remaining(self) -> float:
+        return max(0.0, self.open_until - time.monotonic())
+
+    async def wait_if_open(self) -> None:
+        remaining = self.remaining()
+        if remaining:
+            print(f"[{self.name}] circuit breaker open; waiting {remaining:.0f}s")
+            await asyncio.sleep(remaining)
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str, config: Optional[Dict[str, Any]] = None) -> CircuitBreaker:
+    """Shared breaker for a platform, created from ``WORKFLOW_META["circuit_breaker"]`` on first use."""
+    breaker = _BREAKERS.get(name)
+    if breaker is None:
+        breaker = _BREAKERS[name] = CircuitBreaker(name, **(config or {}))
+    return breaker
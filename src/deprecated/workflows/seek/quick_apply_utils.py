@@ -3,201 +3,211 @@ from typing import Dict, Any, List, Optional
 import asyncio
 
 
-async def check_progress_bar(page) -> Optional[Dict[str, Any]]:
-    """Check the progress bar navigation to see current step and available steps."""
-    try:
-        progress_script = """
-        const nav = document.querySelector('nav[aria-label="Progress bar"]');
-        if (!nav) return null;
-        
-        const steps = Array.from(nav.querySelectorAll('li button')).map((button, index) => {
-            const stepText = button.querySelector('span:nth-child(2) span:nth-child(2) span span')?.textContent?.trim() || '';
-            const isCurrent = button.getAttribute('aria-current') === 'step';
-            const isClickable = button.tabIndex >= 0;
-            
-            return {
-                index: index + 1,
-                text: stepText,
-                isCurrent: isCurrent,
-                isClickable: isClickable,
-                tabIndex: button.tabIndex
-            };
-        });
-        
+# Single in-page pass over a Quick Apply page. The result is memoized on
+# window and invalidated by a MutationObserver (plus input/change listeners,
+# since form values are properties and do not show up as mutations), so
+# repeated calls on an unchanged page return the cached object.
+QUICK_APPLY_SNAPSHOT_SCRIPT = """
+(force) => {
+    const state = window.__guuQuickApplySnapshot || (window.__guuQuickApplySnapshot = { dirty: true, value: null, watching: false });
+    if (!state.watching && document.documentElement) {
+        const invalidate = () => { state.dirty = true; };
+        new MutationObserver(invalidate).observe(document.documentElement, { subtree: true, childList: true, attributes: true, characterData: true });
+        document.addEventListener('input', invalidate, true);
+        document.addEventListener('change', invalidate, true);
+        state.watching = true;
+    }
+    if (!force && !state.dirty && state.value) {
+        return Object.assign({}, state.value, { cached: true });
+    }
+
+    const stepLabel = (button) => button.querySelector('span:nth-child(2) span:nth-child(2) span span')?.textContent?.trim() || '';
+
+    // Progress bar
+    let progress = null;
+    let currentStep = null;
+    const nav = document.querySelector('nav[aria-label="Progress bar"]');
+    if (nav) {
+        const steps = Array.from(nav.querySelectorAll('li button')).map((button, index) => ({
+            index: index + 1,
+            text: stepLabel(button),
+            isCurrent: button.getAttribute('aria-current') === 'step',
+            isClickable: button.tabIndex >= 0,
+            tabIndex: button.tabIndex
+        }));
         const progressBar = nav.querySelector('[role="progressbar"]');
-        const currentProgress = progressBar ? {
-            valueNow: progressBar.getAttribute('aria-valuenow'),
-            valueMax: progressBar.getAttribute('aria-valuemax'),
-            valueText: progressBar.getAttribute('aria-valuetext')
-        } : null;
-        
-        return {
+        progress = {
             steps: steps,
-            progress: currentProgress,
+            progress: progressBar ? {
+                valueNow: progressBar.getAttribute('aria-valuenow'),
+                valueMax: progressBar.getAttribute('aria-valuemax'),
+                valueText: progressBar.getAttribute('aria-valuetext')
+            } : null,
             totalSteps: steps.length
         };
-        """
-        
-        progress_info = await page.evaluate(progress_script)
-        return progress_info
-        
-    except Exception:
-        return None
+        const current = nav.querySelector('li button[aria-current="step"]');
+        currentStep = current ? stepLabel(current) : null;
+    }
 
+    // Resume options
+    const resumeSelect = document.querySelector('select[data-testid="select-input"]');
+    const resumeOptions = resumeSelect ? Array.from(resumeSelect.options).map(option => ({
+        value: option.value,
+        text: option.textContent.trim(),
+        selected: option.selected
+    })).filter(opt => opt.value && opt.value !== '') : [];
 
-async def get_available_resume_options(page) -> List[Dict[str, str]]:
-    """Get available resume options from the dropdown."""
-    try:
-        resume_script = """
-        const select = document.querySelector('select[data-testid="select-input"]');
-        if (!select) return [];
-        
-        return Array.from(select.options).map(option => ({
-            value: option.value,
-            text: option.textContent.trim(),
-            selected: option.selected
-        })).filter(opt => opt.value && opt.value !== '');
-        """
-        
-        options = await page.evaluate(resume_script)
-        return options or []
-        
-    except Exception:
-        return []
+    // Cover letter
+    const coverRadio = document.querySelector('input[data-testid="coverLetter-method-change"]');
+    const coverText = document.querySelector('textarea[data-testid="coverLetterTextInput"]');
+    const coverLetter = {
+        radioPresent: !!coverRadio,
+        radioChecked: !!(coverRadio && coverRadio.checked),
+        textareaPresent: !!coverText,
+        textLength: coverText ? (coverText.value || '').length : 0
+    };
 
+    // Employer questions: <strong> question text near selects / radio groups
+    const questions = [];
+    document.querySelectorAll('strong').forEach((strong, index) => {
+        const questionText = strong.textContent.trim();
+        if (!questionText) return;
+        const container = strong.closest('div, fieldset, section, label') || strong.parentElement?.parentElement?.parentElement;
+        if (!container) return;
 
-async def scan_employer_questions(page) -> Dict[str, Any]:
-    """Scan for employer questions on the page."""
-    try:
-        form_scan_script = """
-        // Find all questions on the page (not just in forms)
-        let questions = [];
-        
-        // Look for strong tags that contain questions
-        const strongTags = document.querySelectorAll('strong');
-        
-        strongTags.forEach((strong, index) => {
-            const questionText = strong.textContent.trim();
-            if (!questionText) return;
-            
-            // Find the closest parent container that might contain the input
-            let container = strong.closest('div, fieldset, section, label');
-            if (!container) {
-                // Go up a few levels to find the container
-                container = strong.parentElement?.parentElement?.parentElement;
-            }
-                
-            if (!container) return;
-            
-            // Look for select dropdowns in the container or nearby
-            const selects = container.querySelectorAll('select');
-            selects.forEach(select => {
-                const options = Array.from(select.options).map(opt => ({
+        container.querySelectorAll('select').forEach(select => {
+            questions.push({
+                type: 'select',
+                question: questionText,
+                element: select.id || select.name || `select_${index}`,
+                options: Array.from(select.options).map(opt => ({
                     value: opt.value,
                     text: opt.textContent.trim(),
                     selected: opt.selected
-                }));
-                
-                questions.push({
-                    type: 'select',
-                    question: questionText,
-                    element: select.id || select.name || `select_${index}`,
-                    options: options,
-                    required: select.required,
-                    currentValue: select.value
-                });
+                })),
+                required: select.required,
+                currentValue: select.value
             });
-            
-            // Look for radio button groups - check the fieldset or parent div
-            let radioContainer = container;
-            if (container.tagName === 'FIELDSET') {
-                radioContainer = container;
+        });
+
+        const radioContainer = container.tagName === 'FIELDSET' ? container : (container.closest('fieldset') || container);
+        const radios = radioContainer.querySelectorAll('input[type="radio"]');
+        if (radios.length === 0) return;
+        const radioGroups = {};
+        radios.forEach(radio => {
+            if (!radioGroups[radio.name]) radioGroups[radio.name] = [];
+            let labelText = '';
+            const label = radioContainer.querySelector(`label[for="${radio.id}"]`);
+            if (label) {
+                labelText = label.textContent.trim();
             } else {
-                // Find the fieldset that might contain this question
-                radioContainer = container.closest('fieldset') || container;
-            }
-            
-            const radios = radioContainer.querySelectorAll('input[type="radio"]');
-            if (radios.length > 0) {
-                // Group radios by name
-                const radioGroups = {};
-                radios.forEach(radio => {
-                    const name = radio.name;
-                    if (!radioGroups[name]) {
-                        radioGroups[name] = [];
-                    }
-                    
-                    // Find the label text for this radio
-                    let labelText = '';
-                    const label = radioContainer.querySelector(`label[for="${radio.id}"]`);
-                    if (label) {
-                        labelText = label.textContent.trim();
-                    } else {
-                        // Try to find text near the radio
-                        const parent = radio.closest('div');
-                        if (parent) {
-                            const spans = parent.querySelectorAll('span');
-                            labelText = spans[spans.length - 1]?.textContent?.trim() || radio.value;
-                        }
-                    }
-                    
-                    radioGroups[name].push({
-                        value: radio.value,
-                        text: labelText,
-                        checked: radio.checked,
-                        id: radio.id
-                    });
-                });
-                
-                // Add each radio group as a question (but avoid duplicates)
-                Object.entries(radioGroups).forEach(([name, options]) => {
-                    // Check if we already have this radio group
-                    const alreadyExists = questions.some(q => q.type === 'radio' && q.element === name);
-                    if (!alreadyExists) {
-                        questions.push({
-                            type: 'radio',
-                            question: questionText,
-                            element: name,
-                            options: options,
-                            required: radios[0].required
-                        });
-                    }
-                });
+                const parent = radio.closest('div');
+                if (parent) {
+                    const spans = parent.querySelectorAll('span');
+                    labelText = spans[spans.length - 1]?.textContent?.trim() || radio.value;
+                }
             }
+            radioGroups[radio.name].push({ value: radio.value, text: labelText, checked: radio.checked, id: radio.id });
         });
-        
-        return {
-            questionsFound: questions.length,
-            questions: questions
-        };
-        """
-        
-        result = await page.evaluate(form_scan_script)
-        return result or {"questionsFound": 0, "questions": []}
-        
+        Object.entries(radioGroups).forEach(([name, options]) => {
+            if (questions.some(q => q.type === 'radio' && q.element === name)) return;
+            questions.push({ type: 'radio', question: questionText, element: name, options: options, required: radios[0].required });
+        });
+    });
+
+    state.value = {
+        url: location.href,
+        progress: progress,
+        current_step: currentStep,
+        resume_options: resumeOptions,
+        cover_letter: coverLetter,
+        employer_questions: { questionsFound: questions.length, questions: questions },
+        cached: false
+    };
+    state.dirty = false;
+    return state.value;
+}
+"""
+
+EMPTY_QUICK_APPLY_SNAPSHOT: Dict[str, Any] = {
+    "url": None,
+    "progress": None,
+    "current_step": None,
+    "resume_options": [],
+    "cover_letter": {"radioPresent": False, "radioChecked": False, "textareaPresent": False, "textLength": 0},
+    "employer_questions": {"questionsFound": 0, "questions": []},
+    "cached": False,
+}
+
+
+APPLY_BUTTON_SELECTOR = '[data-automation="job-detail-apply"]'
+
+# Classifies every apply button on a job page in one roundtrip. Text is
+# normalized like the Python side used to (odd spaces folded, whitespace
+# collapsed, lower-cased); indexes are positions among APPLY_BUTTON_SELECTOR
+# matches, so they can be clicked with locator(...).nth(index).
+APPLY_BUTTONS_SCRIPT = """
+(selector) => {
+    const normalize = (text) => (text || '').replace(/[\\u00A0\\u2000-\\u200D\\u202F\\u2060]/g, ' ').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const buttons = Array.from(document.querySelectorAll(selector)).map((el, index) => {
+        const text = normalize(el.innerText);
+        return { index, text, quick: text.includes('quick apply') };
+    });
+    const quick = buttons.find(b => b.quick);
+    const regular = buttons.find(b => !b.quick);
+    return {
+        count: buttons.length,
+        buttons,
+        quickIndex: quick ? quick.index : -1,
+        regularIndex: regular ? regular.index : -1
+    };
+}
+"""
+
+EMPTY_APPLY_BUTTONS: Dict[str, Any] = {"count": 0, "buttons": [], "quickIndex": -1, "regularIndex": -1}
+
+
+async def classify_apply_buttons(page) -> Dict[str, Any]:
+    """Count the apply buttons on a job page and find the first Quick Apply and
+    the first regular one, in a single evaluate."""
+    try:
+        return await page.evaluate(APPLY_BUTTONS_SCRIPT, APPLY_BUTTON_SELECTOR) or dict(EMPTY_APPLY_BUTTONS)
     except Exception:
-        return {"questionsFound": 0, "questions": []}
+        return dict(EMPTY_APPLY_BUTTONS)
 
 
-async def get_current_step_text(page) -> Optional[str]:
-    """Get the current step text from the progress bar."""
+async def snapshot_quick_apply(page, force: bool = False) -> Dict[str, Any]:
+    """Read progress steps, current step, resume options, cover letter state and
+    employer questions from a Quick Apply page in one roundtrip.
+
+    The snapshot is memoized in the page until the DOM mutates; pass
+    ``force=True`` to rebuild it regardless.
+    """
     try:
-        progress_script = """
-        const nav = document.querySelector('nav[aria-label="Progress bar"]');
-        if (!nav) return null;
-        
-        const currentStep = nav.querySelector('li button[aria-current="step"]');
-        if (!currentStep) return null;
-        
-        const stepText = currentStep.querySelector('span:nth-child(2) span:nth-child(2) span span')?.textContent?.trim() || '';
-        return stepText;
-        """
-        
-        step_text = await page.evaluate(progress_script)
-        return step_text
-        
+        snapshot = await page.evaluate(QUICK_APPLY_SNAPSHOT_SCRIPT, force)
+        return snapshot or dict(EMPTY_QUICK_APPLY_SNAPSHOT)
     except Exception:
-        return None
+        return dict(EMPTY_QUICK_APPLY_SNAPSHOT)
+
+
+async def check_progress_bar(page) -> Optional[Dict[str, Any]]:
+    """Check the progress bar navigation to see current step and available steps."""
+    return (await snapshot_quick_apply(page))["progress"]
+
+
+async def get_available_resume_options(page) -> List[Dict[str, str]]:
+    """Get available resume options from the dropdown."""
+    return (await snapshot_quick_apply(page))["resume_options"]
+
+
+async def scan_employer_questions(page) -> Dict[str, Any]:
+    """Scan for employer questions on the page."""
+    return (await snapshot_quick_apply(page))["employer_questions"]
+
+
+async def get_current_step_text(page) -> Optional[str]:
+    """Get the current step text from the progress bar."""
+    return (await snapshot_quick_apply(page))["current_step"]
 
 
 def get_default_cover_letter() -> str:
@@ -229,6 +239,14 @@ async def log_quick_apply_progress(page, step_name: str) -> None:
         print(f"[{step_name}] Could not determine progress")
 
 
+# In-page form of is_application_complete, for waits.wait_until_stable(predicate=...)
+APPLICATION_COMPLETE_PREDICATE = (
+    "/application submitted|thank you|your application has been sent/i.test(root.innerText || '')"
+    " || !!root.querySelector('[data-testid=\"application-success\"]')"
+    " || /success|complete|submitted/i.test(location.href)"
+)
+
+
 async def is_application_complete(page) -> bool:
     """Check if the application has been successfully submitted."""
     try:
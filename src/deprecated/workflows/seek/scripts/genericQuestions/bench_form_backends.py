@@ -0,0 +1,96 @@
+"""Benchmark the detect_forms_helper_python parser backends on a large synthetic page.
+
+Compares the old path (whole document through BeautifulSoup's html.parser)
+with the forms-only path on every installed backend, and checks that each
+backend produces output identical to the old path.
+
+    python bench_form_backends.py [--forms 20] [--fields 150] [--filler-kb 2048]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup
+from formsBeautifulshup_fixed import available_backends, parse_form_with_beautifulsoup, parse_forms_html
+
+
+def build_form(form_index: int, field_count: int, rng: random.Random) -> str:
+    parts = [f'<form id="form-{form_index}" class="apply  form" action="/apply/{form_index}" method="post" novalidate>']
+    for i in range(field_count):
+        field_id = f"f{form_index}-{i}"
+        kind = rng.choice(["text", "select", "radio", "checkbox", "textarea", "number", "file", "button"])
+        parts.append(f'<div class="field"><label for="{field_id}"><strong>Question {i} &amp; more?</strong><span>*</span></label>')
+        if kind == "select":
+            options = "".join(f'<option value="{v}"{" selected" if v == 1 else ""}>Option {v}</option>' for v in range(6))
+            parts.append(f'<select id="{field_id}" name="q{i}" required><option value="">Select</option>{options}'
+                         f'<optgroup label="More"><option>Other</option></optgroup></select>')
+        elif kind == "radio":
+            for v in ("Yes", "No"):
+                parts.append(f'<input type="radio" id="{field_id}-{v}" name="q{i}" value="{v}"{" checked" if v == "Yes" else ""}>')
+        elif kind == "textarea":
+            parts.append(f'<textarea id="{field_id}" name="q{i}" rows="4" maxlength="500"> Prior answer {i} </textarea>')
+        elif kind == "button":
+            parts.append(f'<button type="button" id="{field_id}">Add <b>item</b><script>var x = {i};</script></button>')
+        else:
+            parts.append(f'<input type="{kind}" id="{field_id}" name="q{i}" placeholder="Answer {i}" aria-label="Q{i}" min="0" max="10">')
+        parts.append('</div>')
+    parts.append('<fieldset name="extra"><legend>Extra</legend><input type="hidden" name="token" value="secret"></fieldset>')
+    parts.append('<button type="submit">Continue</button></form>')
+    return "".join(parts)
+
+
+def build_page(form_count: int, field_count: int, filler_kb: int, seed: int = 7):
+    rng = random.Random(seed)
+    forms = [build_form(i, field_count, rng) for i in range(form_count)]
+    filler_unit = '<div class="card"><a href="/job/1">Job title</a><p>' + ("Lorem ipsum dolor sit amet. " * 8) + '</p></div>'
+    # Spread the filler evenly over the gaps around the forms
+    filler = filler_unit * max(1, (filler_kb * 1024) // (len(filler_unit) * (form_count + 1)))
+    body = filler.join([""] + forms + [""])
+    return f"<!doctype html><html><head><title>bench</title></head><body>{body}</body></html>", forms
+
+
+def old_path(html: str):
+    """What detect_forms_helper_python used to do with page.content()."""
+    soup = BeautifulSoup(html, 'html.parser')
+    return [parse_form_with_beautifulsoup(form, index) for index, form in enumerate(soup.find_all('form'))]
+
+
+def timed(fn, *args, repeat: int = 3):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--forms", type=int, default=20)
+    parser.add_argument("--fields", type=int, default=150)
+    parser.add_argument("--filler-kb", type=int, default=2048)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    html, forms = build_page(args.forms, args.fields, args.filler_kb)
+    shipped = sum(len(form) for form in forms)
+    print(f"Page: {len(html) / 1024:.0f} KiB, forms only: {shipped / 1024:.0f} KiB, "
+          f"{args.forms} forms x {args.fields} fields")
+
+    baseline, expected = timed(old_path, html, repeat=args.repeat)
+    print(f"{'full page / html.parser (old)':<32} {baseline * 1000:9.1f} ms   1.00x")
+
+    for backend in available_backends():
+        elapsed, result = timed(parse_forms_html, forms, backend, repeat=args.repeat)
+        status = "identical" if result == expected else "MISMATCH"
+        print(f"{'forms only / ' + backend:<32} {elapsed * 1000:9.1f} ms {baseline / elapsed:6.2f}x  {status}")
+
+
+if __name__ == "__main__":
+    main()
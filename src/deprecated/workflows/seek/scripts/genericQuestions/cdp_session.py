@@ -0,0 +1,203 @@
+"""Long-lived CDP connections to the running browser.
+
+The form parsers used to open ``sync_playwright()`` and ``connect_over_cdp``
+on every call and tear both down on return. The managers here keep the
+Playwright driver, browser and context handles alive between calls, reconnect
+when the browser goes away, and resolve the tab the user is actually looking
+at.
+
+Sync Playwright objects are bound to the thread that created them, so the
+shared sync managers must only be used from one thread.
+"""
+import atexit
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CDP_ENDPOINT = "http://127.0.0.1:9222"
+UI_PAGE_MARKER = "127.0.0.1:6666"
+
+# Returns 2 for a focused tab, 1 for a visible one, 0 otherwise
+ACTIVE_TAB_SCRIPT = "() => document.hasFocus() ? 2 : (document.visibilityState === 'visible' ? 1 : 0)"
+
+
+def _candidate_pages(pages: List[Any]) -> List[Any]:
+    """Drop the dashboard UI tab unless it is the only one open."""
+    candidates = [p for p in pages if UI_PAGE_MARKER not in (p.url or "")]
+    return candidates or list(pages)
+
+
+class CDPConnectionManager:
+    """Cached sync Playwright connection over CDP."""
+
+    def __init__(self, endpoint: str = DEFAULT_CDP_ENDPOINT):
+        self.endpoint = endpoint
+        self._playwright = None
+        self._browser = None
+        self._context = None
+
+    @property
+    def connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    def _drop(self, *_: Any) -> None:
+        self._browser = None
+        self._context = None
+
+    def browser(self):
+        """Return the connected browser, (re)connecting if needed."""
+        if self.connected:
+            return self._browser
+        self._drop()
+        if self._playwright is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.connect_over_cdp(self.endpoint)
+        self._browser.on("disconnected", self._drop)
+        return self._browser
+
+    def context(self):
+        """Return the cached default context of the connected browser."""
+        browser = self.browser()
+        if self._context is None or self._context not in browser.contexts:
+            self._context = browser.contexts[0] if browser.contexts else browser.new_context()
+        return self._context
+
+    def pages(self) -> List[Any]:
+        return list(self.context().pages)
+
+    def active_page(self):
+        """Return the focused (or else visible, or else most recent) tab."""
+        pages = _candidate_pages(self.pages())
+        if not pages:
+            return None
+        best, best_score = pages[-1], -1
+        for page in pages:
+            try:
+                score = page.evaluate(ACTIVE_TAB_SCRIPT)
+            except Exception:
+                continue
+            if score > best_score:
+                best, best_score = page, score
+            if score == 2:
+                break
+        return best
+
+    def new_page(self):
+        return self.context().new_page()
+
+    def close(self) -> None:
+        """Stop the Playwright driver. The browser itself is left running."""
+        self._drop()
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+class AsyncCDPConnectionManager:
+    """Cached async Playwright connection over CDP."""
+
+    def __init__(self, endpoint: str = DEFAULT_CDP_ENDPOINT):
+        self.endpoint = endpoint
+        self._playwright = None
+        self._browser = None
+        self._context = None
+
+    @property
+    def connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    def _drop(self, *_: Any) -> None:
+        self._browser = None
+        self._context = None
+
+    async def browser(self):
+        """Return the connected browser, (re)connecting if needed."""
+        if self.connected:
+            return self._browser
+        self._drop()
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.connect_over_cdp(self.endpoint)
+        self._browser.on("disconnected", self._drop)
+        return self._browser
+
+    async def context(self):
+        """Return the cached default context of the connected browser."""
+        browser = await self.browser()
+        if self._context is None or self._context not in browser.contexts:
+            self._context = browser.contexts[0] if browser.contexts else await browser.new_context()
+        return self._context
+
+    async def pages(self) -> List[Any]:
+        return list((await self.context()).pages)
+
+    async def active_page(self):
+        """Return the focused (or else visible, or else most recent) tab."""
+        pages = _candidate_pages(await self.pages())
+        if not pages:
+            return None
+        best, best_score = pages[-1], -1
+        for page in pages:
+            try:
+                score = await page.evaluate(ACTIVE_TAB_SCRIPT)
+            except Exception:
+                continue
+            if score > best_score:
+                best, best_score = page, score
+            if score == 2:
+                break
+        return best
+
+    async def new_page(self):
+        return await (await self.context()).new_page()
+
+    async def close(self) -> None:
+        """Stop the Playwright driver. The browser itself is left running."""
+        self._drop()
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+_SYNC_MANAGERS: Dict[str, CDPConnectionManager] = {}
+_ASYNC_MANAGERS: Dict[str, AsyncCDPConnectionManager] = {}
+
+
+def get_cdp_manager(endpoint: str = DEFAULT_CDP_ENDPOINT) -> CDPConnectionManager:
+    """Shared sync manager for ``endpoint``."""
+    manager = _SYNC_MANAGERS.get(endpoint)
+    if manager is None:
+        manager = _SYNC_MANAGERS[endpoint] = CDPConnectionManager(endpoint)
+    return manager
+
+
+def get_async_cdp_manager(endpoint: str = DEFAULT_CDP_ENDPOINT) -> AsyncCDPConnectionManager:
+    """Shared async manager for ``endpoint``."""
+    manager = _ASYNC_MANAGERS.get(endpoint)
+    if manager is None:
+        manager = _ASYNC_MANAGERS[endpoint] = AsyncCDPConnectionManager(endpoint)
+    return manager
+
+
+def close_all() -> None:
+    """Stop every shared sync driver (registered with atexit)."""
+    for manager in _SYNC_MANAGERS.values():
+        manager.close()
+    _SYNC_MANAGERS.clear()
+
+
+async def close_all_async() -> None:
+    """Stop every shared async driver. atexit cannot await, so async entry points
+    call this once on their way out."""
+    for manager in _ASYNC_MANAGERS.values():
+        await manager.close()
+    _ASYNC_MANAGERS.clear()
+
+
+atexit.register(close_all)
@@ -0,0 +1,140 @@
+"""Single-evaluate form snapshots.
+
+Serializes every form (and, for employer questions, every question container)
+on the page in one in-page script instead of issuing a CDP roundtrip per
+attribute. The output matches the schema produced by the element-by-element
+walkers in form_parser.py.
+"""
+from typing import Any, Dict, List
+
+FIELD_SELECTOR = "input, textarea, select, button, label"
+QUESTION_FIELD_SELECTOR = FIELD_SELECTOR + ", div[class*='question'], div[data-testid*='question']"
+QUESTION_CONTAINER_SELECTOR = "[data-testid*='question'], [class*='question'], [id*='question']"
+
+FORM_SNAPSHOT_SCRIPT = """
+({ fieldSelector, withTestId, containerSelector }) => {
+    const attr = (el, name) => el.getAttribute(name);
+    const has = (el, name) => el.getAttribute(name) !== null;
+    const text = (el) => (el.innerText || '').trim();
+
+    const parseScope = (scope, selector) => {
+        const elements = Array.from(scope.querySelectorAll(selector));
+
+        // Group labels with their associated inputs
+        const labels = new Map();
+        for (const el of elements) {
+            if (el.tagName.toLowerCase() !== 'label') continue;
+            const forAttr = attr(el, 'for');
+            if (forAttr) {
+                labels.set(forAttr, text(el));
+            } else {
+                const inside = el.querySelector('input, textarea, select');
+                const insideId = inside ? attr(inside, 'id') : null;
+                if (insideId) labels.set(insideId, text(el));
+            }
+        }
+
+        const fields = [];
+        for (const el of elements) {
+            const tag = el.tagName.toLowerCase();
+            if (tag === 'label') continue;
+
+            const id = attr(el, 'id');
+            const name = attr(el, 'name');
+            const type = tag === 'input' ? attr(el, 'type') : tag;
+            const value = attr(el, 'value');
+
+            let label = null;
+            if (id && labels.has(id)) label = labels.get(id);
+            else if (name && labels.has(name)) label = labels.get(name);
+
+            let options = [];
+            if (tag === 'select') {
+                options = Array.from(el.querySelectorAll('option')).map(opt => ({
+                    value: attr(opt, 'value'),
+                    text: text(opt),
+                    selected: has(opt, 'selected')
+                }));
+            } else if (type === 'radio' || type === 'checkbox') {
+                if (name) {
+                    options = Array.from(scope.querySelectorAll('input'))
+                        .filter(other => attr(other, 'name') === name)
+                        .map(other => ({ value: attr(other, 'value'), checked: has(other, 'checked') }));
+                } else {
+                    options = [{ value: value, checked: has(el, 'checked') }];
+                }
+            } else if (type === 'button') {
+                options = [{ text: text(el), type: attr(el, 'type') }];
+            }
+
+            const field = {
+                tag: tag,
+                type: type,
+                id: id,
+                name: name,
+                placeholder: attr(el, 'placeholder'),
+                value: value,
+                required: has(el, 'required'),
+                disabled: has(el, 'disabled'),
+                class: attr(el, 'class')
+            };
+            if (withTestId) field.data_testid = attr(el, 'data-testid');
+            field.label = label;
+            field.options = options;
+            fields.push(field);
+        }
+        return fields;
+    };
+
+    const forms = Array.from(document.querySelectorAll('form')).map((form, idx) => {
+        const info = withTestId ? { type: 'form' } : {};
+        Object.assign(info, {
+            form_index: idx,
+            form_id: attr(form, 'id'),
+            form_class: attr(form, 'class'),
+            form_action: attr(form, 'action'),
+            form_method: attr(form, 'method')
+        });
+        info[withTestId ? 'questions' : 'fields'] = parseScope(form, fieldSelector);
+        return info;
+    });
+
+    const containers = containerSelector ? Array.from(document.querySelectorAll(containerSelector)).map((container, idx) => ({
+        type: 'question_container',
+        container_index: idx,
+        container_id: attr(container, 'id'),
+        container_class: attr(container, 'class'),
+        container_data_testid: attr(container, 'data-testid'),
+        questions: parseScope(container, 'input, textarea, select, button, label')
+    })) : [];
+
+    return { forms, containers };
+}
+"""
+
+_FORMS_ARGS = {"fieldSelector": FIELD_SELECTOR, "withTestId": False, "containerSelector": None}
+_QUESTIONS_ARGS = {"fieldSelector": QUESTION_FIELD_SELECTOR, "withTestId": True, "containerSelector": QUESTION_CONTAINER_SELECTOR}
+
+
+async def snapshot_forms(page) -> List[Dict[str, Any]]:
+    """Serialize every form on the page (async Playwright page)."""
+    result = await page.evaluate(FORM_SNAPSHOT_SCRIPT, _FORMS_ARGS)
+    return result["forms"]
+
+
+def snapshot_forms_sync(page) -> List[Dict[str, Any]]:
+    """Serialize every form on the page (sync Playwright page)."""
+    result = page.evaluate(FORM_SNAPSHOT_SCRIPT, _FORMS_ARGS)
+    return result["forms"]
+
+
+async def snapshot_employer_questions(page) -> List[Dict[str, Any]]:
+    """Serialize forms and question containers for employer question pages (async)."""
+    result = await page.evaluate(FORM_SNAPSHOT_SCRIPT, _QUESTIONS_ARGS)
+    return result["forms"] + result["containers"]
+
+
+def snapshot_employer_questions_sync(page) -> List[Dict[str, Any]]:
+    """Serialize forms and question containers for employer question pages (sync)."""
+    result = page.evaluate(FORM_SNAPSHOT_SCRIPT, _QUESTIONS_ARGS)
+    return result["forms"] + result["containers"]
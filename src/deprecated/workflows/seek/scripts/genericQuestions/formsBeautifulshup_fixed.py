@@ -1,34 +1,82 @@
 from bs4 import BeautifulSoup
 from pathlib import Path
+import asyncio
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional
 
-async def detect_forms_helper_python(page) -> Dict[str, Any]:
+try:
+    import lxml  # noqa: F401  (only needed as a BeautifulSoup tree builder)
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Fastest first; "auto" picks the first one that is installed
+PARSER_BACKENDS = ("selectolax", "lxml", "html.parser")
+
+FORM_HTML_SCRIPT = "forms => forms.map(form => form.outerHTML)"
+
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def available_backends() -> List[str]:
+    """Return the installed parser backends, fastest first."""
+    installed = {
+        "selectolax": LexborHTMLParser is not None,
+        "lxml": lxml is not None,
+        "html.parser": True,
+    }
+    return [name for name in PARSER_BACKENDS if installed[name]]
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """Validate a backend name, resolving "auto" to the fastest installed one."""
+    available = available_backends()
+    if backend == "auto":
+        return available[0]
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML backend {backend!r}; expected one of {PARSER_BACKENDS}")
+    if backend not in available:
+        raise ImportError(f"HTML backend {backend!r} is not installed")
+    return backend
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Shared worker pool that keeps HTML parsing off the event loop."""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    return _PARSE_POOL
+
+
+async def detect_forms_helper_python(page, backend: str = "auto", executor=None) -> Dict[str, Any]:
     """
-    Python-based form detection using BeautifulSoup.
+    Python-based form detection using BeautifulSoup-compatible parsing.
     Alternative to JavaScript form parsing.
+
+    Only the outerHTML of each <form> is shipped from the page, and parsing
+    runs in a worker pool (``executor`` or the shared process pool).
     """
     try:
-        # Get the HTML content from the page
-        html_content = await page.content()
-        
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Find all forms
-        forms = soup.find_all('form')
-        
-        form_data = []
-        
-        for form_index, form in enumerate(forms):
-            form_info = parse_form_with_beautifulsoup(form, form_index)
-            form_data.append(form_info)
+        backend = resolve_backend(backend)
+
+        # Serialize just the forms instead of the whole document
+        form_htmls = await page.eval_on_selector_all('form', FORM_HTML_SCRIPT)
+
+        loop = asyncio.get_running_loop()
+        form_data = await loop.run_in_executor(executor or get_parse_pool(), parse_forms_html, form_htmls, backend)
         
         return {
             'timestamp': page.url,  # Use URL as timestamp for now
             'url': page.url,
             'formsFound': len(form_data),
             'forms': form_data,
+            # Same shape for every backend; resolve_backend(backend) tells which one ran
             'parser': 'beautifulsoup-python'
         }
         
@@ -37,6 +85,94 @@ async def detect_forms_helper_python(page) -> Dict[str, Any]:
         return {"formsFound": 0, "forms": [], "error": str(e)}
 
 
+def parse_forms_html(form_htmls: List[str], backend: str = "html.parser") -> List[Dict[str, Any]]:
+    """Parse a batch of form outerHTML strings (runs inside the worker pool)."""
+    forms = []
+    for form_index, form_html in enumerate(form_htmls):
+        form = load_form(form_html, backend)
+        if form is not None:
+            forms.append(parse_form_with_beautifulsoup(form, form_index))
+    return forms
+
+
+def load_form(form_html: str, backend: str = "html.parser"):
+    """Build the root <form> node for ``backend`` (a bs4 Tag or SelectolaxTag)."""
+    if backend == "selectolax":
+        node = LexborHTMLParser(form_html).css_first('form')
+        return SelectolaxTag(node) if node is not None else None
+    return BeautifulSoup(form_html, backend).find('form')
+
+
+class SelectolaxTag:
+    """
+    Minimal bs4.Tag look-alike over a selectolax node, covering exactly what
+    parse_form_with_beautifulsoup uses so both backends give identical output.
+    """
+
+    # bs4 splits these attribute values on whitespace
+    MULTI_VALUED = frozenset(['class', 'rel', 'rev', 'accept-charset', 'headers', 'accesskey', 'dropzone'])
+    # bs4 get_text() skips strings inside these
+    SKIP_TEXT = frozenset(['script', 'style', 'template', 'rp', 'rt', '-comment'])
+
+    __slots__ = ('node', 'name', '_attrs')
+
+    def __init__(self, node):
+        self.node = node
+        self.name = node.tag
+        self._attrs = None
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        if self._attrs is None:
+            attrs = {}
+            for key, value in self.node.attributes.items():
+                value = '' if value is None else value
+                attrs[key] = value.split() if key in self.MULTI_VALUED else value
+            self._attrs = attrs
+        return self._attrs
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key: str) -> bool:
+        return key in self.attrs
+
+    @property
+    def children(self):
+        return [SelectolaxTag(child) for child in self.node.iter() if not child.tag.startswith('-')]
+
+    def find_all(self, name, **attrs) -> List['SelectolaxTag']:
+        names = {name} if isinstance(name, str) else set(name)
+        found = []
+        nodes = self.node.traverse()
+        next(nodes, None)  # traverse() starts with the node itself
+        for node in nodes:
+            if node.tag not in names:
+                continue
+            tag = SelectolaxTag(node)
+            if all(tag.has_attr(key) == bool(wanted) for key, wanted in attrs.items()):
+                found.append(tag)
+        return found
+
+    def find(self, name, **attrs) -> Optional['SelectolaxTag']:
+        found = self.find_all(name, **attrs)
+        return found[0] if found else None
+
+    def _strings(self, node):
+        for child in node.iter(include_text=True):
+            if child.tag == '-text':
+                yield child.text_content or ''
+            elif child.tag not in self.SKIP_TEXT:
+                yield from self._strings(child)
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        strings = self._strings(self.node)
+        if strip:
+            strings = (text.strip() for text in strings)
+            strings = (text for text in strings if text)
+        return separator.join(strings)
+
+
 def parse_form_with_beautifulsoup(form, form_index: int) -> Dict[str, Any]:
     """Parse a single form using BeautifulSoup"""
     
@@ -1,58 +1,93 @@
 import asyncio
 from playwright.async_api import async_playwright
 
+from cdp_session import close_all_async, get_async_cdp_manager
+
 # Hardcoded URL to open
 URL = "https://jobs.smartrecruiters.com/oneclick-ui/company/NCSAustralia/publication/bf2c0399-ee25-4dfb-ab64-255d5c2bbacb?dcr_ci=NCSAustralia&vq_campaign=e82452d0-2905-5416-acf6-c4733d817f96&vq_source=9b4b5594-5f78-4abf-ac8b-325351ded3e6&utm_source=seek"  # Change this to your target URL
 
+async def launch_persistent_page(p):
+    """Launch the bot's persistent Chromium profile when no browser is listening on CDP."""
+    # Persistent context setup (like browser_server.py)
+    from pathlib import Path
+    user_data_dir = str(Path.home() / ".guu_chromium_profile")
+    launch_args = [
+        "--no-default-browser-check",
+        "--no-first-run",
+        "--explicitly-allowed-ports=6666",
+        "--disable-session-crashed-bubble",
+        "--disable-extensions",
+        "--disable-plugins",
+        "--disable-gpu-sandbox",
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--start-maximized",
+        "--disable-web-security",
+    ]
+    context_args = {
+        "user_data_dir": user_data_dir,
+        "headless": False,
+        "args": launch_args,
+        "viewport": {"width": 1920, "height": 1080},
+    }
+    context = await p.chromium.launch_persistent_context(**context_args)
+    return context, await context.new_page()
+
+
+async def detect_generic_form(page, js_code: str):
+    await page.goto(URL)
+
+    # Wait for at least one form to appear (timeout 15s)
+    try:
+        await page.wait_for_selector('form', timeout=15000)
+    except Exception as e:
+        print("No form found within timeout.")
+
+    # Inject and run the JS code
+    result = await page.evaluate(js_code)
+    print("JS Result:", result)
+
+
 async def main():
     # Read the JS file
     with open("generic_form_detector.js", "r") as f:
         js_code = f.read()
 
-    async with async_playwright() as p:
-        # Persistent context setup (like browser_server.py)
-        from pathlib import Path
-        user_data_dir = str(Path.home() / ".guu_chromium_profile")
-        launch_args = [
-            "--no-default-browser-check",
-            "--no-first-run",
-            "--explicitly-allowed-ports=6666",
-            "--disable-session-crashed-bubble",
-            "--disable-extensions",
-            "--disable-plugins",
-            "--disable-gpu-sandbox",
-            "--disable-background-timer-throttling",
-            "--disable-renderer-backgrounding",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-dev-shm-usage",
-            "--no-sandbox",
-            "--start-maximized",
-            "--disable-web-security",
-        ]
-        context_args = {
-            "user_data_dir": user_data_dir,
-            "headless": False,
-            "args": launch_args,
-            "viewport": {"width": 1920, "height": 1080},
-        }
-        context = await p.chromium.launch_persistent_context(**context_args)
-        page = await context.new_page()
-        await page.goto(URL)
-
-        # Wait for at least one form to appear (timeout 15s)
-        try:
-            await page.wait_for_selector('form', timeout=15000)
-        except Exception as e:
-            print("No form found within timeout.")
+    # Prefer the already running bot browser through the shared CDP connection
+    manager = get_async_cdp_manager()
+    try:
+        page = await manager.new_page()
+    except Exception as e:
+        print(f"No browser on {manager.endpoint} ({e}); launching a persistent context.")
+        page = None
 
-        # Inject and run the JS code
-        result = await page.evaluate(js_code)
-        print("JS Result:", result)
+    if page is not None:
+        try:
+            await detect_generic_form(page, js_code)
+        finally:
+            await page.close()
+        return
 
+    # The failed connect may have started the manager's driver; stop it before starting our own
+    await manager.close()
+    async with async_playwright() as p:
+        context, page = await launch_persistent_page(p)
+        await detect_generic_form(page, js_code)
         await context.close()
 
+async def run():
+    """Run ``main`` once as a script, stopping the shared async drivers at the end."""
+    try:
+        await main()
+    finally:
+        await close_all_async()
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(run())
     except (KeyboardInterrupt, asyncio.CancelledError):
         print("Interrupted. Exiting cleanly.")
@@ -3,6 +3,8 @@ import os
 import asyncio
 from typing import Any, Dict, Optional, AsyncGenerator
 
+from ..quick_apply_utils import snapshot_quick_apply
+
 # ------------------------
 # Pure-Python parsing utilities
 # ------------------------
@@ -148,110 +150,9 @@ async def quick_apply_employer_questions(ctx: Dict[str, Any]) -> AsyncGenerator[
 		return
 	
 	try:
-		form_scan_script = """
-		// Find all questions on the page (not just in forms)
-		let questions = [];
-		
-		// Look for strong tags that contain questions
-		const strongTags = document.querySelectorAll('strong');
-		
-		strongTags.forEach((strong, index) => {
-			const questionText = strong.textContent.trim();
-			if (!questionText) return;
-			
-			// Find the closest parent container that might contain the input
-			let container = strong.closest('div, fieldset, section, label');
-			if (!container) {
-				// Go up a few levels to find the container
-				container = strong.parentElement?.parentElement?.parentElement;
-			}
-				
-			if (!container) return;
-			
-			// Look for select dropdowns in the container or nearby
-			const selects = container.querySelectorAll('select');
-			selects.forEach(select => {
-				const options = Array.from(select.options).map(opt => ({
-					value: opt.value,
-					text: opt.textContent.trim(),
-					selected: opt.selected
-				}));
-				
-				questions.push({
-					type: 'select',
-					question: questionText,
-					element: select.id || select.name || `select_${index}`,
-					options: options,
-					required: select.required,
-					currentValue: select.value
-				});
-			});
-			
-			// Look for radio button groups - check the fieldset or parent div
-			let radioContainer = container;
-			if (container.tagName === 'FIELDSET') {
-				radioContainer = container;
-			} else {
-				// Find the fieldset that might contain this question
-				radioContainer = container.closest('fieldset') || container;
-			}
-			
-			const radios = radioContainer.querySelectorAll('input[type="radio"]');
-			if (radios.length > 0) {
-				// Group radios by name
-				const radioGroups = {};
-				radios.forEach(radio => {
-					const name = radio.name;
-					if (!radioGroups[name]) {
-						radioGroups[name] = [];
-					}
-					
-					// Find the label text for this radio
-					let labelText = '';
-					const label = radioContainer.querySelector(`label[for="${radio.id}"]`);
-					if (label) {
-						labelText = label.textContent.trim();
-					} else {
-						// Try to find text near the radio
-						const parent = radio.closest('div');
-						if (parent) {
-							const spans = parent.querySelectorAll('span');
-							labelText = spans[spans.length - 1]?.textContent?.trim() || radio.value;
-						}
-					}
-					
-					radioGroups[name].push({
-						value: radio.value,
-						text: labelText,
-						checked: radio.checked,
-						id: radio.id
-					});
-				});
-				
-				// Add each radio group as a question (but avoid duplicates)
-				Object.entries(radioGroups).forEach(([name, options]) => {
-					// Check if we already have this radio group
-					const alreadyExists = questions.some(q => q.type === 'radio' && q.element === name);
-					if (!alreadyExists) {
-						questions.push({
-							type: 'radio',
-							question: questionText,
-							element: name,
-							options: options,
-							required: radios[0].required
-						});
-					}
-				});
-			}
-		});
-		
-		return {
-			questionsFound: questions.length,
-			questions: questions
-		};
-		"""
-		
-		result = await page.evaluate(form_scan_script)
+		snapshot = await snapshot_quick_apply(page)
+		ctx["quick_apply_snapshot"] = snapshot
+		result = (snapshot or {}).get("employer_questions")
 		
 		if not result or result['questionsFound'] == 0:
 			yield "no_questions_found"
@@ -266,4 +167,3 @@ async def quick_apply_employer_questions(ctx: Dict[str, Any]) -> AsyncGenerator[
 	except Exception as e:
 		print(f"Questions scan error: {e}")
 		yield "questions_scan_error"
-
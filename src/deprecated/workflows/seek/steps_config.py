@@ -12,6 +12,7 @@ WORKFLOW_META = {
 	"title": "Seek",
 	"description": "Search and apply on seek.com.au Jobs",
 	"start_step": "init_context",
+	"circuit_breaker": {"threshold": 3, "window": 600, "cooldown": 300},
 }
 
 STEPS_CONFIG = {
@@ -48,6 +49,7 @@ STEPS_CONFIG = {
 		"step": 2,
 		"func": wait_for_page_load,
 		"transitions": {"page_loaded": "detect_page_state", "page_load_retry": "refresh_page"},
+		"retry": {"events": ["page_load_retry"], "max_attempts": 4, "backoff": 3, "on_exhausted": "finish_run"},
 		"timeout": 20,
 		"on_timeout_event": "page_load_retry",
 	},
@@ -55,6 +57,7 @@ STEPS_CONFIG = {
 		"step": 3,
 		"func": detect_page_state,
 		"transitions": {"cards_present": "collect_job_cards", "sign_in_required": "show_sign_in_banner", "no_cards_found": "refresh_page"},
+		"retry": {"events": ["no_cards_found"], "max_attempts": 3, "backoff": 5, "on_exhausted": "finish_run"},
 		"timeout": 20,
 		"on_timeout_event": "no_cards_found",
 	},
@@ -62,6 +65,7 @@ STEPS_CONFIG = {
 		"step": 4,
 		"func": show_sign_in_banner,
 		"transitions": {"signin_banner_shown": "done", "signin_banner_retry": "refresh_page"},
+		"retry": {"events": ["signin_banner_retry"], "max_attempts": 3, "backoff": 5, "on_exhausted": "finish_run"},
 		"timeout": 20,
 		"on_timeout_event": "signin_banner_retry",
 	},
@@ -69,6 +73,7 @@ STEPS_CONFIG = {
 		"step": 5,
 		"func": collect_job_cards,
 		"transitions": {"cards_collected": "click_job_card", "cards_collect_retry": "refresh_page"},
+		"retry": {"events": ["cards_collect_retry"], "max_attempts": 3, "backoff": 3, "on_exhausted": "finish_run"},
 		"timeout": 20,
 		"on_timeout_event": "cards_collect_retry",
 	},
@@ -83,6 +88,7 @@ STEPS_CONFIG = {
 		"step": 7,
 		"func": wait_for_details_panel,
 		"transitions": {"details_panel_ready": "detect_quick_apply", "details_panel_retry": "refresh_page"},
+		"retry": {"events": ["details_panel_retry"], "max_attempts": 3, "backoff": 3, "on_exhausted": "finish_run"},
 		"timeout": 25,
 		"on_timeout_event": "details_panel_retry",
 	},
@@ -98,7 +104,7 @@ STEPS_CONFIG = {
 		"func": generic_forms_lions,
 		"transitions": {"questions_found": "close_quick_apply_and_continue_search", "questions_not_found": "close_quick_apply_and_continue_search"},
 		"timeout": 20,
-		"on_timeout_event": "generic_forms_lions",
+		"on_timeout_event": "questions_not_found",
 	},
 	"click_quick_apply": {
 		"step": 9,
@@ -255,7 +261,7 @@ STEPS_CONFIG = {
 			"close_and_continue_error": "finish_run"
 		},
 		"timeout": 20,
-		"on_timeout_event": "employer_questions_error",
+		"on_timeout_event": "close_and_continue_error",
 	},
 	"finish_run": {
 		"step": 16,
@@ -265,7 +271,7 @@ STEPS_CONFIG = {
 			"finish_error": "done"
 		},
 		"timeout": 10,
-		"on_timeout_event": "done",
+		"on_timeout_event": "finish_error",
 	},
 }     
 
@@ -0,0 +1,197 @@
+"""Per-account cache of Playwright storage state (cookies + localStorage).
+
+A run that finds a fresh cached session restores it into its browser context
+and skips the login steps. Sessions are stored under ``sessions/`` as
+``<platform>-<account>.json`` and expire after ``SESSION_TTL``.
+
+Before a cached session is trusted it gets a lightweight check: one request
+through the context's API client (no page, no rendering) to a page that
+redirects to the login form when signed out. A successful check is trusted
+for ``VALIDATION_TTL`` so repeated cycles do not re-check. Platforms without
+a check URL rely on the TTL and on the auth cookie not having expired.
+
+    restored = await restore_session(ctx, "linkedin")   # into ctx["browser_context"]
+    context = await new_context(browser, "linkedin", account)  # or into a new context
+    await save_session(ctx, "linkedin")                  # after a confirmed login
+"""
+from __future__ import annotations
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SESSIONS_DIR = Path(__file__).resolve().parent / "sessions"
+SESSION_TTL = 7 * 24 * 3600
+VALIDATION_TTL = 15 * 60
+
+# check_url redirects to a login page when the session is no longer signed in
+PLATFORM_CHECKS: Dict[str, Dict[str, Any]] = {
+    "linkedin": {"check_url": "https://www.linkedin.com/feed/", "auth_cookies": ["li_at"]},
+    # The profile page is signed-in only; signed out it redirects to /oauth/login
+    "seek": {"check_url": "https://www.seek.com.au/profile/me", "auth_cookies": []},
+    "indeed": {"check_url": None, "auth_cookies": ["CTK"]},
+}
+
+
+def _account_slug(account: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", str(account or "default").lower()).strip("_") or "default"
+
+
+class SessionCache:
+    """Storage states on disk, one file per (platform, account)."""
+
+    def __init__(self, directory: Optional[str] = None, ttl: float = SESSION_TTL):
+        self.directory = Path(directory) if directory else SESSIONS_DIR
+        self.ttl = ttl
+
+    def path(self, platform: str, account: str) -> Path:
+        return self.directory / f"{platform}-{_account_slug(account)}.json"
+
+    def load(self, platform: str, account: str) -> Optional[Dict[str, Any]]:
+        """The cached entry if it exists, is within the TTL and its auth cookies are unexpired."""
+        try:
+            with open(self.path(platform, account), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Could not read session cache for {platform}: {e}")
+            return None
+        if time.time() - entry.get("saved_at", 0) > self.ttl:
+            return None
+        now = time.time()
+        cookies = {c.get("name"): c for c in entry.get("storage_state", {}).get("cookies", [])}
+        for name in PLATFORM_CHECKS.get(platform, {}).get("auth_cookies", []):
+            cookie = cookies.get(name)
+            # Playwright stores -1 for session cookies
+            if cookie is None or 0 < cookie.get("expires", -1) < now:
+                return None
+        return entry
+
+    def store(self, platform: str, account: str, storage_state: Dict[str, Any], validated: bool = True) -> None:
+        now = time.time()
+        entry = {"storage_state": storage_state, "saved_at": now, "validated_at": now if validated else 0}
+        self._write(self.path(platform, account), entry)
+
+    def mark_validated(self, platform: str, account: str, entry: Dict[str, Any]) -> None:
+        entry["validated_at"] = time.time()
+        self._write(self.path(platform, account), entry)
+
+    def forget(self, platform: str, account: str) -> None:
+        try:
+            self.path(platform, account).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write(self, path: Path, entry: Dict[str, Any]) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            # Cookies are credentials; keep the file private to the user
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            tmp_path.replace(path)
+        except Exception as e:
+            print(f"Could not save session cache {path}: {e}")
+
+
+_CACHE = SessionCache()
+
+
+def get_session_cache() -> SessionCache:
+    return _CACHE
+
+
+def _account(ctx: Dict[str, Any]) -> str:
+    return str(ctx.get("account") or ctx.get("user_id") or "default")
+
+
+async def _still_signed_in(context, platform: str) -> bool:
+    """Lightweight check: the check URL answers 200 instead of redirecting to the login page."""
+    check_url = PLATFORM_CHECKS.get(platform, {}).get("check_url")
+    if not check_url:
+        return True
+    try:
+        response = await context.request.get(check_url, max_redirects=0, timeout=10000)
+        return response.status == 200
+    except Exception as e:
+        print(f"Session check for {platform} failed: {e}")
+        return False
+
+
+async def restore_session(ctx: Dict[str, Any], platform: str) -> bool:
+    """Load a cached session into ``ctx["browser_context"]``; True if it is valid.
+
+    Invalid sessions are removed from the cache. A session already restored in
+    this run is not checked again until its validation expires.
+    """
+    context = ctx.get("browser_context")
+    if context is None:
+        return False
+    account = _account(ctx)
+    entry = _CACHE.load(platform, account)
+    if entry is None:
+        return False
+    flag = f"{platform}_session_restored"
+    if not ctx.get(flag):
+        state = entry.get("storage_state") or {}
+        try:
+            if state.get("cookies"):
+                await context.add_cookies(state["cookies"])
+            for origin in state.get("origins") or []:
+                await context.add_init_script(_local_storage_script(origin))
+        except Exception as e:
+            print(f"Could not restore {platform} session: {e}")
+            return False
+        ctx[flag] = True
+    if time.time() - entry.get("validated_at", 0) < VALIDATION_TTL:
+        return True
+    if await _still_signed_in(context, platform):
+        _CACHE.mark_validated(platform, account, entry)
+        return True
+    print(f"Cached {platform} session for {account} is no longer signed in; discarding")
+    _CACHE.forget(platform, account)
+    ctx[flag] = False
+    return False
+
+
+async def save_session(ctx: Dict[str, Any], platform: str) -> None:
+    """Store the context's current storage state after a confirmed login."""
+    context = ctx.get("browser_context")
+    if context is None:
+        return
+    try:
+        state = await context.storage_state()
+    except Exception as e:
+        print(f"Could not read {platform} storage state: {e}")
+        return
+    _CACHE.store(platform, _account(ctx), state)
+    ctx[f"{platform}_session_restored"] = True
+
+
+def discard_session(ctx: Dict[str, Any], platform: str) -> None:
+    """Forget the cached session after the page showed it is not signed in."""
+    _CACHE.forget(platform, _account(ctx))
+    ctx[f"{platform}_session_restored"] = False
+
+
+async def new_context(browser, platform: str, account: str, **kwargs: Any):
+    """``browser.new_context`` with the cached session for ``account`` preloaded, if there is one."""
+    entry = _CACHE.load(platform, account)
+    if entry is not None:
+        kwargs.setdefault("storage_state", entry.get("storage_state"))
+    return await browser.new_context(**kwargs)
+
+
+def _local_storage_script(origin: Dict[str, Any]) -> str:
+    items = {item["name"]: item["value"] for item in origin.get("localStorage") or []}
+    return (
+        "(() => {"
+        f" if (location.origin !== {json.dumps(origin.get('origin'))}) return;"
+        f" const items = {json.dumps(items)};"
+        " for (const [k, v] of Object.entries(items)) { if (localStorage.getItem(k) === null) localStorage.setItem(k, v); }"
+        "})();"
+    )
@@ -0,0 +1,379 @@
+"""Compile a STEPS_CONFIG into integer-indexed tables and run it.
+
+``compile_workflow`` numbers every step and every routing event once. Then:
+
+- ``transitions[step_id][event_id]`` is the target step id, ``NO_ROUTE`` or ``FINISHED``
+- ``funcs``, ``timeouts`` and ``timeout_events`` are plain lists indexed by step id
+
+``run_workflow`` drives a compiled workflow. For each yielded value it does
+one dict lookup (event string -> id) and one list lookup, and never builds a
+string. ``events.Progress`` yields, and strings the current step does not
+route, are passed to ``on_progress`` untouched; only the callback formats
+them, if it wants to.
+
+Steps with a ``retry`` policy (see retry_policy) get a bounded number of
+failed attempts with backoff before being routed to ``on_exhausted``; the
+per-step counters are kept in ``ctx["retry_stats"]``.
+
+What counts as a failure is decided per step: its retry events, and its
+``on_timeout_event`` when that names a failure. A timeout that falls back to
+an ordinary event (a login prompt left for the user, an optional step that
+simply ran out of time) is the step's normal path.
+
+Every run gets a ``flight_recorder.FlightRecorder`` in
+``ctx["flight_recorder"]`` unless the caller put one there (or None, to
+opt out); it writes a trace bundle when a step fails.
+
+``ctx["profile_roundtrips"] = True`` proxies the Playwright objects in ``ctx``
+through ``cdp_profiler`` for the run and prints the per-step roundtrip report
+when it ends.
+
+``to_dot`` / ``to_json`` export the compiled graph for visualization:
+
+    python step_compiler.py linkedin --format dot > linkedin.dot
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    from .cdp_profiler import profile_roundtrips
+    from .events import Progress
+    from .flight_recorder import FlightRecorder
+    from .retry_policy import RetryPolicy, RetryStats, get_circuit_breaker
+except ImportError:  # run as a script
+    from cdp_profiler import profile_roundtrips
+    from events import Progress
+    from flight_recorder import FlightRecorder
+    from retry_policy import RetryPolicy, RetryStats, get_circuit_breaker
+
+NO_ROUTE = -1
+FINISHED = -2
+# Targets that end the run rather than naming a step
+TERMINAL_TARGETS = ("done", None)
+# An on_timeout_event matching this is a failure of its step
+FAILURE_EVENT_PATTERN = re.compile(r"fail|error|timeout|could not|retry|incomplete|^no[ _]", re.IGNORECASE)
+
+
+@dataclass
+class CompiledWorkflow:
+    title: str
+    start: int
+    step_names: List[str]
+    step_numbers: List[Any]
+    funcs: List[Any]
+    timeouts: List[float]
+    timeout_events: List[int]
+    event_names: List[str]
+    event_ids: Dict[str, int]
+    transitions: List[List[int]]
+    step_ids: Dict[str, int] = field(default_factory=dict)
+    retry_policies: List[Optional[RetryPolicy]] = field(default_factory=list)
+    retry_events: List[frozenset] = field(default_factory=list)
+    exhausted_targets: List[int] = field(default_factory=list)
+    failure_events: List[frozenset] = field(default_factory=list)
+    circuit_breaker: Optional[Dict[str, Any]] = None
+
+    def route(self, step_id: int, event: Any) -> int:
+        """Target of ``event`` from ``step_id``: a step id, FINISHED or NO_ROUTE."""
+        event_id = self.event_ids.get(event)
+        if event_id is None:
+            return NO_ROUTE
+        return self.transitions[step_id][event_id]
+
+    def edges(self):
+        """Yield (from_step, event, to_step_or_None) for every routed transition."""
+        for step_id, row in enumerate(self.transitions):
+            for event_id, target in enumerate(row):
+                if target != NO_ROUTE:
+                    yield (self.step_names[step_id], self.event_names[event_id],
+                           None if target == FINISHED else self.step_names[target])
+
+    def is_failure(self, step: str, event: Optional[str]) -> bool:
+        """Whether ``event`` ending ``step`` means the step failed; None (no routed event) always does."""
+        if event is None:
+            return True
+        step_id = self.step_ids.get(step)
+        if step_id is None or not self.failure_events:
+            return False
+        return self.event_ids.get(event) in self.failure_events[step_id]
+
+
+def compile_workflow(steps_config: Dict[str, Dict[str, Any]], meta: Optional[Dict[str, Any]] = None) -> CompiledWorkflow:
+    """Number steps and events and build the dense transition table.
+
+    Raises ValueError for a transition, start step or retry ``on_exhausted``
+    that names an unknown step, or an on_timeout_event / retry event the step
+    does not route.
+    """
+    meta = meta or {}
+    step_names = list(steps_config)
+    step_ids = {name: i for i, name in enumerate(step_names)}
+
+    event_names: List[str] = []
+    event_ids: Dict[str, int] = {}
+    for config in steps_config.values():
+        for event in list((config.get("transitions") or {})) + [config.get("on_timeout_event")]:
+            if event is not None and event not in event_ids:
+                event_ids[event] = len(event_names)
+                event_names.append(event)
+
+    def target_id(target: Any, what: str, name: str) -> int:
+        if target in TERMINAL_TARGETS:
+            return FINISHED
+        if target in step_ids:
+            return step_ids[target]
+        raise ValueError(f"step '{name}': {what} targets unknown step '{target}'")
+
+    transitions = []
+    timeout_events = []
+    retry_policies = []
+    retry_events = []
+    exhausted_targets = []
+    failure_events = []
+    for name, config in steps_config.items():
+        row = [NO_ROUTE] * len(event_names)
+        for event, target in (config.get("transitions") or {}).items():
+            row[event_ids[event]] = target_id(target, f"transition '{event}'", name)
+        transitions.append(row)
+        timeout_event = config.get("on_timeout_event")
+        if timeout_event is not None and row[event_ids[timeout_event]] == NO_ROUTE:
+            raise ValueError(f"step '{name}': on_timeout_event '{timeout_event}' is not routed")
+        timeout_events.append(event_ids[timeout_event] if timeout_event is not None else NO_ROUTE)
+        failed = {event_ids[timeout_event]} if timeout_event and FAILURE_EVENT_PATTERN.search(timeout_event) else set()
+
+        policy = RetryPolicy.from_config(name, config)
+        retry_policies.append(policy)
+        if policy is None:
+            retry_events.append(frozenset())
+            exhausted_targets.append(NO_ROUTE)
+            failure_events.append(frozenset(failed))
+            continue
+        for event in policy.events:
+            if event not in event_ids or row[event_ids[event]] == NO_ROUTE:
+                raise ValueError(f"step '{name}': retry event '{event}' is not routed")
+        retry_events.append(frozenset(event_ids[event] for event in policy.events))
+        exhausted_targets.append(target_id(policy.on_exhausted, "retry on_exhausted", name))
+        failure_events.append(retry_events[-1] | failed)
+
+    start = meta.get("start_step", step_names[0] if step_names else None)
+    if start not in step_ids:
+        raise ValueError(f"start_step '{start}' is not a step")
+
+    return CompiledWorkflow(
+        title=meta.get("title", ""),
+        start=step_ids[start],
+        step_names=step_names,
+        step_numbers=[config.get("step") for config in steps_config.values()],
+        funcs=[config.get("func") for config in steps_config.values()],
+        timeouts=[float(config.get("timeout") or 0) for config in steps_config.values()],
+        timeout_events=timeout_events,
+        event_names=event_names,
+        event_ids=event_ids,
+        transitions=transitions,
+        step_ids=step_ids,
+        retry_policies=retry_policies,
+        retry_events=retry_events,
+        exhausted_targets=exhausted_targets,
+        failure_events=failure_events,
+        circuit_breaker=meta.get("circuit_breaker"),
+    )
+
+
+ProgressCallback = Callable[[str, Union[Progress, str]], Any]
+# (step, event, next step or None, whether the step timed out)
+TransitionCallback = Callable[[str, Optional[str], Optional[str], bool], Any]
+
+
+async def _maybe_await(result: Any) -> None:
+    if isinstance(result, Awaitable):
+        await result
+
+
+def _chain(first: Optional[Callable[..., Any]], second: Optional[Callable[..., Any]]) -> Optional[Callable[..., Any]]:
+    if first is None or second is None:
+        return first or second
+
+    async def both(*args: Any) -> None:
+        await _maybe_await(first(*args))
+        await _maybe_await(second(*args))
+    return both
+
+
+async def run_step(workflow: CompiledWorkflow, step_id: int, ctx: Dict[str, Any],
+                   on_progress: Optional[ProgressCallback] = None) -> Tuple[int, bool]:
+    """Run one step until it yields an event it routes; returns (event id, timed out).
+
+    Falls back to the step's timeout event when the deadline passes or the step
+    finishes without a routed event.
+    """
+    row = workflow.transitions[step_id]
+    event_ids = workflow.event_ids
+    timeout = workflow.timeouts[step_id]
+    name = workflow.step_names[step_id]
+    deadline = time.monotonic() + timeout if timeout else None
+    generator = workflow.funcs[step_id](ctx)
+    try:
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                value = await asyncio.wait_for(generator.__anext__(), remaining)
+            except (StopAsyncIteration, asyncio.TimeoutError):
+                break
+            if type(value) is not Progress:
+                event_id = event_ids.get(value)
+                if event_id is not None and row[event_id] != NO_ROUTE:
+                    return event_id, False
+            if on_progress is not None:
+                await _maybe_await(on_progress(name, value))
+    finally:
+        await generator.aclose()
+    return workflow.timeout_events[step_id], True
+
+
+async def run_workflow(workflow: CompiledWorkflow, ctx: Dict[str, Any], max_steps: int = 500,
+                       on_progress: Optional[ProgressCallback] = None,
+                       on_transition: Optional[TransitionCallback] = None) -> Optional[str]:
+    """Dispatch steps from the start step until a terminal transition; returns the last step name."""
+    stats = ctx.setdefault("retry_stats", RetryStats())
+    if "flight_recorder" not in ctx:
+        ctx["flight_recorder"] = FlightRecorder(workflow.title or "workflow")
+    recorder = ctx["flight_recorder"]
+    if recorder is not None:
+        record_progress, record_transition = recorder.hooks(ctx, workflow.is_failure)
+        on_progress = _chain(record_progress, on_progress)
+        on_transition = _chain(record_transition, on_transition)
+    profiler = profile_roundtrips(ctx, workflow) if ctx.get("profile_roundtrips") else None
+    try:
+        return await _dispatch(workflow, ctx, max_steps, stats, on_progress, on_transition)
+    finally:
+        if profiler is not None:
+            profiler.print_report()
+
+
+async def _dispatch(workflow: CompiledWorkflow, ctx: Dict[str, Any], max_steps: int, stats: RetryStats,
+                    on_progress: Optional[ProgressCallback], on_transition: Optional[TransitionCallback]) -> Optional[str]:
+    breaker = None
+    if workflow.circuit_breaker is not None:
+        breaker = get_circuit_breaker(workflow.title or "workflow", workflow.circuit_breaker)
+    step_id = workflow.start
+    for _ in range(max_steps):
+        if breaker is not None:
+            await breaker.wait_if_open()
+        event_id, timed_out = await run_step(workflow, step_id, ctx, on_progress)
+        target = workflow.transitions[step_id][event_id] if event_id != NO_ROUTE else NO_ROUTE
+        policy = workflow.retry_policies[step_id] if workflow.retry_policies else None
+        if policy is not None and target != NO_ROUTE:
+            name = workflow.step_names[step_id]
+            if event_id in workflow.retry_events[step_id]:
+                attempt = stats.attempts.get(name, 0) + 1
+                if attempt > policy.max_attempts:
+                    print(f"Step '{name}' failed {policy.max_attempts} retries; "
+                          f"going to '{policy.on_exhausted or 'done'}'")
+                    stats.attempts[name] = 0
+                    stats.exhausted[name] = stats.exhausted.get(name, 0) + 1
+                    target = workflow.exhausted_targets[step_id]
+                    if breaker is not None:
+                        breaker.record_failure(name)
+                else:
+                    delay = policy.delay(attempt)
+                    stats.attempts[name] = attempt
+                    stats.retries[name] = stats.retries.get(name, 0) + 1
+                    stats.backoff_seconds[name] = stats.backoff_seconds.get(name, 0.0) + delay
+                    await asyncio.sleep(delay)
+            else:
+                stats.attempts[name] = 0
+        if on_transition is not None:
+            next_name = workflow.step_names[target] if target >= 0 else None
+            event_name = workflow.event_names[event_id] if event_id != NO_ROUTE else None
+            await _maybe_await(on_transition(workflow.step_names[step_id], event_name, next_name, timed_out))
+        if target == FINISHED:
+            return workflow.step_names[step_id]
+        if target == NO_ROUTE:
+            print(f"No transition out of step '{workflow.step_names[step_id]}'; stopping")
+            return workflow.step_names[step_id]
+        step_id = target
+    print(f"Stopped after {max_steps} steps")
+    return workflow.step_names[step_id]
+
+
+def to_json(workflow: CompiledWorkflow) -> Dict[str, Any]:
+    """Nodes and edges of the compiled graph."""
+    return {
+        "title": workflow.title,
+        "start": workflow.step_names[workflow.start],
+        "nodes": [
+            {
+                "id": step_id,
+                "name": name,
+                "step": workflow.step_numbers[step_id],
+                "func": getattr(func, "__name__", func),
+                "timeout": workflow.timeouts[step_id],
+                "on_timeout_event": workflow.event_names[workflow.timeout_events[step_id]]
+                if workflow.timeout_events[step_id] != NO_ROUTE else None,
+                "retry": vars(workflow.retry_policies[step_id]) if workflow.retry_policies[step_id] else None,
+            }
+            for step_id, (name, func) in enumerate(zip(workflow.step_names, workflow.funcs))
+        ],
+        "edges": [{"from": src, "event": event, "to": dst} for src, event, dst in workflow.edges()],
+    }
+
+
+def to_dot(workflow: CompiledWorkflow) -> str:
+    """Graphviz rendering of the compiled graph; timeout edges are dashed."""
+    quote = lambda text: '"' + str(text).replace('"', '\\"') + '"'
+    lines = [f"digraph {quote(workflow.title or 'workflow')} {{", "  rankdir=LR;", "  node [shape=box];",
+             '  "(end)" [shape=doublecircle];']
+    lines.append(f"  {quote(workflow.step_names[workflow.start])} [style=bold];")
+    for step_id, row in enumerate(workflow.transitions):
+        timeout_event = workflow.timeout_events[step_id]
+        for event_id, target in enumerate(row):
+            if target == NO_ROUTE:
+                continue
+            dst = "(end)" if target == FINISHED else workflow.step_names[target]
+            style = ", style=dashed" if event_id == timeout_event else ""
+            lines.append(f"  {quote(workflow.step_names[step_id])} -> {quote(dst)} "
+                         f"[label={quote(workflow.event_names[event_id])}{style}];")
+        policy = workflow.retry_policies[step_id]
+        if policy is not None:
+            target = workflow.exhausted_targets[step_id]
+            dst = "(end)" if target == FINISHED else workflow.step_names[target]
+            lines.append(f"  {quote(workflow.step_names[step_id])} -> {quote(dst)} "
+                         f"[label={quote(f'retries exhausted ({policy.max_attempts})')}, style=dotted];")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # Read the config statically so exporting does not import the step modules
+    try:
+        from .validate_steps import WORKFLOWS_DIR, load_config
+    except ImportError:
+        from validate_steps import WORKFLOWS_DIR, load_config
+
+    parser = argparse.ArgumentParser(description="Export a compiled workflow graph")
+    parser.add_argument("platform", choices=["linkedin", "seek", "indeed"])
+    parser.add_argument("--format", choices=["dot", "json"], default="dot")
+    args = parser.parse_args(argv)
+
+    steps, meta, _ = load_config(WORKFLOWS_DIR / args.platform / "steps_config.py")
+    if not steps:
+        print(f"{args.platform} has no STEPS_CONFIG", file=sys.stderr)
+        return 1
+    for step in steps.values():
+        step.pop("line", None)
+    workflow = compile_workflow(steps, meta)
+    print(to_dot(workflow) if args.format == "dot" else json.dumps(to_json(workflow), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
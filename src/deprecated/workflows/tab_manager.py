@@ -0,0 +1,252 @@
+"""Per-context tab tracking, tab budget and background reclaiming of orphaned tabs.
+
+Every tab a step opens, or that opens because a step clicked something, is
+recorded with the step that owns it. The manager then:
+
+- enforces a budget of open tabs (``ctx["max_tabs"]``, default ``MAX_TABS``)
+  before each new tab by closing the least recently used reclaimable tabs
+- reclaims orphans in the background every ``GC_INTERVAL`` seconds: tabs that
+  nothing in ``ctx`` refers to any more and that have been idle for
+  ``ORPHAN_AFTER`` seconds
+- closes every tab one step owns in one call (``close_owned_by``), so an apply
+  that spawned several tabs is cleaned up completely
+
+Pinned tabs, leased tabs and tabs on protected hosts (the local dashboard)
+are never closed by the manager. A tab is reclaimable only if no ``ctx``
+value is that page; code that keeps a page in a local variable instead
+holds a lease on it for as long as it uses it.
+
+    tabs = get_tab_manager(ctx)              # one per ctx["browser_context"]
+    page = await tabs.new_page("open_homepage", "search")
+    tabs.adopt(popup, "click_quick_apply", "apply")
+    with tabs.in_use(popup):                 # not reclaimed while the block runs
+        ...
+    await tabs.close_owned_by("click_quick_apply")
+    await tabs.stop()                        # at the end of the run
+"""
+from __future__ import annotations
+import asyncio
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+MAX_TABS = 6
+ORPHAN_AFTER = 60.0
+GC_INTERVAL = 30.0
+PROTECTED_URLS: Tuple[str, ...] = ("127.0.0.1:6666",)
+
+
+@dataclass
+class TabRecord:
+    page: Any
+    owner: str
+    purpose: str = ""
+    pinned: bool = False
+    leases: int = 0
+    opened_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class TabManager:
+    """Owns the open tabs of one browser context."""
+
+    def __init__(self, context, ctx: Optional[Dict[str, Any]] = None, max_tabs: int = MAX_TABS,
+                 orphan_after: float = ORPHAN_AFTER, protected_urls: Tuple[str, ...] = PROTECTED_URLS):
+        self.context = context
+        self.ctx = ctx if ctx is not None else {}
+        self.max_tabs = max(1, int(max_tabs))
+        self.orphan_after = orphan_after
+        self.protected_urls = protected_urls
+        self.tabs: Dict[int, TabRecord] = {}
+        self.current_step = "(unknown)"
+        self.closed = 0
+        self._gc_task: Optional[asyncio.Task] = None
+        context.on("page", self._on_page)
+        for page in list(context.pages):
+            self.adopt(page, "(preexisting)")
+
+    # Tracking
+
+    def _on_page(self, page) -> None:
+        # Popups opened by a click belong to the step that is running
+        self.adopt(page, self.current_step, "popup")
+
+    def adopt(self, page, owner: str, purpose: str = "", pinned: bool = False) -> Any:
+        """Track ``page`` (or retag it if already tracked); returns the page."""
+        if page is None:
+            return page
+        record = self.tabs.get(id(page))
+        if record is None:
+            record = self.tabs[id(page)] = TabRecord(page, owner, purpose, pinned)
+            page.on("close", lambda _: self.tabs.pop(id(page), None))
+        elif record.owner in ("(unknown)", "(preexisting)") or purpose != "popup":
+            # An explicit adopt after the popup listener ran is the better description
+            record.owner, record.purpose = owner, purpose or record.purpose
+        record.pinned = record.pinned or pinned
+        record.last_used = time.monotonic()
+        return page
+
+    def touch(self, page) -> None:
+        record = self.tabs.get(id(page))
+        if record is not None:
+            record.last_used = time.monotonic()
+
+    def pin(self, page, pinned: bool = True) -> None:
+        record = self.tabs.get(id(page))
+        if record is not None:
+            record.pinned = pinned
+
+    def lease(self, page) -> None:
+        """Mark ``page`` in use until the matching ``release``; leases nest."""
+        record = self.tabs.get(id(page))
+        if record is not None:
+            record.leases += 1
+            record.last_used = time.monotonic()
+
+    def release(self, page) -> None:
+        record = self.tabs.get(id(page))
+        if record is not None:
+            record.leases = max(0, record.leases - 1)
+            record.last_used = time.monotonic()
+
+    @contextmanager
+    def in_use(self, page) -> Iterator[Any]:
+        """Lease ``page`` for the duration of a ``with`` block."""
+        self.lease(page)
+        try:
+            yield page
+        finally:
+            self.release(page)
+
+    def owned_by(self, owner: str) -> List[Any]:
+        return [r.page for r in self.tabs.values() if r.owner == owner]
+
+    def _referenced(self) -> set:
+        return {id(v) for v in self.ctx.values() if id(v) in self.tabs}
+
+    def _reclaimable(self, record: TabRecord, referenced: set) -> bool:
+        if record.pinned or record.leases or id(record.page) in referenced:
+            return False
+        try:
+            url = record.page.url or ""
+        except Exception:
+            url = ""
+        return not any(p in url for p in self.protected_urls)
+
+    # Opening and closing
+
+    async def new_page(self, owner: str, purpose: str = "", pinned: bool = False):
+        """Open a tab owned by ``owner``, first making room for it within the budget."""
+        await self.enforce_budget(reserve=1)
+        page = await self.context.new_page()
+        return self.adopt(page, owner, purpose, pinned)
+
+    async def close(self, page) -> None:
+        if page is None:
+            return
+        self.tabs.pop(id(page), None)
+        try:
+            if not page.is_closed():
+                await page.close()
+                self.closed += 1
+        except Exception as e:
+            print(f"[tabs] could not close tab: {e}")
+
+    async def close_owned_by(self, owner: str, keep: Tuple[Any, ...] = ()) -> int:
+        """Close every unpinned tab ``owner`` opened, except ``keep``; returns how many were closed."""
+        keep_ids = {id(p) for p in keep if p is not None}
+        victims = [r.page for r in self.tabs.values()
+                   if r.owner == owner and not r.pinned and id(r.page) not in keep_ids]
+        for page in victims:
+            await self.close(page)
+        return len(victims)
+
+    async def close_where(self, predicate: Callable[[TabRecord], bool]) -> int:
+        victims = [r.page for r in list(self.tabs.values()) if not r.pinned and predicate(r)]
+        for page in victims:
+            await self.close(page)
+        return len(victims)
+
+    async def enforce_budget(self, reserve: int = 0) -> int:
+        """Close least recently used reclaimable tabs until ``reserve`` more fit in the budget."""
+        excess = len(self.tabs) + reserve - self.max_tabs
+        if excess <= 0:
+            return 0
+        referenced = self._referenced()
+        candidates = sorted((r for r in self.tabs.values() if self._reclaimable(r, referenced)),
+                            key=lambda r: r.last_used)
+        for record in candidates[:excess]:
+            print(f"[tabs] over budget ({len(self.tabs)}/{self.max_tabs}); closing {record.purpose or 'tab'} opened by {record.owner}")
+            await self.close(record.page)
+        if len(self.tabs) + reserve > self.max_tabs:
+            print(f"[tabs] {len(self.tabs)} tabs open, all in use, leased or pinned; budget is {self.max_tabs}")
+        return min(excess, len(candidates))
+
+    async def collect(self) -> int:
+        """Close orphaned tabs: unreferenced by ctx and idle for ``orphan_after`` seconds."""
+        now = time.monotonic()
+        referenced = self._referenced()
+        for record in list(self.tabs.values()):
+            if id(record.page) in referenced:
+                record.last_used = now
+        orphans = [r for r in self.tabs.values()
+                   if self._reclaimable(r, referenced) and now - r.last_used >= self.orphan_after]
+        for record in orphans:
+            print(f"[tabs] reclaiming orphaned {record.purpose or 'tab'} opened by {record.owner}")
+            await self.close(record.page)
+        return len(orphans)
+
+    # Background collection
+
+    def start(self, interval: float = GC_INTERVAL) -> None:
+        if self._gc_task is not None and not self._gc_task.done():
+            return
+        try:
+            self._gc_task = asyncio.get_running_loop().create_task(self._gc_loop(interval))
+        except RuntimeError:
+            pass  # no running loop; collect() can still be called directly
+
+    async def _gc_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.collect()
+            except Exception as e:
+                print(f"[tabs] background collection failed: {e}")
+
+    async def stop(self) -> None:
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            try:
+                await self._gc_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._gc_task = None
+        try:
+            self.context.remove_listener("page", self._on_page)
+        except Exception:
+            pass
+
+    async def on_transition(self, step: str, event: Optional[str], next_step: Optional[str], timed_out: bool = False) -> None:
+        """step_compiler transition hook: attributes popups to the step about to run."""
+        self.current_step = next_step or "(finished)"
+
+
+def get_tab_manager(ctx: Dict[str, Any]) -> Optional[TabManager]:
+    """The manager for ``ctx["browser_context"]``, created and started on first use."""
+    context = ctx.get("browser_context")
+    if context is None:
+        return None
+    tabs = ctx.get("tab_manager")
+    if tabs is None or tabs.context is not context:
+        tabs = TabManager(context, ctx, max_tabs=int(ctx.get("max_tabs") or MAX_TABS))
+        ctx["tab_manager"] = tabs
+        tabs.start()
+    return tabs
+
+
+async def stop_tab_manager(ctx: Dict[str, Any]) -> None:
+    tabs = ctx.pop("tab_manager", None)
+    if tabs is not None:
+        await tabs.stop()
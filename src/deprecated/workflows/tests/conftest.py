@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# The workflows are imported as deprecated.workflows, the way the bots run them from src/
+SRC_DIR = Path(__file__).resolve().parents[3]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,53 @@
+"""Roundtrip profiling switched on through ctx["profile_roundtrips"]."""
+import asyncio
+from collections import Counter
+
+from deprecated.workflows.step_compiler import compile_workflow, run_workflow
+
+
+class Page:
+    """Stands in for playwright's Page; the profiler only proxies playwright classes."""
+    __module__ = "playwright.async_api._generated"
+
+    def __init__(self):
+        self.url = "https://example.com/jobs"
+
+    async def evaluate(self, script):
+        return 1
+
+    async def title(self):
+        return "Jobs"
+
+
+async def read_page(ctx):
+    page = ctx["page"]
+    await page.evaluate("1")
+    await page.evaluate("2")
+    await page.title()
+    ctx["url"] = page.url
+    yield "read"
+
+
+def test_profile_flag_counts_roundtrips_per_step(capsys):
+    page = Page()
+    ctx = {"page": page, "profile_roundtrips": True, "flight_recorder": None}
+    workflow = compile_workflow({"read_page": {"func": read_page, "transitions": {"read": "done"}}})
+
+    asyncio.run(run_workflow(workflow, ctx))
+
+    profiler = ctx["roundtrip_profiler"]
+    assert ctx["page"] == page and ctx["page"] is not page
+    assert ctx["url"] == page.url
+    assert profiler.by_step()["read_page"][0] == 3
+    methods = Counter()
+    for (_, _, method), (calls, _, _) in profiler.stats.items():
+        methods[method] += calls
+    assert methods == {"Page.evaluate": 2, "Page.title": 1}
+    assert "read_page" in capsys.readouterr().out
+
+
+def test_no_profiling_without_the_flag():
+    page = Page()
+    ctx = {"page": page, "flight_recorder": None}
+    asyncio.run(run_workflow(compile_workflow({"read_page": {"func": read_page, "transitions": {"read": "done"}}}), ctx))
+    assert ctx["page"] is page and "roundtrip_profiler" not in ctx
@@ -0,0 +1,94 @@
+"""Seek detail-page steps against the in-process fake browser.
+
+The fake cannot run JavaScript: the apply-button and stable-wait scripts are
+answered by fake_browser's Python emulations, so the button classification
+below is the emulation's. What these tests pin down is the steps' routing and
+roundtrip count; test_emulations_answer_the_real_scripts ties the emulations
+to the scripts the steps actually send.
+"""
+import asyncio
+import re
+
+import pytest
+
+pytest.importorskip("bs4")  # fake_browser parses the fixtures with BeautifulSoup
+
+from deprecated.seek_impl import detect_quick_apply, wait_for_details_panel
+from deprecated.workflows.fake_browser import FakePage, _classify_apply_buttons, _stable_wait
+from deprecated.workflows.seek.quick_apply_utils import APPLY_BUTTONS_SCRIPT, EMPTY_APPLY_BUTTONS
+from deprecated.workflows.waits import _STABLE_SCRIPT_TEMPLATE
+
+PANEL = '[data-automation="jobDetailsPage"]'
+
+
+def detail_page(*buttons):
+    html = (
+        '<html><body><div data-automation="jobDetailsPage"><h1>Python Developer</h1>'
+        + "<p>" + "Build and run data pipelines. " * 10 + "</p>"
+        + "".join(f'<a data-automation="job-detail-apply" href="/apply">{text}</a>' for text in buttons)
+        + "</div></body></html>"
+    )
+    page = FakePage(html, url="https://www.seek.com.au/job/1")
+    page.register_script("__guuStableWait", _stable_wait)
+    page.register_script("quickIndex", _classify_apply_buttons)
+    return page
+
+
+def run_job(ctx):
+    async def run():
+        panel = [str(event) async for event in wait_for_details_panel(ctx)]
+        apply = [str(event) async for event in detect_quick_apply(ctx)]
+        return panel, apply
+    return asyncio.run(run())
+
+
+def test_quick_apply_job_takes_three_roundtrips():
+    page = detail_page("Apply now", "Quick apply")
+    ctx = {"page": page, "selectors": {"job_details_panel": PANEL}}
+
+    for _ in range(3):
+        panel, apply = run_job(ctx)
+        assert panel == ["details_panel_ready"]
+        assert apply == ["qa: quick=True regular=False count=2", "quick_apply_found"]
+
+    assert dict(page.calls) == {"Page.wait_for_selector": 3, "Page.wait_for_function": 3, "Page.evaluate": 3}
+    assert ctx["apply_buttons"]["quickIndex"] == 1
+    assert ctx["quick_apply_flags"]["hasQuickApply"] is True
+
+
+def test_regular_apply_only():
+    page = detail_page("Apply now")
+    ctx = {"page": page, "selectors": {"job_details_panel": PANEL}}
+
+    panel, apply = run_job(ctx)
+
+    assert panel == ["details_panel_ready"]
+    assert apply == ["qa: quick=False regular=True count=1", "regular_apply_found"]
+    assert page.roundtrips == 3
+
+
+def test_no_apply_buttons():
+    page = detail_page()
+    ctx = {"page": page, "selectors": {"job_details_panel": PANEL}}
+
+    _, apply = run_job(ctx)
+
+    assert apply == ["qa: quick=False regular=False", "apply_missing"]
+    assert page.calls["Page.evaluate"] == 1
+
+
+def test_emulations_answer_the_real_scripts():
+    # register_script matches by substring, so each key must occur in the script it stands in for
+    assert "quickIndex" in APPLY_BUTTONS_SCRIPT
+    assert "__guuStableWait" in _STABLE_SCRIPT_TEMPLATE
+
+    # Same result shape and the same classification rule as the page script
+    page = detail_page("Apply now", "Quick\u00a0 Apply")
+    result = _classify_apply_buttons(page, '[data-automation="job-detail-apply"]')
+    assert set(result) == set(EMPTY_APPLY_BUTTONS) == set(re.findall(r"^\s*(\w+)(?=[:,])", APPLY_BUTTONS_SCRIPT.split("return {")[-1], re.M))
+    assert "text.includes('quick apply')" in APPLY_BUTTONS_SCRIPT
+    assert result["buttons"][1]["text"] == "quick apply" and result["quickIndex"] == 1
+
+    # Every wait option the emulation honours is one the script reads
+    for option in ("selector", "minTextLength", "contains", "present"):
+        assert f"args.{option}" in _STABLE_SCRIPT_TEMPLATE
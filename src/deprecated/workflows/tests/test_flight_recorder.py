@@ -0,0 +1,54 @@
+"""Which transitions the flight recorder dumps, and how many bundles it keeps."""
+import asyncio
+import os
+
+from deprecated.workflows.flight_recorder import FlightRecorder
+from deprecated.workflows.step_compiler import compile_workflow, run_workflow
+
+
+def workflow(prompt_events, load_events):
+    async def prompt(ctx):
+        for event in prompt_events:
+            yield event
+        await asyncio.sleep(1)
+
+    async def load(ctx):
+        for event in load_events:
+            yield event
+
+    return compile_workflow({
+        "prompt_user": {"func": prompt, "timeout": 0.01, "on_timeout_event": "prompt displayed to user",
+                        "transitions": {"logged in": "load", "prompt displayed to user": "load"}},
+        "load": {"func": load, "timeout": 1, "on_timeout_event": "load failed",
+                 "transitions": {"loaded": "done", "missing optional panel": "done", "load failed": "done",
+                                 "retry": "load"},
+                 "retry": {"events": ["retry"], "max_attempts": 1, "backoff": 0, "on_exhausted": "done"}},
+    }, {"title": "test"})
+
+
+def run(tmp_path, prompt_events, load_events):
+    recorder = FlightRecorder("test", directory=str(tmp_path))
+    asyncio.run(run_workflow(workflow(prompt_events, load_events), {"flight_recorder": recorder}))
+    return [bundle.name.split("-", 2)[2] for bundle in recorder.bundles]
+
+
+def test_normal_timeouts_and_branches_are_not_failures(tmp_path):
+    # A prompt left on screen and an event that merely mentions "missing" are ordinary paths
+    assert run(tmp_path, [], ["missing optional panel"]) == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_retry_events_and_failed_timeouts_are_dumped(tmp_path):
+    assert run(tmp_path, ["logged in"], ["retry"]) == ["test-load"]
+    assert run(tmp_path / "timeout", ["logged in"], []) == ["test-load"]
+
+
+def test_old_bundles_are_pruned_on_disk(tmp_path):
+    for i in range(5):
+        (tmp_path / f"old-{i}").mkdir()
+        (tmp_path / f"old-{i}" / "meta.json").write_text("{}")
+        os.utime(tmp_path / f"old-{i}", (1000 + i, 1000 + i))
+    (tmp_path / "notes").mkdir()
+
+    assert FlightRecorder("test", directory=str(tmp_path)).prune(keep=2) == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["notes", "old-3", "old-4"]
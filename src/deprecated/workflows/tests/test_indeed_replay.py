@@ -0,0 +1,103 @@
+"""Offline replay of the Indeed pipeline over synthetic search pages."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("bs4")  # fake_browser parses the pages with BeautifulSoup
+
+from deprecated.workflows.events import IndeedEvent
+from deprecated.workflows.fake_browser import FakePage
+from deprecated.workflows.indeed.indeed_impl import FETCH_AHEAD, RESULTS_PER_PAGE, bounded, run_pipeline
+from deprecated.workflows.indeed.replay import REPLAY_SEARCH, replay, search_routes, synthetic_search_pages
+
+# synthetic_search_pages: cards 0 and 5 lack Indeed Apply, 0, 4 and 8 are "(Senior)"
+FILTERED_PER_PAGE = 4
+
+
+def test_replay_counts(tmp_path):
+    stats = asyncio.run(replay(synthetic_search_pages(3), workers=2, apply_seconds=0.01, base_dir=str(tmp_path), quiet=True))
+
+    assert stats["last_step"] == "finish"
+    assert stats["pages"] == 3
+    assert stats["parsed"] == 3 * RESULTS_PER_PAGE
+    assert stats["filtered"] == 3 * FILTERED_PER_PAGE
+    assert stats["applied"] == 3 * (RESULTS_PER_PAGE - FILTERED_PER_PAGE)
+    assert len((tmp_path / "indeed_applications.jsonl").read_text().splitlines()) == stats["applied"]
+
+
+def test_replay_backpressure(tmp_path):
+    fetched_at_completion = []
+    apply_pages = set()
+
+    async def slow_apply(ctx, page, job):
+        apply_pages.add(id(page))
+        assert page is not ctx["page"]
+        await asyncio.sleep(0.02)
+        fetched_at_completion.append(ctx["page"].calls["Page.goto"])
+        return {"status": "applied"}
+
+    stats = asyncio.run(replay(synthetic_search_pages(10), workers=2, base_dir=str(tmp_path), apply_job=slow_apply, quiet=True))
+
+    assert stats["pages"] == 10
+    assert stats["applied"] == 10 * (RESULTS_PER_PAGE - FILTERED_PER_PAGE)
+    assert len(apply_pages) == 2
+    # While the workers are busy the fetcher stalls: the page being parsed, FETCH_AHEAD
+    # queued ones and one waiting to be queued, instead of the whole search at once
+    assert fetched_at_completion[0] <= FETCH_AHEAD + 2
+    assert fetched_at_completion == sorted(fetched_at_completion)
+
+
+def test_bounded_stays_ahead_by_maxsize():
+    produced = []
+
+    async def source():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    async def consume_one():
+        stream = bounded(source(), 2)
+        try:
+            first = await stream.__anext__()
+            await asyncio.sleep(0.01)
+            return first
+        finally:
+            await stream.aclose()
+
+    assert asyncio.run(consume_one()) == 0
+    # One taken, two queued, one blocked on the full queue
+    assert len(produced) == 4
+
+
+def test_without_browser_context_applies_on_the_search_tab_one_at_a_time(tmp_path):
+    page = FakePage(routes=search_routes(synthetic_search_pages(3)))
+    in_flight = []
+
+    async def apply_job(ctx, apply_page, job):
+        assert apply_page is page
+        visited = page.calls["Page.goto"]
+        in_flight.append(job)
+        assert len(in_flight) == 1
+        await asyncio.sleep(0.005)
+        # No search page was loaded into the tab while the application was open
+        assert page.calls["Page.goto"] == visited
+        in_flight.pop()
+        return {"status": "applied"}
+
+    ctx = {
+        "base_dir": str(tmp_path),
+        "page": page,
+        "indeed_search": dict(REPLAY_SEARCH),
+        "indeed_apply_job": apply_job,
+        "indeed_apply_workers": 3,
+        "indeed_stats": {"pages": 0, "parsed": 0, "filtered": 0},
+        "rate_limits": {"navigate": {"rate": 1000, "burst": 1000}},
+    }
+
+    async def run():
+        return [str(event) async for event in run_pipeline(ctx)]
+
+    events = asyncio.run(run())
+    assert events[-1] == IndeedEvent.PIPELINE_FINISHED
+    assert ctx["indeed_stats"]["pages"] == 3
+    assert ctx["indeed_stats"]["applied"] == 3 * (RESULTS_PER_PAGE - 2)
@@ -0,0 +1,65 @@
+"""Tab leases and the needs-input tab cap, on the fake browser context."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("bs4")  # fake_browser parses pages with BeautifulSoup
+
+from deprecated.workflows.fake_browser import FakeContext
+from deprecated.workflows.indeed.indeed_impl import MAX_NEEDS_INPUT_TABS, _leave_for_user, close_apply_pages, open_apply_pages
+from deprecated.workflows.tab_manager import TabManager, get_tab_manager, stop_tab_manager
+
+
+def test_leased_tab_is_not_reclaimed():
+    async def run():
+        tabs = TabManager(FakeContext(), {}, max_tabs=1, orphan_after=0)
+        page = await tabs.new_page("apply_to_jobs", "apply worker")
+        with tabs.in_use(page):
+            assert await tabs.collect() == 0
+            assert await tabs.enforce_budget(reserve=1) == 0
+            assert not page.is_closed()
+        assert await tabs.collect() == 1
+        assert page.is_closed()
+
+    asyncio.run(run())
+
+
+def test_apply_worker_tabs_survive_collection_until_closed():
+    async def run():
+        ctx = {"browser_context": FakeContext()}
+        pages = await open_apply_pages(ctx, 2)
+        tabs = get_tab_manager(ctx)
+        tabs.orphan_after = 0
+        try:
+            assert await tabs.collect() == 0
+            assert not any(page.is_closed() for page in pages)
+            await close_apply_pages(ctx, pages)
+            assert all(page.is_closed() for page in pages)
+            assert tabs.tabs == {}
+        finally:
+            await stop_tab_manager(ctx)
+
+    asyncio.run(run())
+
+
+def test_needs_input_tabs_are_capped_oldest_first():
+    async def run():
+        ctx = {"browser_context": FakeContext()}
+        tabs = get_tab_manager(ctx)
+        try:
+            pages = [await tabs.new_page("apply_to_jobs", "indeed apply") for _ in range(MAX_NEEDS_INPUT_TABS + 2)]
+            for page in pages:
+                await _leave_for_user(ctx, tabs, page)
+            assert [page.is_closed() for page in pages] == [True, True] + [False] * MAX_NEEDS_INPUT_TABS
+            assert ctx["indeed_needs_input_tabs"] == pages[2:]
+
+            # A tab the user closed frees its slot
+            await pages[2].close()
+            extra = await tabs.new_page("apply_to_jobs", "indeed apply")
+            await _leave_for_user(ctx, tabs, extra)
+            assert not pages[3].is_closed()
+            assert ctx["indeed_needs_input_tabs"] == pages[3:] + [extra]
+        finally:
+            await stop_tab_manager(ctx)
+
+    asyncio.run(run())
@@ -0,0 +1,376 @@
+"""Static checker for step yields against STEPS_CONFIG transitions.
+
+A step that yields an event its config does not route leaves the workflow
+waiting until ``on_timeout_event`` fires, which costs the whole step timeout.
+This checker reads each ``steps_config.py`` and the step implementations it
+imports with ``ast`` (nothing is imported or executed) and reports:
+
+- unroutable events: a step yields a literal its transitions do not handle and
+  then stops (status yields in the middle of a step are skipped over)
+- steps that yield no routable event at all
+- paths through a step that return or fall off its end without yielding a
+  routed event, so the runner waits for ``on_timeout_event`` instead
+- dead transitions: a transition key the step never yields (other than its
+  ``on_timeout_event``)
+- transitions, timeouts or retry policies that target a step that does not exist
+- steps not reachable from ``WORKFLOW_META["start_step"]``
+- transition events missing from the platform's enum in ``events.py``
+
+Event enums from ``events.py`` used in yields are resolved to their values.
+f-string yields are matched by their literal prefix.
+
+    python validate_steps.py [linkedin seek indeed] [--strict]
+"""
+from __future__ import annotations
+import argparse
+import ast
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+WORKFLOWS_DIR = Path(__file__).resolve().parent
+PLATFORMS = ("linkedin", "seek", "indeed")
+
+# Transition targets that end the run instead of naming a step
+TERMINAL_STEPS = ("done", None)
+# Enum in events.py that registers each platform's routable events
+REGISTRIES = {"linkedin": "LinkedInEvent", "seek": "SeekEvent", "indeed": "IndeedEvent"}
+
+ERROR = "error"
+WARNING = "warning"
+
+
+def _load_event_enums() -> Dict[str, Dict[str, str]]:
+    """Map enum class name -> member name -> value, read statically from events.py."""
+    enums: Dict[str, Dict[str, str]] = {}
+    path = WORKFLOWS_DIR / "events.py"
+    if not path.exists():
+        return enums
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        members = {}
+        for stmt in node.body:
+            if (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name)
+                    and isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str)):
+                members[stmt.targets[0].id] = stmt.value.value
+        if members:
+            enums[node.name] = members
+    return enums
+
+
+def _yield_value(node: ast.AST, enums: Dict[str, Dict[str, str]]) -> Optional[Tuple[str, bool]]:
+    """Return (value, is_prefix) for a yielded expression, or None if it cannot be resolved."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value, False
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        value = enums.get(node.value.id, {}).get(node.attr)
+        if value is not None:
+            return value, False
+    if isinstance(node, ast.JoinedStr):
+        prefix = ""
+        for part in node.values:
+            if isinstance(part, ast.Constant) and isinstance(part.value, str):
+                prefix += part.value
+            else:
+                break
+        return prefix, True
+    return None
+
+
+def _module_dicts(tree: ast.Module) -> Dict[str, List[Any]]:
+    """Module-level dict literals, so ``yield EVENTS.get(key, default)`` resolves to their values."""
+    dicts = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                and isinstance(node.value, ast.Dict)):
+            dicts[node.targets[0].id] = node.value.values
+    return dicts
+
+
+def _yield_values(node: ast.AST, enums: Dict[str, Dict[str, str]], dicts: Dict[str, List[ast.AST]]) -> List[Tuple[str, bool]]:
+    if isinstance(node, ast.IfExp):
+        return _yield_values(node.body, enums, dicts) + _yield_values(node.orelse, enums, dicts)
+    resolved = _yield_value(node, enums)
+    if resolved is not None:
+        return [resolved]
+    # EVENTS.get(key, "default") / EVENTS[key]
+    target, extra = None, []
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "get"
+            and isinstance(node.func.value, ast.Name)):
+        target, extra = node.func.value.id, node.args[1:]
+    elif isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name):
+        target = node.value.id
+    if target not in dicts:
+        return []
+    values = [_yield_value(v, enums) for v in list(dicts[target]) + list(extra)]
+    return [v for v in values if v is not None]
+
+
+def _terminal_yields(stmts: List[ast.stmt], at_end: bool, lines: Set[int]) -> None:
+    """Collect the lines of yields after which the step finishes (falls off the end or returns)."""
+    for index, stmt in enumerate(stmts):
+        nxt = stmts[index + 1] if index + 1 < len(stmts) else None
+        ends_here = isinstance(nxt, ast.Return) or (nxt is None and at_end)
+        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Yield):
+            if ends_here:
+                lines.add(stmt.lineno)
+        elif isinstance(stmt, (ast.For, ast.AsyncFor, ast.While)):
+            # The end of a loop body goes round again
+            _terminal_yields(stmt.body, False, lines)
+            _terminal_yields(stmt.orelse, ends_here, lines)
+        elif isinstance(stmt, ast.Try):
+            _terminal_yields(stmt.body, ends_here and not stmt.orelse, lines)
+            for handler in stmt.handlers:
+                _terminal_yields(handler.body, ends_here, lines)
+            _terminal_yields(stmt.orelse, ends_here, lines)
+            _terminal_yields(stmt.finalbody, ends_here, lines)
+        elif isinstance(stmt, (ast.If, ast.With, ast.AsyncWith)):
+            _terminal_yields(stmt.body, ends_here, lines)
+            _terminal_yields(getattr(stmt, "orelse", []), ends_here, lines)
+
+
+def _routes(node: ast.Yield, transitions: Dict[str, Any], enums: Dict[str, Dict[str, str]],
+            dicts: Dict[str, List[ast.AST]]) -> bool:
+    """Whether a yield may hand the runner a routed event (unresolvable ones are given the benefit of the doubt)."""
+    if node.value is None:
+        return False
+    if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) and node.value.func.id == "Progress":
+        return False
+    values = _yield_values(node.value, enums, dicts)
+    if not values:
+        return True
+    return any(any(k.startswith(v) if is_prefix else k == v for k in transitions) for v, is_prefix in values)
+
+
+def _flow(stmts: List[ast.stmt], states: Set[bool], routes, exits: List[int]) -> Tuple[Set[bool], Set[bool], Set[bool]]:
+    """Follow ``stmts`` from ``states`` (has a routed event been yielded on this path?).
+
+    Returns the states at the end of the block and those leaving it through
+    break and continue; ``exits`` collects the lines where a path returns
+    without having yielded a routed event.
+    """
+    breaks: Set[bool] = set()
+    continues: Set[bool] = set()
+    for stmt in stmts:
+        if not states:
+            break
+        if isinstance(stmt, ast.Return):
+            if False in states:
+                exits.append(stmt.lineno)
+            states = set()
+        elif isinstance(stmt, ast.Raise):
+            states = set()
+        elif isinstance(stmt, ast.Break):
+            breaks |= states
+            states = set()
+        elif isinstance(stmt, ast.Continue):
+            continues |= states
+            states = set()
+        elif isinstance(stmt, ast.If):
+            body, b1, c1 = _flow(stmt.body, states, routes, exits)
+            orelse, b2, c2 = _flow(stmt.orelse, states, routes, exits)
+            states, breaks, continues = body | orelse, breaks | b1 | b2, continues | c1 | c2
+        elif isinstance(stmt, (ast.For, ast.AsyncFor, ast.While)):
+            body, b, c = _flow(stmt.body, states, routes, exits)
+            forever = isinstance(stmt, ast.While) and isinstance(stmt.test, ast.Constant) and stmt.test.value
+            finished = set() if forever else states | body | c
+            states = _flow(stmt.orelse, finished, routes, exits)[0] | b
+        elif isinstance(stmt, ast.Try):
+            body, b, c = _flow(stmt.body, states, routes, exits)
+            # An exception can leave the body at any point, before or after its yields
+            raised = states | body
+            states = _flow(stmt.orelse, body, routes, exits)[0]
+            breaks, continues = breaks | b, continues | c
+            for handler in stmt.handlers:
+                handled, b, c = _flow(handler.body, raised, routes, exits)
+                states, breaks, continues = states | handled, breaks | b, continues | c
+            if stmt.finalbody:
+                states = _flow(stmt.finalbody, states, routes, exits)[0]
+        elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+            states, b, c = _flow(stmt.body, states, routes, exits)
+            breaks, continues = breaks | b, continues | c
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        elif any(isinstance(inner, ast.Yield) and routes(inner) for inner in ast.walk(stmt)):
+            states = {True}
+    return states, breaks, continues
+
+
+def silent_exits(func: ast.AsyncFunctionDef, routes) -> List[int]:
+    """Lines where ``func`` can finish without yielding a routed event (its end line for falling off the end)."""
+    exits: List[int] = []
+    if False in _flow(func.body, {False}, routes, exits)[0]:
+        exits.append(func.end_lineno or func.lineno)
+    return exits
+
+
+def collect_yields(impl_path: Path, enums: Dict[str, Dict[str, str]]) -> Dict[str, List[Tuple[str, bool, int, bool]]]:
+    """Map each async generator function in ``impl_path`` to its (event, is_prefix, line, terminal) yields.
+
+    A yield is terminal when the step returns or falls off its end right after
+    it; the others are status updates the dispatcher passes over.
+    """
+    tree = ast.parse(impl_path.read_text(encoding="utf-8"))
+    dicts = _module_dicts(tree)
+    yields: Dict[str, List[Tuple[str, bool, int, bool]]] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.AsyncFunctionDef):
+            continue
+        terminal_lines: Set[int] = set()
+        _terminal_yields(node.body, True, terminal_lines)
+        found = []
+        for inner in ast.walk(node):
+            if isinstance(inner, ast.Yield) and inner.value is not None:
+                for value, is_prefix in _yield_values(inner.value, enums, dicts):
+                    found.append((value, is_prefix, inner.lineno, inner.lineno in terminal_lines))
+        if found:
+            yields[node.name] = found
+    return yields
+
+
+def _literal(node: ast.AST) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None
+
+
+def load_config(config_path: Path) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], Optional[Path]]:
+    """Read STEPS_CONFIG / WORKFLOW_META and the implementation module from a steps_config.py."""
+    tree = ast.parse(config_path.read_text(encoding="utf-8"))
+    steps: Dict[str, Dict[str, Any]] = {}
+    meta: Dict[str, Any] = {}
+    impl_path = None
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level and node.module:
+            base = config_path.parent
+            for _ in range(node.level - 1):
+                base = base.parent
+            candidate = base.joinpath(*node.module.split(".")).with_suffix(".py")
+            if candidate.exists():
+                impl_path = candidate
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)):
+            continue
+        name = node.targets[0].id
+        if name == "WORKFLOW_META":
+            meta = _literal(node.value) or {}
+        elif name == "STEPS_CONFIG" and isinstance(node.value, ast.Dict):
+            for key, value in zip(node.value.keys, node.value.values):
+                step = {}
+                for field, field_value in zip(value.keys, value.values):
+                    field_name = _literal(field)
+                    if field_name == "func":
+                        step["func"] = field_value.id if isinstance(field_value, ast.Name) else None
+                    else:
+                        step[field_name] = _literal(field_value)
+                step["line"] = key.lineno
+                steps[_literal(key)] = step
+    return steps, meta, impl_path
+
+
+def validate_platform(platform: str) -> List[Tuple[str, str, str]]:
+    """Return (severity, location, message) findings for one platform's workflow."""
+    config_path = WORKFLOWS_DIR / platform / "steps_config.py"
+    if not config_path.exists():
+        return [(ERROR, platform, "steps_config.py not found")]
+    steps, meta, impl_path = load_config(config_path)
+    if not steps:
+        return [(WARNING, str(config_path), "no STEPS_CONFIG defined")]
+    if impl_path is None:
+        return [(ERROR, str(config_path), "step implementation module not found")]
+
+    findings: List[Tuple[str, str, str]] = []
+    enums = _load_event_enums()
+    registry_name = f"events.{REGISTRIES.get(platform)}"
+    registry = set(enums[REGISTRIES[platform]].values()) if REGISTRIES.get(platform) in enums else None
+    yields = collect_yields(impl_path, enums)
+    tree = ast.parse(impl_path.read_text(encoding="utf-8"))
+    dicts = _module_dicts(tree)
+    funcs = {node.name: node for node in tree.body if isinstance(node, ast.AsyncFunctionDef)}
+    config_loc = lambda step: f"{config_path.name}:{steps[step]['line']} {step}"
+
+    for name, step in steps.items():
+        transitions = step.get("transitions") or {}
+        func = step.get("func")
+        timeout_event = step.get("on_timeout_event")
+        for event, target in transitions.items():
+            if target not in steps and target not in TERMINAL_STEPS:
+                findings.append((ERROR, config_loc(name), f"transition '{event}' targets unknown step '{target}'"))
+        if timeout_event is not None and timeout_event not in transitions:
+            findings.append((ERROR, config_loc(name), f"on_timeout_event '{timeout_event}' is not a transition"))
+        retry = step.get("retry")
+        if retry:
+            if retry.get("on_exhausted") not in steps and retry.get("on_exhausted") not in TERMINAL_STEPS:
+                findings.append((ERROR, config_loc(name), f"retry on_exhausted targets unknown step '{retry.get('on_exhausted')}'"))
+            for event in retry.get("events") or []:
+                if event not in transitions:
+                    findings.append((ERROR, config_loc(name), f"retry event '{event}' is not a transition"))
+            if retry.get("events") is None and name not in transitions.values():
+                findings.append((WARNING, config_loc(name), "retry policy but no transition loops back to the step"))
+
+        produced = yields.get(func)
+        if produced is None:
+            findings.append((WARNING, config_loc(name), f"'{func}' yields no literal events"))
+            continue
+        routed_any = False
+        matched_keys: Set[str] = set()
+        for event, is_prefix, line, terminal in produced:
+            keys = [k for k in transitions if (k.startswith(event) if is_prefix else k == event)]
+            if keys:
+                routed_any = True
+                matched_keys.update(keys)
+            elif terminal and not is_prefix:
+                findings.append((ERROR, f"{impl_path.name}:{line} {func}", f"yields '{event}' and stops, but step '{name}' does not route it"))
+        if not routed_any:
+            findings.append((ERROR, config_loc(name), f"'{func}' never yields a routable event"))
+        elif func in funcs:
+            routes = lambda node, transitions=transitions: _routes(node, transitions, enums, dicts)
+            for line in silent_exits(funcs[func], routes):
+                findings.append((ERROR, f"{impl_path.name}:{line} {func}",
+                                 f"can finish without yielding an event step '{name}' routes"))
+        for event in transitions:
+            if event not in matched_keys and event != timeout_event:
+                findings.append((WARNING, config_loc(name), f"dead transition '{event}': never yielded by '{func}'"))
+            if registry is not None and event not in registry:
+                findings.append((WARNING, config_loc(name), f"event '{event}' is not in {registry_name}"))
+
+    start = meta.get("start_step")
+    if start not in steps:
+        findings.append((ERROR, str(config_path), f"start_step '{start}' is not a step"))
+    else:
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            step = steps[queue.popleft()]
+            targets = list((step.get("transitions") or {}).values()) + [(step.get("retry") or {}).get("on_exhausted")]
+            for target in targets:
+                if target in steps and target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        for name in steps:
+            if name not in seen:
+                findings.append((WARNING, config_loc(name), "unreachable from start_step"))
+    return findings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("platforms", nargs="*", default=list(PLATFORMS))
+    parser.add_argument("--strict", action="store_true", help="exit non-zero on warnings too")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for platform in args.platforms:
+        findings = validate_platform(platform)
+        errors = sum(1 for severity, _, _ in findings if severity == ERROR)
+        print(f"== {platform}: {errors} error(s), {len(findings) - errors} warning(s)")
+        for severity, location, message in findings:
+            print(f"  {severity:<7} {location}: {message}")
+        failed |= bool(errors) or (args.strict and bool(findings))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""In-page waits that resolve when content is ready, without Python-side polling.
+
+``wait_until_stable`` runs one ``page.wait_for_function`` call. The browser
+re-checks the condition itself, and Python awaits a single roundtrip. The
+condition holds once the target subtree has gone ``quiet_ms`` without a DOM
+mutation, seen by a MutationObserver installed on the first check, and an
+optional content predicate is true:
+
+- ``min_text_length``: the subtree's innerText is at least this long
+- ``contains``: its innerText contains this text (case-insensitive)
+- ``present``: it contains an element matching this selector
+- ``predicate``: a JS expression over ``root``, ``arg`` (the ``arg`` passed in)
+  and ``elapsed`` (ms since the first check)
+
+Pass ``quiet_ms=0`` to wait for the predicate alone. This replaces fixed
+sleeps after clicks, which wait too long on fast pages and not long enough
+on slow ones, and ``networkidle``, which ad-heavy pages may never reach.
+
+    await wait_until_stable(page, "[data-automation='jobDetailsPage']", quiet_ms=250, min_text_length=50)
+
+``first_attached`` waits on a list of candidate selectors at once and returns
+the first one that attaches, so an obsolete candidate early in the list no
+longer costs its whole timeout before the next one is tried.
+
+    found = await first_attached(page, selectors["job_cards"])  # (index, selector) or None
+"""
+from __future__ import annotations
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_QUIET_MS = 300
+DEFAULT_TIMEOUT_MS = 10000
+# In-page check interval; requestAnimationFrame polling stalls in background tabs
+POLL_INTERVAL_MS = 50
+
+_STABLE_SCRIPT_TEMPLATE = """
+(args) => {
+    const root = args.selector ? document.querySelector(args.selector) : document.body;
+    if (!root) return false;
+    const key = '__guuStableWait:' + args.token;
+    let state = window[key];
+    if (!state || state.root !== root) {
+        if (state) state.observer.disconnect();
+        state = window[key] = { root, started: state ? state.started : performance.now(), last: performance.now(), observer: null };
+        state.observer = new MutationObserver(() => { state.last = performance.now(); });
+        state.observer.observe(root, { subtree: true, childList: true, attributes: true, characterData: true });
+    }
+    const now = performance.now();
+    const elapsed = now - state.started;
+    const arg = args.arg;
+    const text = () => (root.innerText || '').trim();
+    if (args.minTextLength && text().length < args.minTextLength) return false;
+    if (args.contains && !text().toLowerCase().includes(args.contains)) return false;
+    if (args.present && !root.querySelector(args.present)) return false;
+    if (!(%s)) return false;
+    if (now - state.last < args.quietMs) return false;
+    state.observer.disconnect();
+    delete window[key];
+    return true;
+}
+"""
+# A timed-out wait leaves its observer behind
+_CLEANUP_SCRIPT = "(key) => { const s = window[key]; if (s) { s.observer.disconnect(); delete window[key]; } }"
+_SCRIPTS: Dict[str, str] = {}
+_tokens = 0
+
+
+def _script(predicate: Optional[str]) -> str:
+    expression = predicate or "true"
+    script = _SCRIPTS.get(expression)
+    if script is None:
+        script = _SCRIPTS[expression] = _STABLE_SCRIPT_TEMPLATE % expression
+    return script
+
+
+async def wait_until_stable(page, selector: Optional[str] = None, quiet_ms: int = DEFAULT_QUIET_MS,
+                            timeout_ms: int = DEFAULT_TIMEOUT_MS, min_text_length: int = 0,
+                            contains: Optional[str] = None, present: Optional[str] = None,
+                            predicate: Optional[str] = None, arg: Any = None) -> bool:
+    """Wait until ``selector`` (default: body) is mutation-free for ``quiet_ms`` and the content conditions hold.
+
+    Returns False instead of raising when ``timeout_ms`` passes first, so callers
+    can fall back the way they did after a fixed sleep.
+    """
+    global _tokens
+    _tokens += 1
+    args = {
+        "selector": selector,
+        "quietMs": quiet_ms,
+        "minTextLength": min_text_length,
+        "contains": contains.lower() if contains else None,
+        "present": present,
+        "arg": arg,
+        # Keeps the observer state of concurrent waits on one page apart
+        "token": _tokens,
+    }
+    try:
+        await page.wait_for_function(_script(predicate), arg=args, polling=POLL_INTERVAL_MS, timeout=timeout_ms)
+        return True
+    except Exception as e:
+        if "Timeout" not in type(e).__name__ and "Timeout" not in str(e):
+            print(f"[waits] wait on {selector or 'body'} failed: {e}")
+        try:
+            await page.evaluate(_CLEANUP_SCRIPT, "__guuStableWait:" + str(args["token"]))
+        except Exception:
+            pass
+        return False
+
+
+async def first_attached(page, selectors: List[str], timeout_ms: int = DEFAULT_TIMEOUT_MS,
+                         state: str = "attached") -> Optional[Tuple[int, str]]:
+    """Wait on all ``selectors`` concurrently; ``(index, selector)`` of the first to reach ``state``, or None.
+
+    A candidate that fails outright (e.g. an invalid selector) drops out of the
+    race without ending it. When several are already there, the earliest in the
+    list wins, so the order of the candidates still expresses preference.
+    """
+    waits = {
+        asyncio.ensure_future(page.locator(selector).first.wait_for(state=state, timeout=timeout_ms)): index
+        for index, selector in enumerate(selectors)
+    }
+    pending = set(waits)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_ms / 1000
+    winner = None
+    try:
+        while pending and winner is None:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            attached = [waits[task] for task in done if not task.cancelled() and task.exception() is None]
+            if attached:
+                winner = min(attached)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return (winner, selectors[winner]) if winner is not None else None